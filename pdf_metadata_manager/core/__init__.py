@@ -6,7 +6,7 @@ from .crossref_client import (
     CrossrefConnectionError,
     CrossrefAPIError
 )
-from .filename_parser import FilenameHints, parse_filename
+from .filename_parser import FilenameHints, parse_filename, parse_filenames
 from .metadata_updater import (
     MetadataUpdater,
     MetadataUpdate,
@@ -29,6 +29,7 @@ __all__ = [
     'CrossrefAPIError',
     'FilenameHints',
     'parse_filename',
+    'parse_filenames',
     'MetadataUpdater',
     'MetadataUpdate',
     'PDFUpdateError',
@@ -6,14 +6,40 @@ the Crossref API, with exponential backoff retry logic, rate limiting, and
 sophisticated matching algorithms.
 """
 
+import hashlib
+import json
+import random
 import re
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import List, Optional, Dict, Any
-from urllib.parse import quote_plus
+from pathlib import Path
+from typing import Iterable, List, Optional, Dict, Any, Union
+from urllib.parse import quote, quote_plus
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when installed, else the json module."""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
 
 # Custom exceptions
@@ -24,10 +50,29 @@ class CrossrefConnectionError(Exception):
 
 class CrossrefAPIError(Exception):
     """Raised for non-retryable API errors (e.g., 404, malformed requests)."""
-    pass
 
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _JitteredRetry(Retry):
+    """
+    Retry policy with "full jitter" backoff.
+
+    Each backoff is a random time between 0 and the exponential delay, so
+    parallel workers that failed together don't all retry together.
+    """
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
 
-@dataclass
+
+# Instance dicts are dropped where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CrossrefMatch:
     """A potential match from Crossref."""
     doi: str
@@ -36,21 +81,45 @@ class CrossrefMatch:
     year: Optional[str]
     journal: Optional[str]
     score: float  # 0.0 to 1.0
+    # HIGH/MEDIUM/LOW based on score, set once at construction
+    confidence_level: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'confidence_level', _confidence_level(self.score))
+        # Many matches share a journal, so share the string too
+        if self.journal:
+            object.__setattr__(self, 'journal', sys.intern(self.journal))
 
-    @property
-    def confidence_level(self) -> str:
-        """Return HIGH/MEDIUM/LOW based on score."""
-        if self.score >= 0.80:
-            return "HIGH"
-        elif self.score >= 0.65:
-            return "MEDIUM"
-        else:
-            return "LOW"
+
+def _confidence_level(score: float) -> str:
+    """Return HIGH/MEDIUM/LOW for a match score."""
+    if score >= 0.80:
+        return "HIGH"
+    elif score >= 0.65:
+        return "MEDIUM"
+    else:
+        return "LOW"
 
 
 class CrossrefClient:
     """Client for Crossref API with retry logic and rate limiting."""
 
+    # Maximum number of DOIs looked up per request in fetch_metadata_bulk
+    BULK_DOI_CHUNK = 50
+
+    # Work fields the client reads; list queries ask for only these, as full
+    # records (references, licenses, ...) are many times larger. Crossref
+    # ignores select on single-DOI lookups.
+    SELECT_FIELDS = (
+        'DOI', 'title', 'author', 'container-title', 'publisher', 'type', 'ISBN',
+        'published-print', 'published-online', 'issued', 'created'
+    )
+
+    # Default number of searches search_many keeps in flight at once
+    MAX_CONCURRENT_SEARCHES = 8
+
+    _RATE_LIMIT_INTERVAL_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*$')
+
     # Common words to ignore in title matching
     STOPWORDS = {
         'the', 'a', 'an', 'of', 'in', 'on', 'at', 'to', 'for', 'with',
@@ -58,45 +127,133 @@ class CrossrefClient:
         'this', 'that', 'these', 'those', 'have', 'has', 'had', 'there'
     }
 
+    _PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+    # Date fields to take the publication year from, in order of preference
+    _YEAR_FIELDS = ('published-print', 'published-online', 'issued', 'created')
+
     def __init__(
         self,
         email: str,
         retries: int = 3,
         timeout: int = 30,
-        backoff_factor: float = 1.0
+        backoff_factor: float = 1.0,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 30 * 24 * 3600,
+        negative_cache_ttl: float = 24 * 3600,
+        session: Optional[requests.Session] = None,
+        rate_limit_share: int = 1
     ):
         """
         Initialize Crossref client.
 
         Args:
             email: Your email (for polite pool and contact)
-            retries: Number of retry attempts for failed requests
+            retries: Number of attempts for failed requests
             timeout: Request timeout in seconds
-            backoff_factor: Base delay for exponential backoff (seconds)
+            backoff_factor: Base delay for exponential backoff (seconds);
+                the first retry is immediate, later ones wait a random time
+                up to backoff_factor * 2, * 4, ... unless Retry-After says
+                otherwise
+            use_cache: Cache API responses on disk, keyed by DOI or query
+            cache_dir: Cache directory
+                (default: ~/.cache/pdf_metadata_manager/crossref)
+            cache_ttl: Age in seconds after which cached responses are
+                fetched again (default: 30 days)
+            negative_cache_ttl: Age in seconds after which DOIs Crossref
+                didn't know are looked up again (default: 1 day)
+            session: HTTP session to send requests with (default: a new
+                session); the client mounts its retrying adapter on it
+            rate_limit_share: Number of clients (e.g. worker processes)
+                splitting Crossref's rate limit; each one waits that many
+                times longer between requests
         """
         self.email = email
         self.retries = retries
         self.timeout = timeout
         self.backoff_factor = backoff_factor
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # Rate limiting: 0.5s between requests
+        self.use_cache = use_cache
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self._cache_dir = (
+            Path(cache_dir) if cache_dir
+            else Path.home() / ".cache" / "pdf_metadata_manager" / "crossref"
+        )
+        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        self.last_request_time = float('-inf')  # time.monotonic() of the last request
+        self.rate_limit_share = max(rate_limit_share, 1)
+        # Rate limiting: 0.5s between requests (for this client's share)
+        self.min_request_interval = 0.5 * self.rate_limit_share
+        self._rate_lock = threading.Lock()
 
         # User-Agent for polite pool
         self.headers = {
             'User-Agent': f'PdfMetadataManager/1.0 (mailto:{email})'
         }
 
+        # Reuse connections (and TLS sessions) across requests, and let
+        # urllib3 retry connection errors, rate limiting and server errors.
+        # The final failed response is returned rather than raised, so
+        # _make_request can report its status.
+        retry = _JitteredRetry(
+            total=max(retries - 1, 0),
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        if session is None:
+            session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+        session.headers.update(self.headers)
+        self.session = session
+
     def _wait_for_rate_limit(self):
-        """Ensure we respect rate limiting between requests."""
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
+        """
+        Ensure we respect rate limiting between requests.
+
+        Each caller reserves the next free start time and sleeps until then,
+        so requests from several threads start min_request_interval apart
+        but can still be in flight at the same time.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self.last_request_time + self.min_request_interval)
+            self.last_request_time = start
+        if start > now:
+            time.sleep(start - now)
+
+    def _update_rate_limit(self, headers) -> None:
+        """
+        Adopt the rate limit Crossref announces in its response headers.
+
+        Crossref sends X-Rate-Limit-Limit (requests) and X-Rate-Limit-Interval
+        (e.g. "1s"); headers that are missing or malformed are ignored. The
+        limit is split between rate_limit_share clients.
+
+        Args:
+            headers: Response headers
+        """
+        try:
+            limit = int(headers.get('X-Rate-Limit-Limit'))
+            match = self._RATE_LIMIT_INTERVAL_RE.match(headers.get('X-Rate-Limit-Interval'))
+        except (TypeError, ValueError):
+            return
+        if not match or limit <= 0:
+            return
+
+        interval = float(match.group(1)) * {'ms': 0.001, 's': 1, 'm': 60}[match.group(2) or 's']
+        with self._rate_lock:
+            self.min_request_interval = interval * self.rate_limit_share / limit
 
     def _make_request(self, url: str, method: str = 'GET') -> Dict[str, Any]:
         """
         Make HTTP request with retry logic and exponential backoff.
 
+        Retries happen inside the session's adapter (see __init__).
+
         Args:
             url: The URL to request
             method: HTTP method (default: GET)
@@ -108,60 +265,129 @@ class CrossrefClient:
             CrossrefConnectionError: After all retries exhausted
             CrossrefAPIError: For non-retryable API errors
         """
-        last_exception = None
+        self._wait_for_rate_limit()
+
+        try:
+            response = self.session.request(method, url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise CrossrefConnectionError(
+                f"Connection failed after {self.retries} attempts: {str(e)}"
+            ) from e
+
+        self._update_rate_limit(response.headers)
+
+        # Handle different HTTP status codes
+        if response.status_code == 200:
+            # Parse the raw body ourselves (orjson is much faster on large
+            # result pages); other response types keep their own json()
+            if isinstance(response, requests.Response):
+                return _json_loads(response.content)
+            return response.json()
+        elif response.status_code == 429:
+            raise CrossrefConnectionError(
+                f"Rate limited by Crossref after {self.retries} attempts"
+            )
+        elif 400 <= response.status_code < 500:
+            # Client error - not retried
+            raise CrossrefAPIError(
+                f"API error {response.status_code}: {response.text}",
+                status_code=response.status_code
+            )
+        raise CrossrefConnectionError(
+            f"Server error {response.status_code} after {self.retries} attempts"
+        )
+
+    def _cached_request(self, cache_key: str, url: str) -> Dict[str, Any]:
+        """
+        Make an API request, reusing a cached response if there is one.
+
+        Responses are kept in memory for the life of the client and on disk
+        for cache_ttl seconds. A 404 is cached for negative_cache_ttl seconds
+        and raised again from the cache; other failures are never cached.
+
+        Args:
+            cache_key: Key identifying the request (DOI or query)
+            url: The URL to request
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            CrossrefConnectionError: After all retries exhausted
+            CrossrefAPIError: For non-retryable API errors
+        """
+        if not self.use_cache:
+            return self._make_request(url)
 
-        for attempt in range(self.retries):
+        data = self._load_cached(cache_key)
+        if data is None:
             try:
-                self._wait_for_rate_limit()
+                data = self._make_request(url)
+            except CrossrefAPIError as e:
+                if e.status_code == 404:
+                    self._store_cached(cache_key, {'not_found': str(e)})
+                raise
+            self._store_cached(cache_key, data)
+
+        if 'not_found' in data:
+            raise CrossrefAPIError(data['not_found'], status_code=404)
+        return data
+
+    def _cache_path(self, cache_key: str) -> Path:
+        """Get the disk cache file for a cache key."""
+        digest = hashlib.blake2b(cache_key.encode('utf-8'), digest_size=16).hexdigest()
+        return self._cache_dir / f"{digest}.json"
+
+    def _load_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response in memory, then on disk.
 
-                response = requests.request(
-                    method,
-                    url,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
+        Args:
+            cache_key: Key identifying the request
 
-                # Handle different HTTP status codes
-                if response.status_code == 200:
-                    return response.json()
-                elif 400 <= response.status_code < 500:
-                    # Client error - don't retry
-                    raise CrossrefAPIError(
-                        f"API error {response.status_code}: {response.text}"
-                    )
-                elif response.status_code >= 500:
-                    # Server error - retry
-                    raise requests.exceptions.RequestException(
-                        f"Server error {response.status_code}"
-                    )
-
-            except (requests.exceptions.ConnectionError,
-                    requests.exceptions.Timeout,
-                    requests.exceptions.RequestException) as e:
-                last_exception = e
-
-                if attempt < self.retries - 1:
-                    # Exponential backoff: 1s, 2s, 4s
-                    delay = self.backoff_factor * (2 ** attempt)
-                    time.sleep(delay)
-                    continue
-                else:
-                    # All retries exhausted
-                    raise CrossrefConnectionError(
-                        f"Connection failed after {self.retries} attempts: {str(e)}"
-                    ) from e
+        Returns:
+            Cached response (or {'not_found': message} for a cached 404),
+            or None if missing, expired or unreadable
+        """
+        if cache_key in self._memory_cache:
+            return self._memory_cache[cache_key]
 
-        # Should not reach here, but just in case
-        raise CrossrefConnectionError(
-            f"Connection failed: {str(last_exception)}"
-        ) from last_exception
+        cache_path = self._cache_path(cache_key)
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+            if age < max(self.cache_ttl, self.negative_cache_ttl):
+                data = _json_loads(cache_path.read_bytes())
+                ttl = self.negative_cache_ttl if 'not_found' in data else self.cache_ttl
+                if age < ttl:
+                    self._memory_cache[cache_key] = data
+                    return data
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache entry
+        return None
+
+    def _store_cached(self, cache_key: str, data: Dict[str, Any]):
+        """
+        Store a response in memory and on disk, ignoring write errors.
+
+        Args:
+            cache_key: Key identifying the request
+            data: Response JSON
+        """
+        self._memory_cache[cache_key] = data
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path(cache_key), 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError:
+            pass  # Caching is best effort
 
     def _fuzzy_title_similarity(self, title1: str, title2: str) -> float:
         """
         Calculate fuzzy similarity between two titles.
 
         Uses sequence matching after normalizing the titles (lowercase,
-        removing punctuation, filtering stopwords).
+        removing punctuation, filtering stopwords). The similarity is
+        computed by rapidfuzz if it is installed, else by difflib.
 
         Args:
             title1: First title
@@ -170,28 +396,24 @@ class CrossrefClient:
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        # Normalize titles
-        def normalize(text: str) -> str:
-            # Convert to lowercase
-            text = text.lower()
-            # Remove punctuation
-            text = re.sub(r'[^\w\s]', ' ', text)
-            # Extract words
-            words = text.split()
-            # Filter stopwords and short words
-            words = [w for w in words if w not in self.STOPWORDS and len(w) > 2]
-            return ' '.join(words)
-
-        norm1 = normalize(title1)
-        norm2 = normalize(title2)
+        norm1 = self._normalize_title(title1)
+        norm2 = self._normalize_title(title2)
 
         if not norm1 or not norm2:
             return 0.0
 
-        # Use SequenceMatcher for fuzzy matching
+        if RAPIDFUZZ_AVAILABLE:
+            # Same ratio as SequenceMatcher (2 * matches / total length)
+            return fuzz.ratio(norm1, norm2) / 100.0
+
         matcher = SequenceMatcher(None, norm1, norm2)
         return matcher.ratio()
 
+    def _normalize_title(self, text: str) -> str:
+        """Lowercase a title, remove punctuation, stopwords and short words."""
+        words = self._PUNCTUATION_RE.sub(' ', text.lower()).split()
+        return ' '.join(w for w in words if w not in self.STOPWORDS and len(w) > 2)
+
     def _calculate_match_score(
         self,
         item: Dict[str, Any],
@@ -217,60 +439,124 @@ class CrossrefClient:
         Returns:
             Score between 0.0 and 1.0
         """
-        score = 0.0
+        return self._score_items([item], title, author, year)[0]
 
+    def _score_items(
+        self,
+        items: List[Dict[str, Any]],
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        year: Optional[str] = None
+    ) -> List[float]:
+        """
+        Calculate match scores for several Crossref items at once.
+
+        Same weights as _calculate_match_score(), but the query is normalized
+        once and all titles are compared in a single call.
+
+        Args:
+            items: Crossref API result items
+            title: Query title
+            author: Query author
+            year: Query year
+
+        Returns:
+            Score between 0.0 and 1.0 for each item, in order
+        """
         # Title similarity (weight: 0.5)
-        if title and 'title' in item and item['title']:
-            item_title = item['title'][0]
-            title_similarity = self._fuzzy_title_similarity(title, item_title)
-            score += title_similarity * 0.5
+        if title:
+            item_titles = [item['title'][0] if item.get('title') else None for item in items]
+            title_similarities = self._title_similarities(title, item_titles)
+        else:
+            title_similarities = [0.0] * len(items)
 
-        # Year match (weight: 0.2)
-        if year:
-            item_year = self._extract_year(item)
-            if item_year:
-                # Exact match
-                if item_year == year:
-                    score += 0.2
-                # ±1 year tolerance
-                elif abs(int(item_year) - int(year)) == 1:
-                    score += 0.1
-
-        # Author match (weight: 0.2)
-        if author and 'author' in item and item['author']:
-            author_lower = author.lower()
-            for item_author in item['author']:
-                if 'family' in item_author:
-                    family_name = item_author['family'].lower()
-                    if family_name in author_lower or author_lower in family_name:
+        author_lower = author.lower() if author else None
+        scores = []
+
+        for item, title_similarity in zip(items, title_similarities):
+            score = title_similarity * 0.5
+
+            # Year match (weight: 0.2)
+            if year:
+                item_year = self._extract_year(item)
+                if item_year:
+                    # Exact match
+                    if item_year == year:
                         score += 0.2
-                        break
+                    # ±1 year tolerance
+                    elif abs(int(item_year) - int(year)) == 1:
+                        score += 0.1
+
+            # Author match (weight: 0.2)
+            if author_lower and item.get('author'):
+                for item_author in item['author']:
+                    if 'family' in item_author:
+                        family_name = item_author['family'].lower()
+                        if family_name in author_lower or author_lower in family_name:
+                            score += 0.2
+                            break
 
-        # Journal match (weight: 0.1) - currently not used in search
-        # This is kept for potential future use when journal info is available
+            # Journal match (weight: 0.1) - currently not used in search
+            # This is kept for potential future use when journal info is available
 
-        return min(score, 1.0)  # Cap at 1.0
+            scores.append(min(score, 1.0))  # Cap at 1.0
+
+        return scores
+
+    def _title_similarities(self, title: str, item_titles: List[Optional[str]]) -> List[float]:
+        """
+        Calculate the fuzzy similarity of a title to each of several titles.
+
+        Gives the same results as calling _fuzzy_title_similarity() for each.
+
+        Args:
+            title: Query title
+            item_titles: Titles to compare against (None counts as no match)
+
+        Returns:
+            Similarity between 0.0 and 1.0 for each title, in order
+        """
+        query = self._normalize_title(title)
+        normalized = [self._normalize_title(t) if t else '' for t in item_titles]
+        similarities = [0.0] * len(normalized)
+
+        if not query:
+            return similarities
+
+        if RAPIDFUZZ_AVAILABLE:
+            for _, similarity, idx in process.extract(
+                query, normalized, scorer=fuzz.ratio, limit=None
+            ):
+                if normalized[idx]:
+                    similarities[idx] = similarity / 100.0
+            return similarities
+
+        for idx, norm in enumerate(normalized):
+            if norm:
+                similarities[idx] = SequenceMatcher(None, query, norm).ratio()
+        return similarities
 
     def _extract_year(self, item: Dict[str, Any]) -> Optional[str]:
         """Extract publication year from Crossref item."""
-        # Try different date fields in order of preference
-        for date_field in ['published-print', 'published-online', 'created']:
-            if date_field in item and 'date-parts' in item[date_field]:
-                date_parts = item[date_field]['date-parts']
-                if date_parts and len(date_parts) > 0 and len(date_parts[0]) > 0:
-                    return str(date_parts[0][0])
+        for date_field in self._YEAR_FIELDS:
+            date = item.get(date_field)
+            date_parts = date.get('date-parts') if date else None
+            # Crossref sends [[null]] for unknown dates
+            if date_parts and date_parts[0] and date_parts[0][0] is not None:
+                return str(date_parts[0][0])
         return None
 
     def _extract_authors(self, item: Dict[str, Any]) -> List[str]:
         """Extract author names from Crossref item."""
-        authors = []
-        if 'author' in item:
-            for author in item['author']:
-                if 'given' in author and 'family' in author:
-                    authors.append(f"{author['given']} {author['family']}")
-                elif 'family' in author:
-                    authors.append(author['family'])
-        return authors
+        # A family name alone is often a recurring group name, e.g.
+        # "ATLAS Collaboration", so it is interned
+        intern = sys.intern
+        return [
+            f"{author['given']} {author['family']}" if 'given' in author
+            else intern(author['family'])
+            for author in item.get('author', ())
+            if 'family' in author
+        ]
 
     def search(
         self,
@@ -328,26 +614,29 @@ class CrossrefClient:
         encoded_query = quote_plus(query)
 
         # Make API request
-        url = f"https://api.crossref.org/works?query={encoded_query}&rows={max_results * 2}"
+        url = (
+            f"https://api.crossref.org/works?query={encoded_query}&rows={max_results * 2}"
+            f"&select={','.join(self.SELECT_FIELDS)}"
+        )
+        # Crossref queries are case-insensitive, so equivalent ones share an entry
+        cache_key = f"search|{' '.join(query.casefold().split())}|{max_results * 2}"
 
         try:
-            data = self._make_request(url)
+            data = self._cached_request(cache_key, url)
         except (CrossrefConnectionError, CrossrefAPIError):
             raise
 
         # Extract and score results
         matches = []
         if 'message' in data and 'items' in data['message']:
-            items = data['message']['items']
-
-            for item in items:
-                # Must have DOI and title
-                if 'DOI' not in item or 'title' not in item or not item['title']:
-                    continue
-
-                # Calculate match score
-                score = self._calculate_match_score(item, title, author, year)
-
+            # Must have DOI and title
+            items = [
+                item for item in data['message']['items']
+                if 'DOI' in item and item.get('title')
+            ]
+            scores = self._score_items(items, title, author, year)
+
+            for item, score in zip(items, scores):
                 # Create match object
                 match = CrossrefMatch(
                     doi=item['DOI'],
@@ -364,6 +653,45 @@ class CrossrefClient:
         matches.sort(key=lambda m: m.score, reverse=True)
         return matches[:max_results]
 
+    def search_many(
+        self,
+        queries: Iterable[Dict[str, Optional[str]]],
+        max_results: int = 5,
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Union[List[CrossrefMatch], Exception]]:
+        """
+        Run several searches concurrently.
+
+        The searches share the client's connection pool and rate limit, so
+        their round-trips overlap while request starts stay spaced out.
+
+        Args:
+            queries: Keyword arguments for search() (title, author, year)
+            max_results: Maximum number of results per search
+            max_workers: Number of searches in flight at once
+                (default: MAX_CONCURRENT_SEARCHES)
+            return_exceptions: Return the Crossref error for a search that
+                fails in its place, instead of raising it
+
+        Returns:
+            List of search() results, in the same order as queries
+
+        Raises:
+            CrossrefConnectionError: After all retries exhausted
+            CrossrefAPIError: For non-retryable API errors
+        """
+        def run(query: Dict[str, Optional[str]]):
+            try:
+                return self.search(max_results=max_results, **query)
+            except (CrossrefConnectionError, CrossrefAPIError) as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.MAX_CONCURRENT_SEARCHES) as executor:
+            return list(executor.map(run, queries))
+
     def fetch_metadata(self, doi: str) -> dict:
         """
         Fetch complete metadata for a given DOI.
@@ -390,27 +718,91 @@ class CrossrefClient:
         url = f"https://api.crossref.org/works/{cleaned_doi}"
 
         try:
-            data = self._make_request(url)
+            data = self._cached_request(self._doi_cache_key(cleaned_doi), url)
         except (CrossrefConnectionError, CrossrefAPIError):
             raise
 
         # Extract metadata
         if 'message' in data:
-            item = data['message']
-            metadata = {
-                'doi': item.get('DOI'),
-                'title': item.get('title', [None])[0],
-                'authors': self._extract_authors(item),
-                'year': self._extract_year(item),
-                'journal': item.get('container-title', [None])[0],
-                'publisher': item.get('publisher'),
-                'type': item.get('type'),
-            }
-
-            # Add ISBN if available
-            if 'ISBN' in item:
-                metadata['isbn'] = item['ISBN'][0] if isinstance(item['ISBN'], list) else item['ISBN']
-
-            return metadata
+            return self._item_to_metadata(data['message'])
 
         return {}
+
+    def fetch_metadata_bulk(self, dois: Iterable[str]) -> Dict[str, dict]:
+        """
+        Fetch metadata for many DOIs with as few requests as possible.
+
+        Uses the works endpoint's doi filter to look up BULK_DOI_CHUNK DOIs
+        per request. The responses are cached as if each DOI had been fetched
+        on its own, so later fetch_metadata() calls for these DOIs need no
+        request. DOIs missing from the response are not cached: the filter
+        doesn't resolve aliased DOIs that /works/{doi} does. Without
+        use_cache there is nothing to prefill, so this only returns the
+        results.
+
+        Args:
+            dois: DOIs to look up
+
+        Returns:
+            Dictionary mapping lowercase DOI to metadata (as returned by
+            fetch_metadata) for the DOIs that were found
+
+        Raises:
+            CrossrefConnectionError: After all retries exhausted
+            CrossrefAPIError: For non-retryable API errors
+        """
+        # Skip DOIs already cached, and ones a comma-separated filter can't hold
+        pending = sorted({
+            doi.strip().lower() for doi in dois
+            if doi and ',' not in doi
+        })
+        results = {}
+        to_fetch = []
+        for doi in pending:
+            cached = self._load_cached(self._doi_cache_key(doi)) if self.use_cache else None
+            if cached is not None:
+                if 'message' in cached:
+                    results[doi] = self._item_to_metadata(cached['message'])
+            else:
+                to_fetch.append(doi)
+
+        for start in range(0, len(to_fetch), self.BULK_DOI_CHUNK):
+            chunk = to_fetch[start:start + self.BULK_DOI_CHUNK]
+            doi_filter = ','.join(f"doi:{quote(doi, safe='/')}" for doi in chunk)
+            url = (
+                f"https://api.crossref.org/works?filter={doi_filter}&rows={len(chunk)}"
+                f"&select={','.join(self.SELECT_FIELDS)}"
+            )
+
+            data = self._make_request(url)
+            for item in data.get('message', {}).get('items', []):
+                if not item.get('DOI'):
+                    continue
+                doi = item['DOI'].lower()
+                if self.use_cache:
+                    self._store_cached(self._doi_cache_key(doi), {'message': item})
+                results[doi] = self._item_to_metadata(item)
+
+        return results
+
+    def _doi_cache_key(self, doi: str) -> str:
+        """Get the cache key for a DOI lookup (DOIs are case-insensitive)."""
+        return f"doi|{doi.lower()}"
+
+    def _item_to_metadata(self, item: Dict[str, Any]) -> dict:
+        """Convert a Crossref work item to the fetch_metadata() format."""
+        metadata = {
+            'doi': item.get('DOI'),
+            'title': item.get('title', [None])[0],
+            'authors': self._extract_authors(item),
+            'year': self._extract_year(item),
+            'journal': item.get('container-title', [None])[0],
+            'publisher': item.get('publisher'),
+            'type': item.get('type'),
+        }
+
+        # Add ISBN if available
+        if 'ISBN' in item:
+            metadata['isbn'] = item['ISBN'][0] if isinstance(item['ISBN'], list) else item['ISBN']
+
+        return metadata
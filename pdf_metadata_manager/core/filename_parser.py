@@ -6,12 +6,19 @@ and extract author, year, and title information that can be used to search
 for metadata in academic databases like Crossref.
 """
 
+import os
 import re
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, List, Optional
+from urllib.parse import unquote
 
 
-@dataclass
+# Instance dicts are dropped where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FilenameHints:
     """
     Structured metadata hints extracted from a PDF filename.
@@ -22,11 +29,55 @@ class FilenameHints:
         title: Article title hint
         confidence: Confidence score from 0.0 to 1.0 indicating how well
                    the filename matched a known pattern
+        doi: DOI the file is named after (publisher downloads often are)
     """
     author: Optional[str] = None
     year: Optional[str] = None
     title: Optional[str] = None
     confidence: float = 0.0
+    doi: Optional[str] = None
+
+
+# DOI as a filename: the '/' after the prefix is replaced by '_' or
+# URL-encoded, e.g. "10.1038_s41586-020-2649-2.pdf"; with URL encoding, the
+# rest of the DOI is encoded too
+_DOI_FILENAME_PATTERN = re.compile(r'^(10\.\d{4,9})(?:_|%2F)(\S+)$', re.IGNORECASE)
+
+# Filename patterns, tried in order (most specific first). Each is
+# (regex, confidence_score, (author_group, year_group, title_group))
+_FILENAME_PATTERNS = (
+    # Zotero format: "Author - Year - Title"
+    # Highest confidence as it's the most structured
+    (re.compile(r'^(.+?)\s*-\s*(\d{4})\s*-\s*(.+)$'), 0.9, (1, 2, 3)),
+
+    # "Author (Year) Title" or "Author (Year)"
+    (re.compile(r'^([A-Za-z\s&]+)\s*\((\d{4})\)\s*(.*)$'), 0.85, (1, 2, 3)),
+
+    # "Author Year Title" with spaces
+    (re.compile(r'^([A-Za-z\s&]+?)\s+(\d{4})\s+(.+)$'), 0.75, (1, 2, 3)),
+
+    # "Author_Year_Title" with underscores
+    (re.compile(r'^([A-Za-z]+)_(\d{4})_(.+)$'), 0.75, (1, 2, 3)),
+
+    # "Author_Year" with underscore (no title)
+    (re.compile(r'^([A-Za-z]+)_(\d{4})$'), 0.6, (1, 2, None)),
+
+    # "AuthorYEAR" concatenated (no title)
+    (re.compile(r'^([A-Za-z]+)(\d{4})$'), 0.6, (1, 2, None)),
+
+    # "Author Year" with space (no title)
+    (re.compile(r'^([A-Za-z\s&]+)\s+(\d{4})$'), 0.65, (1, 2, None)),
+
+    # "Year_Author" reversed format
+    (re.compile(r'^(\d{4})_([A-Za-z]+)$'), 0.55, (2, 1, None)),
+
+    # Just year in filename
+    (re.compile(r'^.*?(\d{4}).*?$'), 0.3, (None, 1, None)),
+)
+
+# Every pattern above needs a year, so names without four digits in a row
+# can skip them all
+_YEAR_CANDIDATE = re.compile(r'\d{4}')
 
 
 def parse_filename(filename: str) -> FilenameHints:
@@ -45,53 +96,32 @@ def parse_filename(filename: str) -> FilenameHints:
 
     Examples:
         >>> parse_filename("Smith - 2020 - Machine Learning.pdf")
-        FilenameHints(author="Smith", year="2020", title="Machine Learning", confidence=0.9)
+        FilenameHints(author='Smith', year='2020', title='Machine Learning', confidence=0.9, doi=None)
 
         >>> parse_filename("jones_2019.pdf")
-        FilenameHints(author="jones", year="2019", title=None, confidence=0.6)
+        FilenameHints(author='jones', year='2019', title=None, confidence=0.6, doi=None)
 
         >>> parse_filename("random_file.pdf")
-        FilenameHints(author=None, year=None, title=None, confidence=0.0)
+        FilenameHints(author=None, year=None, title=None, confidence=0.0, doi=None)
+
+        >>> parse_filename("10.1038_s41586-020-2649-2.pdf")
+        FilenameHints(author=None, year=None, title=None, confidence=0.0, doi='10.1038/s41586-020-2649-2')
     """
     # Remove .pdf extension if present (case-insensitive)
     clean_name = filename
     if clean_name.lower().endswith('.pdf'):
         clean_name = clean_name[:-4]
 
-    # Define patterns in order of confidence (most specific first)
-    # Each pattern is (regex, confidence_score, (author_group, year_group, title_group))
-    patterns = [
-        # Zotero format: "Author - Year - Title"
-        # Highest confidence as it's the most structured
-        (r'^(.+?)\s*-\s*(\d{4})\s*-\s*(.+)$', 0.9, (1, 2, 3)),
+    # A DOI says nothing about author, year, or title, so confidence stays 0
+    doi_match = _DOI_FILENAME_PATTERN.match(clean_name)
+    if doi_match:
+        return FilenameHints(doi=f"{doi_match.group(1)}/{unquote(doi_match.group(2))}")
 
-        # "Author (Year) Title" or "Author (Year)"
-        (r'^([A-Za-z\s&]+)\s*\((\d{4})\)\s*(.*)$', 0.85, (1, 2, 3)),
+    if not _YEAR_CANDIDATE.search(clean_name):
+        return FilenameHints(confidence=0.0)
 
-        # "Author Year Title" with spaces
-        (r'^([A-Za-z\s&]+?)\s+(\d{4})\s+(.+)$', 0.75, (1, 2, 3)),
-
-        # "Author_Year_Title" with underscores
-        (r'^([A-Za-z]+)_(\d{4})_(.+)$', 0.75, (1, 2, 3)),
-
-        # "Author_Year" with underscore (no title)
-        (r'^([A-Za-z]+)_(\d{4})$', 0.6, (1, 2, None)),
-
-        # "AuthorYEAR" concatenated (no title)
-        (r'^([A-Za-z]+)(\d{4})$', 0.6, (1, 2, None)),
-
-        # "Author Year" with space (no title)
-        (r'^([A-Za-z\s&]+)\s+(\d{4})$', 0.65, (1, 2, None)),
-
-        # "Year_Author" reversed format
-        (r'^(\d{4})_([A-Za-z]+)$', 0.55, (2, 1, None)),
-
-        # Just year in filename
-        (r'^.*?(\d{4}).*?$', 0.3, (None, 1, None)),
-    ]
-
-    for pattern, confidence, groups in patterns:
-        match = re.match(pattern, clean_name)
+    for pattern, confidence, groups in _FILENAME_PATTERNS:
+        match = pattern.match(clean_name)
         if match:
             author_group, year_group, title_group = groups
 
@@ -121,15 +151,10 @@ def parse_filename(filename: str) -> FilenameHints:
                 # Clean up extra whitespace
                 author = ' '.join(author.split())
 
-            # Validate year is reasonable (between 1800 and 2100)
-            if year:
-                try:
-                    year_int = int(year)
-                    if year_int < 1800 or year_int > 2100:
-                        # Probably not a real year, continue to next pattern
-                        continue
-                except ValueError:
-                    continue
+            # Validate year is reasonable (between 1800 and 2100); year
+            # groups are always four digits. Otherwise try the next pattern
+            if year and not 1800 <= int(year) <= 2100:
+                continue
 
             return FilenameHints(
                 author=author,
@@ -140,3 +165,17 @@ def parse_filename(filename: str) -> FilenameHints:
 
     # No pattern matched
     return FilenameHints(confidence=0.0)
+
+
+def parse_filenames(filenames: Iterable[str]) -> List[FilenameHints]:
+    """
+    Extract hints from many PDF filenames, e.g. all files in a directory.
+
+    Args:
+        filenames: PDF filenames or paths (only the base name is parsed)
+
+    Returns:
+        List of FilenameHints objects, in the same order as filenames
+    """
+    basename = os.path.basename
+    return [parse_filename(basename(name)) for name in filenames]
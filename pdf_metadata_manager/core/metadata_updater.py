@@ -14,11 +14,11 @@ from typing import Optional
 import pikepdf
 
 try:
-    from PyPDF2 import PdfReader, PdfWriter
-    PYPDF2_AVAILABLE = True
+    from pypdf import PdfReader, PdfWriter
+    PYPDF_AVAILABLE = True
 except ImportError:
-    PYPDF2_AVAILABLE = False
-    print("Warning: PyPDF2 not available. Only pikepdf will be used for PDF operations.")
+    PYPDF_AVAILABLE = False
+    print("Warning: pypdf not available. Only pikepdf will be used for PDF operations.")
 
 try:
     from pathvalidate import sanitize_filename as pathvalidate_sanitize
@@ -28,6 +28,42 @@ except ImportError:
 
 from ..utils.timestamp_utils import preserve_timestamps, get_timestamps, set_timestamps
 
+# Characters that filename sanitization removes or rewrites
+_UNSAFE_FILENAME_CHARS = '<>:"/\\|?*\'(),;&'
+_UNSAFE_FILENAME_TABLE = str.maketrans('', '', _UNSAFE_FILENAME_CHARS)
+
+# XMP properties whose names contain these terms are stripped on update
+_XMP_URL_TERMS = ('where', 'url', 'source', 'link', 'from', 'uri')
+_RDF_DESCRIPTION = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}Description'
+
+
+_AUTHOR_SPLIT = re.compile(r'[;,]')
+
+
+def _split_authors(authors: str) -> list:
+    """
+    Split an author string on semicolons and commas.
+
+    Equivalent to re.split(r'[;,]', authors), but uses plain str.split when
+    only one kind of delimiter is present.
+    """
+    if ';' in authors:
+        if ',' in authors:
+            return _AUTHOR_SPLIT.split(authors)
+        return authors.split(';')
+    if ',' in authors:
+        return authors.split(',')
+    return [authors]
+
+
+def _is_url_xmp_key(key) -> bool:
+    """Return True if an XMP property name looks URL or origin related."""
+    if not isinstance(key, str):
+        # Comments and processing instructions have non-string tags
+        return False
+    key_lower = key.lower()
+    return any(term in key_lower for term in _XMP_URL_TERMS)
+
 
 # Custom exceptions
 class PDFUpdateError(Exception):
@@ -73,7 +109,7 @@ class MetadataUpdater:
         Update PDF metadata.
 
         Updates both docinfo and XMP metadata in the PDF file. Uses pikepdf
-        as the primary library with PyPDF2 as a fallback if available.
+        as the primary library with pypdf as a fallback if available.
 
         Args:
             pdf_path: Path to PDF file
@@ -109,13 +145,13 @@ class MetadataUpdater:
         except Exception as e:
             print(f"  pikepdf update failed: {e}")
 
-            # Try PyPDF2 fallback if available
-            if PYPDF2_AVAILABLE:
-                print("  Trying PyPDF2 fallback...")
+            # Try pypdf fallback if available
+            if PYPDF_AVAILABLE:
+                print("  Trying pypdf fallback...")
                 try:
-                    return self._update_with_pypdf2(pdf_path, metadata, output_path, original_timestamps)
+                    return self._update_with_pypdf(pdf_path, metadata, output_path, original_timestamps)
                 except Exception as e2:
-                    print(f"  PyPDF2 fallback also failed: {e2}")
+                    print(f"  pypdf fallback also failed: {e2}")
                     raise PDFUpdateError(f"All metadata update methods failed. Last error: {e2}")
             else:
                 raise PDFUpdateError(f"Metadata update failed: {e}")
@@ -128,143 +164,156 @@ class MetadataUpdater:
         original_timestamps: dict
     ) -> bool:
         """Update PDF metadata using pikepdf."""
-        # Create temp output if updating in-place
-        temp_output = output_path + ".tmp" if output_path == pdf_path else output_path
-
-        try:
-            with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
-                # Create a new docinfo dictionary (removes unwanted fields)
-                new_docinfo = pikepdf.Dictionary()
+        with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+            # Collect the new docinfo entries in a plain dict first, then
+            # build the pikepdf dictionary in one go (removes unwanted fields)
+            docinfo_items = {}
 
-                # Add only the metadata we want
-                if metadata.title:
-                    new_docinfo['/Title'] = metadata.title
+            # Add only the metadata we want
+            if metadata.title:
+                docinfo_items['/Title'] = metadata.title
 
+            if metadata.authors:
+                docinfo_items['/Author'] = metadata.authors
+
+            if metadata.year:
+                # Set creation date to January 1st of the publication year
+                docinfo_items['/CreationDate'] = f"D:{metadata.year}0101000000Z"
+
+            # Handle journal and DOI in Subject field
+            subject_parts = []
+            if metadata.journal:
+                subject_parts.append(metadata.journal)
+
+            if metadata.doi:
+                subject_parts.append(f"DOI: {metadata.doi}")
+            elif metadata.isbn:
+                subject_parts.append(f"ISBN: {metadata.isbn}")
+
+            if subject_parts:
+                docinfo_items['/Subject'] = " | ".join(subject_parts)
+
+            # Set Keywords field with DOI or ISBN
+            if metadata.doi:
+                docinfo_items['/Keywords'] = f"DOI: {metadata.doi}"
+            elif metadata.isbn:
+                docinfo_items['/Keywords'] = f"ISBN: {metadata.isbn}"
+
+            # Preserve some standard metadata fields if they exist
+            existing_docinfo = dict(pdf.docinfo) if pdf.docinfo else {}
+            for field in ('/Creator', '/Producer'):
+                if field in existing_docinfo:
+                    docinfo_items.setdefault(field, existing_docinfo[field])
+
+            new_docinfo = pikepdf.Dictionary(docinfo_items)
+
+            # Make the dictionary an indirect object
+            new_docinfo = pdf.make_indirect(new_docinfo)
+
+            # Replace the entire docinfo dictionary
+            pdf.docinfo = new_docinfo
+
+            # Update XMP metadata as well, but only if there is something
+            # to write (opening it parses the XMP packet)
+            if any((metadata.title, metadata.authors, metadata.journal,
+                    metadata.doi, metadata.isbn)):
+                # Prepare XMP values before entering the metadata context
+                author_list = None
                 if metadata.authors:
-                    new_docinfo['/Author'] = metadata.authors
-
-                if metadata.year:
-                    try:
-                        # Set creation date to January 1st of the publication year
-                        new_docinfo['/CreationDate'] = f"D:{metadata.year}0101000000Z"
-                    except Exception as year_err:
-                        print(f"  Warning: Could not set CreationDate: {year_err}")
+                    # Split authors and convert to list
+                    author_list = [author.strip() for author in _split_authors(metadata.authors)]
 
-                # Handle journal and DOI in Subject field
-                subject_parts = []
+                # Add journal and DOI to description
+                description_parts = []
                 if metadata.journal:
-                    subject_parts.append(metadata.journal)
-
-                if metadata.doi:
-                    subject_parts.append(f"DOI: {metadata.doi}")
-                elif metadata.isbn:
-                    subject_parts.append(f"ISBN: {metadata.isbn}")
-
-                if subject_parts:
-                    new_docinfo['/Subject'] = " | ".join(subject_parts)
+                    description_parts.append(metadata.journal)
 
-                # Set Keywords field with DOI or ISBN
                 if metadata.doi:
-                    new_docinfo['/Keywords'] = f"DOI: {metadata.doi}"
+                    description_parts.append(f"DOI: {metadata.doi}")
                 elif metadata.isbn:
-                    new_docinfo['/Keywords'] = f"ISBN: {metadata.isbn}"
-
-                # Preserve some standard metadata fields if they exist
-                standard_fields = ['/Creator', '/Producer']
-                for field in standard_fields:
-                    if hasattr(pdf, 'docinfo') and pdf.docinfo and field in pdf.docinfo:
-                        if field not in new_docinfo:
-                            new_docinfo[field] = pdf.docinfo[field]
+                    description_parts.append(f"ISBN: {metadata.isbn}")
 
-                # Make the dictionary an indirect object
-                new_docinfo = pdf.make_indirect(new_docinfo)
+                identifier = metadata.doi or metadata.isbn
 
-                # Replace the entire docinfo dictionary
-                pdf.docinfo = new_docinfo
-
-                # Update XMP metadata as well
                 try:
                     with pdf.open_metadata() as xmp_meta:
                         # Remove URL-related or "where from" related properties
-                        keys_to_remove = []
-                        for key in xmp_meta.keys():
-                            key_lower = str(key).lower()
-                            if any(term in key_lower for term in ['where', 'url', 'source', 'link', 'from', 'uri']):
-                                keys_to_remove.append(key)
-
-                        # Remove identified keys
-                        for key in keys_to_remove:
-                            try:
-                                del xmp_meta[key]
-                            except:
-                                pass
+                        self._remove_xmp_url_properties(xmp_meta)
 
                         # Add our metadata in XMP format
                         if metadata.title:
                             xmp_meta['dc:title'] = metadata.title
 
-                        if metadata.authors:
-                            # Split authors and convert to list
-                            author_list = [author.strip() for author in re.split(r'[;,]', metadata.authors)]
+                        if author_list:
                             xmp_meta['dc:creator'] = author_list
 
-                        # Add journal and DOI to description
-                        description_parts = []
-                        if metadata.journal:
-                            description_parts.append(metadata.journal)
-
-                        if metadata.doi:
-                            description_parts.append(f"DOI: {metadata.doi}")
-                        elif metadata.isbn:
-                            description_parts.append(f"ISBN: {metadata.isbn}")
-
                         if description_parts:
                             xmp_meta['dc:description'] = " | ".join(description_parts)
 
                         # Add DOI/ISBN to identifier field
-                        if metadata.doi:
-                            xmp_meta['dc:identifier'] = metadata.doi
-                        elif metadata.isbn:
-                            xmp_meta['dc:identifier'] = metadata.isbn
+                        if identifier:
+                            xmp_meta['dc:identifier'] = identifier
 
                 except Exception as xmp_error:
                     print(f"  Warning: Could not update XMP metadata: {xmp_error}")
 
-                # Save the PDF
-                pdf.save(temp_output)
+            # Save the PDF (pikepdf handles overwriting the input itself)
+            pdf.save(output_path)
 
-            # If updating in-place, replace original with temp file
-            if output_path == pdf_path:
-                os.replace(temp_output, output_path)
+        # Preserve timestamps
+        set_timestamps(output_path, original_timestamps)
 
-            # Preserve timestamps
-            set_timestamps(output_path, original_timestamps)
+        return True
 
-            return True
+    def _remove_xmp_url_properties(self, xmp_meta) -> None:
+        """
+        Remove URL-related or "where from" related properties from XMP.
 
-        except Exception as e:
-            # Clean up temp file if it exists
-            if os.path.exists(temp_output) and temp_output != output_path:
-                try:
-                    os.remove(temp_output)
-                except:
-                    pass
-            raise
+        Matching properties are removed in a single pass over the XMP tree.
+        Falls back to deleting keys one at a time if the underlying tree is
+        not accessible.
+
+        Args:
+            xmp_meta: XMP metadata opened for editing with pdf.open_metadata()
+        """
+        try:
+            rdf_root = xmp_meta._get_rdf_root()
+        except AttributeError:
+            rdf_root = None
+
+        if rdf_root is not None:
+            for description in rdf_root.iter(_RDF_DESCRIPTION):
+                for name in [n for n in description.attrib if _is_url_xmp_key(n)]:
+                    del description.attrib[name]
+                for child in [c for c in description if _is_url_xmp_key(c.tag)]:
+                    description.remove(child)
+            return
+
+        keys_to_remove = [key for key in xmp_meta.keys() if _is_url_xmp_key(key)]
+        for key in keys_to_remove:
+            try:
+                del xmp_meta[key]
+            except:
+                pass
 
-    def _update_with_pypdf2(
+    def _update_with_pypdf(
         self,
         pdf_path: str,
         metadata: MetadataUpdate,
         output_path: str,
         original_timestamps: dict
     ) -> bool:
-        """Update PDF metadata using PyPDF2 as fallback."""
+        """Update PDF metadata using pypdf as fallback."""
         reader = PdfReader(pdf_path)
         writer = PdfWriter()
 
-        # Add all pages from the original PDF
-        for page in reader.pages:
-            writer.add_page(page)
+        # Clone the whole document in one pass; versions without
+        # clone_reader_document_root (pypdf < 3) add the pages one by one
+        if hasattr(writer, "clone_reader_document_root"):
+            writer.clone_reader_document_root(reader)
+        else:
+            for page in reader.pages:
+                writer.add_page(page)
 
         # Create metadata dictionary
         metadata_dict = {}
@@ -294,14 +343,7 @@ class MetadataUpdater:
         elif metadata.isbn:
             metadata_dict["/Keywords"] = f"ISBN: {metadata.isbn}"
 
-        # Try to add metadata (PyPDF2 version compatibility)
-        try:
-            writer.add_metadata(metadata_dict)
-        except AttributeError:
-            try:
-                writer.addMetadata(metadata_dict)
-            except:
-                print("  Warning: Could not add metadata with PyPDF2")
+        writer.add_metadata(metadata_dict)
 
         # Save the PDF
         with open(output_path, "wb") as output_file:
@@ -354,7 +396,7 @@ class MetadataUpdater:
             authors = []
             if metadata.authors:
                 # Split author string by common delimiters
-                author_list = re.split(r'[;,]', metadata.authors)
+                author_list = _split_authors(metadata.authors)
 
                 for author in author_list[:3]:  # Limit to first 3 authors
                     author = author.strip()
@@ -394,6 +436,16 @@ class MetadataUpdater:
             # Create raw filename
             raw_filename = f"{author_part} - {year} - {title}"
 
+            # If the current name already matches and needs no sanitizing,
+            # keep it as is
+            original_name = os.path.basename(original_path)
+            if (not mark_incomplete
+                    and len(raw_filename) <= 236
+                    and raw_filename == os.path.splitext(original_name)[0]
+                    and raw_filename.translate(_UNSAFE_FILENAME_TABLE) == raw_filename
+                    and ' '.join(raw_filename.split()) == raw_filename):
+                return original_name
+
             # Sanitize filename
             if PATHVALIDATE_AVAILABLE:
                 # Use pathvalidate's built-in sanitization
@@ -4,23 +4,68 @@ PDF Processor Module
 Extracts text, metadata, and DOIs from PDF files with OCR fallback for scanned documents.
 """
 
+import hashlib
+import importlib.util
+import json
 import os
 import re
-import tempfile
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
 
 # PDF libraries
-from PyPDF2 import PdfReader
+from pypdf import PdfReader
 import pikepdf
 
-# OCR libraries (optional)
+# Fast text extraction (optional)
 try:
-    import pytesseract
-    from pdf2image import convert_from_path
-    OCR_AVAILABLE = True
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
 except ImportError:
-    OCR_AVAILABLE = False
+    PDFIUM_AVAILABLE = False
+
+# OCR libraries (optional). They are slow to import, so they are only
+# located here and loaded by _load_ocr() the first time OCR actually runs.
+OCR_AVAILABLE = (
+    importlib.util.find_spec('pytesseract') is not None
+    and importlib.util.find_spec('pdf2image') is not None
+)
+pytesseract = None
+convert_from_path = None
+ImageFilter = None
+ImageOps = None
+
+
+def _load_ocr() -> None:
+    """Import the OCR libraries into module globals if not done yet."""
+    global pytesseract, convert_from_path, ImageFilter, ImageOps
+    if pytesseract is None:
+        import pytesseract as _pytesseract
+        from pdf2image import convert_from_path as _convert_from_path
+        from PIL import ImageFilter as _ImageFilter, ImageOps as _ImageOps
+        ImageFilter, ImageOps = _ImageFilter, _ImageOps
+        convert_from_path = _convert_from_path
+        pytesseract = _pytesseract
+
+
+def _ocr_image(image) -> str:
+    """
+    Clean up a grayscale page image and run Tesseract on it.
+
+    Autocontrast and a light unsharp mask make faint or blurry scans easier
+    to read. Defined at module level so it can be sent to worker processes.
+
+    Args:
+        image: PIL image of a rendered PDF page
+
+    Returns:
+        Text recognized on the page
+    """
+    _load_ocr()
+    image = ImageOps.autocontrast(image.convert('L'))
+    image = image.filter(ImageFilter.UnsharpMask(radius=1, percent=150))
+    return pytesseract.image_to_string(image)
 
 
 # Custom exceptions
@@ -68,6 +113,15 @@ class PDFProcessor:
         r'doi\.org/(10\.\d{4,9}/[^\s"\'<>]+)'
     ]
 
+    # DOIs sit in the page header/footer, so only the start and end of the
+    # text are searched (in characters)
+    DOI_SCAN_HEAD = 8192
+    DOI_SCAN_TAIL = 2048
+
+    # Part of the metadata cache key; bump it whenever extraction changes so
+    # results cached by older versions are no longer used
+    CACHE_VERSION = 1
+
     # Blacklist patterns for filtering out non-title lines
     TITLE_BLACKLIST_PATTERNS = [
         r'downloaded from',
@@ -90,7 +144,36 @@ class PDFProcessor:
         r'Elsevier|Springer|Wiley|SAGE|IEEE|Oxford University Press|Cambridge University Press'
     ]
 
-    def __init__(self, use_ocr: bool = True, ocr_pages: int = 1, verbose: bool = False):
+    # Precompiled patterns
+    _DOI_RES = [re.compile(pattern) for pattern in DOI_PATTERNS]
+    _DOI_UNION_RE = re.compile(
+        '|'.join(f'(?P<doi{i}>{pattern})' for i, pattern in enumerate(DOI_PATTERNS))
+    )
+    _BLACKLIST_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in TITLE_BLACKLIST_PATTERNS),
+        re.IGNORECASE
+    )
+    # Bytes version for ASCII-only text, which the regex engine scans faster
+    _BLACKLIST_BYTES_RE = re.compile(_BLACKLIST_RE.pattern.encode(), re.IGNORECASE)
+    _DOI_TRAILING_RE = re.compile(r'[^a-zA-Z0-9]+$')
+    _WHITESPACE_RE = re.compile(r'\s')
+    _LEADING_DIGIT_RE = re.compile(r'^\d')
+    _NAME_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)')
+    _JOURNAL_RE = re.compile(
+        r'(Journal of|Proceedings of|Transactions of|Review of).*',
+        re.IGNORECASE
+    )
+
+    def __init__(
+        self,
+        use_ocr: bool = True,
+        ocr_pages: int = 1,
+        verbose: bool = False,
+        ocr_dpi: int = 200,
+        use_cache: bool = True,
+        cache_dir: Optional[str] = None,
+        ocr_workers: Optional[int] = None
+    ):
         """
         Initialize PDF processor.
 
@@ -98,10 +181,22 @@ class PDFProcessor:
             use_ocr: Enable OCR fallback for scanned documents
             ocr_pages: Number of pages to OCR (default: 1)
             verbose: Print detailed processing information
+            ocr_dpi: Resolution for rendering pages to OCR (default: 200)
+            use_cache: Cache extracted metadata by PDF content hash
+            cache_dir: Cache directory (default: ~/.cache/pdf_metadata_manager)
+            ocr_workers: Number of processes rendering and OCR'ing the pages
+                of one PDF (default: number of CPUs)
         """
         self.use_ocr = use_ocr and OCR_AVAILABLE
+        self.ocr_workers = ocr_workers
         self.ocr_pages = ocr_pages
+        self.ocr_dpi = ocr_dpi
         self.verbose = verbose
+        self.use_cache = use_cache
+        self._cache_dir = (
+            Path(cache_dir) if cache_dir
+            else Path.home() / ".cache" / "pdf_metadata_manager"
+        )
 
         if use_ocr and not OCR_AVAILABLE:
             print("Warning: OCR requested but pytesseract and pdf2image are not installed.")
@@ -110,8 +205,11 @@ class PDFProcessor:
         """
         Extract metadata from a PDF file.
 
+        Results are cached by file content hash (see use_cache), so identical
+        PDFs are only processed once.
+
         Tries multiple methods in order:
-        1. Standard text extraction (pikepdf → PyPDF2)
+        1. Standard text extraction (pypdfium2 → pikepdf → pypdf)
         2. OCR if text is insufficient (optional)
         3. Search for DOI in extracted text
         4. Extract title, authors, journal from text
@@ -130,9 +228,22 @@ class PDFProcessor:
         if not os.path.exists(pdf_path):
             raise PDFNotFoundError(f"PDF file not found: {pdf_path}")
 
+        # Reject empty or non-PDF files before any expensive parsing
+        self._check_pdf_header(pdf_path)
+
         if self.verbose:
             print(f"Processing: {pdf_path}")
 
+        # Reuse results for identical PDFs processed before
+        cache_path = None
+        if self.use_cache:
+            cache_path = self._get_cache_path(pdf_path)
+            cached = self._load_cached_metadata(cache_path)
+            if cached is not None:
+                if self.verbose:
+                    print("  Using cached metadata")
+                return cached
+
         # Initialize metadata object
         metadata = PDFMetadata()
 
@@ -144,7 +255,7 @@ class PDFProcessor:
             if self.use_ocr:
                 if self.verbose:
                     print("  PDF has little or no extractable text. Using OCR...")
-                text = self._extract_text_with_ocr(pdf_path)
+                text = self._extract_text_with_ocr_incremental(pdf_path)
                 metadata.used_ocr = True
             else:
                 if self.verbose:
@@ -177,13 +288,138 @@ class PDFProcessor:
                 if journal:
                     print(f"  Extracted journal: {journal}")
 
+        # Don't cache failures (no text, e.g. because OCR failed): they
+        # would otherwise be returned for this file from now on
+        if cache_path is not None and text.strip():
+            self._save_cached_metadata(cache_path, metadata)
+
         return metadata
 
+    def extract_metadata_batch(
+        self,
+        pdf_paths: List[str],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[PDFMetadata]:
+        """
+        Extract metadata from several PDF files in parallel.
+
+        Uses a thread pool for plain text extraction (the PDF libraries do
+        their parsing in native code), or a process pool when OCR is enabled.
+
+        Args:
+            pdf_paths: Paths to the PDF files
+            max_workers: Number of workers (default: number of CPUs)
+            return_exceptions: Return the PDFProcessingError for a file that
+                cannot be processed in its place, instead of raising it
+
+        Returns:
+            List of PDFMetadata objects, in the same order as pdf_paths
+
+        Raises:
+            PDFNotFoundError: If a PDF file doesn't exist
+            PDFProcessingError: If a PDF cannot be read
+        """
+        extract = self._extract_metadata_or_error if return_exceptions else self.extract_metadata
+        executor_class = ProcessPoolExecutor if self.use_ocr else ThreadPoolExecutor
+        with executor_class(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(extract, pdf_paths))
+
+    def _extract_metadata_or_error(self, pdf_path: str):
+        """Extract metadata, returning the error instead of raising it."""
+        try:
+            return self.extract_metadata(pdf_path)
+        except PDFProcessingError as e:
+            return e
+
+    def _check_pdf_header(self, pdf_path: str) -> None:
+        """
+        Check that a file looks like a PDF.
+
+        PDF readers accept the %PDF- marker anywhere in the first 1024 bytes,
+        so the check does the same.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Raises:
+            PDFReadError: If the file is empty or has no PDF header
+        """
+        try:
+            with open(pdf_path, 'rb') as f:
+                header = f.read(1024)
+        except OSError as e:
+            raise PDFReadError(f"Failed to read {pdf_path}: {e}")
+
+        if not header:
+            raise PDFReadError(f"PDF file is empty: {pdf_path}")
+        if b'%PDF-' not in header:
+            raise PDFReadError(f"Not a PDF file: {pdf_path}")
+
+    def _get_cache_path(self, pdf_path: str) -> Path:
+        """
+        Get the cache file path for a PDF.
+
+        The key combines CACHE_VERSION and the SHA-256 of the file contents
+        with the settings that affect extraction results.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Path of the cache file (may not exist yet)
+        """
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+
+        key = f"v{self.CACHE_VERSION}_{digest.hexdigest()}_{self.ocr_pages}_{int(self.use_ocr)}_{self.ocr_dpi}"
+        return self._cache_dir / f"{key}.json"
+
+    def _load_cached_metadata(self, cache_path: Path) -> Optional[PDFMetadata]:
+        """
+        Load cached metadata.
+
+        Args:
+            cache_path: Cache file path
+
+        Returns:
+            PDFMetadata from the cache, or None if missing or unreadable
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return PDFMetadata(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if self.verbose:
+                print(f"  Ignoring unreadable cache entry: {e}")
+            return None
+
+    def _save_cached_metadata(self, cache_path: Path, metadata: PDFMetadata):
+        """
+        Save metadata to the cache, ignoring write errors.
+
+        Args:
+            cache_path: Cache file path
+            metadata: Metadata to cache
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(metadata), f, ensure_ascii=False)
+        except Exception as e:
+            if self.verbose:
+                print(f"  Could not write cache entry: {e}")
+
     def _extract_text(self, pdf_path: str) -> str:
         """
         Extract text from PDF using standard methods.
 
-        Tries pikepdf first, then falls back to PyPDF2.
+        Tries pypdfium2 first (if installed), then pikepdf, then falls back
+        to pypdf. When OCR is enabled, short text from the faster extractors
+        is returned as is, since it will be replaced by OCR output anyway.
 
         Args:
             pdf_path: Path to PDF file
@@ -194,27 +430,44 @@ class PDFProcessor:
         Raises:
             PDFReadError: If PDF cannot be read by any method
         """
-        # Try pikepdf first
+        # Try pypdfium2 first (fastest)
+        if PDFIUM_AVAILABLE:
+            try:
+                text = self._extract_text_with_pdfium(pdf_path)
+                if text and (len(text.strip()) >= 100 or self.use_ocr):
+                    # Short text will be replaced by OCR anyway, so skip
+                    # the slower fallbacks
+                    return text
+            except Exception as e:
+                if self.verbose:
+                    print(f"  pypdfium2 extraction failed: {e}")
+
+        # Try pikepdf next
         try:
             with pikepdf.open(pdf_path) as pdf:
                 text = ""
-                # Extract text from first page only (for performance)
-                if len(pdf.pages) > 0:
-                    page = pdf.pages[0]
+                # Extract text from first page only (for performance),
+                # without sizing up the whole page tree
+                page = next(iter(pdf.pages), None)
+                if page is not None:
                     try:
                         text = page.extract_text()
                     except:
-                        pass  # Fall back to PyPDF2
+                        pass  # Fall back to pypdf
+                    del page
 
-                if text and len(text.strip()) >= 100:
+                if text and (len(text.strip()) >= 100 or self.use_ocr):
+                    # Short text will be replaced by OCR anyway, so skip
+                    # the slower pypdf fallback
                     return text
         except Exception as e:
             if self.verbose:
                 print(f"  pikepdf extraction failed: {e}")
 
-        # Fall back to PyPDF2
+        # Fall back to pypdf
         try:
-            reader = PdfReader(pdf_path)
+            # Non-strict parsing skips validation we don't need for text
+            reader = PdfReader(pdf_path, strict=False)
             if len(reader.pages) == 0:
                 raise PDFReadError("PDF has no pages")
 
@@ -223,15 +476,69 @@ class PDFProcessor:
             return text if text else ""
 
         except Exception as e:
-            raise PDFReadError(f"Failed to read PDF with both pikepdf and PyPDF2: {e}")
+            raise PDFReadError(f"Failed to read PDF with both pikepdf and pypdf: {e}")
+
+    def _extract_text_with_pdfium(self, pdf_path: str) -> str:
+        """
+        Extract text from the first page of a PDF using pypdfium2.
+
+        Args:
+            pdf_path: Path to PDF file
 
-    def _extract_text_with_ocr(self, pdf_path: str, pages: Optional[int] = None) -> str:
+        Returns:
+            Extracted text (empty if the PDF has no pages)
+        """
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            if len(pdf) == 0:
+                return ""
+
+            page = pdf[0]
+            try:
+                textpage = page.get_textpage()
+                try:
+                    return textpage.get_text_range()
+                finally:
+                    textpage.close()
+            finally:
+                page.close()
+        finally:
+            pdf.close()
+
+    def _extract_text_with_ocr_incremental(self, pdf_path: str) -> str:
+        """
+        Extract text from PDF using OCR, stopping after page 1 if possible.
+
+        The remaining pages (up to self.ocr_pages) are only OCR'd when the
+        first page doesn't yield both a DOI and a title.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Extracted text from OCR
+        """
+        text = self._extract_text_with_ocr(pdf_path, pages=1)
+        if self.ocr_pages > 1:
+            if self._extract_doi(text) is None or self._extract_metadata_from_text(text)[0] is None:
+                if self.verbose:
+                    print("  DOI or title not found on page 1, OCR-ing further pages...")
+                text += self._extract_text_with_ocr(pdf_path, pages=self.ocr_pages - 1, first_page=2)
+        return text
+
+    def _extract_text_with_ocr(
+        self,
+        pdf_path: str,
+        pages: Optional[int] = None,
+        first_page: int = 1
+    ) -> str:
         """
         Extract text from PDF using OCR.
 
         Args:
             pdf_path: Path to PDF file
             pages: Number of pages to OCR (default: self.ocr_pages)
+            first_page: Page number to start from (1-based)
 
         Returns:
             Extracted text from OCR
@@ -241,30 +548,38 @@ class PDFProcessor:
         """
         if not OCR_AVAILABLE:
             raise OCRNotAvailableError("OCR libraries (pytesseract, pdf2image) are not installed")
+        _load_ocr()
 
         if pages is None:
             pages = self.ocr_pages
+        workers = min(pages, self.ocr_workers or os.cpu_count() or 1)
 
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Convert PDF pages to images
-                images = convert_from_path(
-                    pdf_path,
-                    first_page=1,
-                    last_page=pages,
-                    dpi=300,
-                    output_folder=temp_dir
-                )
-
-                # Extract text from each image using OCR
-                text = ""
-                for i, image in enumerate(images):
-                    if self.verbose:
-                        print(f"  OCR processing page {i+1}/{len(images)}...")
-                    page_text = pytesseract.image_to_string(image)
-                    text += f"\n--- Page {i+1} ---\n{page_text}"
+            # Convert PDF pages to images (kept in memory)
+            images = convert_from_path(
+                pdf_path,
+                first_page=first_page,
+                last_page=first_page + pages - 1,
+                dpi=self.ocr_dpi,
+                grayscale=True,
+                thread_count=workers
+            )
+
+            # Extract text from each image using OCR. Tesseract is
+            # single-threaded, so OCR multiple pages in parallel.
+            if self.verbose:
+                print(f"  OCR processing {len(images)} page(s)...")
 
-                return text
+            if len(images) > 1 and workers > 1:
+                with ProcessPoolExecutor(max_workers=min(len(images), workers)) as executor:
+                    page_texts = list(executor.map(_ocr_image, images))
+            else:
+                page_texts = [_ocr_image(image) for image in images]
+
+            return "".join(
+                f"\n--- Page {page_num} ---\n{page_text}"
+                for page_num, page_text in enumerate(page_texts, first_page)
+            )
 
         except Exception as e:
             if self.verbose:
@@ -283,33 +598,68 @@ class PDFProcessor:
         """
         doi = doi.strip()
         # Remove trailing non-alphanumeric characters
-        doi = re.sub(r'[^a-zA-Z0-9]+$', '', doi)
+        doi = self._DOI_TRAILING_RE.sub('', doi)
         return doi
 
     def _extract_doi(self, text: str) -> Optional[str]:
         """
         Extract DOI from text using multiple patterns.
 
+        Only the first DOI_SCAN_HEAD characters are searched (extended to the
+        next whitespace, so a DOI crossing the limit isn't cut short),
+        followed by the last DOI_SCAN_TAIL characters if nothing was found,
+        so long OCR output doesn't make the scan slower.
+
         Args:
             text: Text to search for DOI
 
         Returns:
             DOI if found, None otherwise
         """
-        for pattern in self.DOI_PATTERNS:
-            match = re.search(pattern, text)
-            if match:
-                # Extract the DOI
-                doi = match.group(1)
+        head_end = self.DOI_SCAN_HEAD
+        if len(text) > head_end:
+            space = self._WHITESPACE_RE.search(text, head_end)
+            head_end = space.start() if space else len(text)
+
+        doi = self._search_doi(text[:head_end])
+        if doi is None and len(text) > head_end:
+            tail_start = max(head_end, len(text) - self.DOI_SCAN_TAIL)
+            doi = self._search_doi(text[tail_start:])
+        return doi
 
-                # Remove "doi.org/" prefix if present
-                if "doi.org/" in doi:
-                    doi = re.sub(r'doi\.org/', '', doi)
+    def _search_doi(self, text: str) -> Optional[str]:
+        """
+        Search text for a DOI using the patterns in DOI_PATTERNS.
 
-                doi = self._sanitize_doi(doi)
-                return doi
+        Patterns are tried in order of priority. The text is scanned once with
+        the union of all patterns; higher-priority patterns can then only match
+        after that position, so only the rest of the text is searched again.
 
-        return None
+        Args:
+            text: Text to search for DOI
+
+        Returns:
+            Sanitized DOI if found, None otherwise
+        """
+        match = self._DOI_UNION_RE.search(text)
+        if not match:
+            return None
+
+        # Extract the DOI
+        priority = int(match.lastgroup[3:])
+        doi = match.group(self._DOI_UNION_RE.groupindex[match.lastgroup] + 1)
+
+        for pattern in self._DOI_RES[:priority]:
+            preferred = pattern.search(text, match.start() + 1)
+            if preferred:
+                doi = preferred.group(1)
+                break
+
+        # Remove "doi.org/" prefix if present
+        if "doi.org/" in doi:
+            doi = doi.replace("doi.org/", "")
+
+        return self._sanitize_doi(doi)
 
     def _extract_metadata_from_text(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
@@ -321,22 +671,37 @@ class PDFProcessor:
         Returns:
             Tuple of (title, authors, journal)
         """
-        # Split into lines and filter out short lines
-        lines = [line.strip() for line in text.split('\n') if len(line.strip()) > 3]
-
-        # Filter out headers, footers, and copyright notices
+        # Split into lines, dropping short lines, and separately collect the
+        # lines that aren't headers, footers, or copyright notices along with
+        # their positions in lines
+        lines = []
         filtered_lines = []
-        for line in lines:
-            # Skip lines that match blacklist patterns
-            if any(re.search(pattern, line, re.IGNORECASE) for pattern in self.TITLE_BLACKLIST_PATTERNS):
+        filtered_positions = []
+        raw_lines = text.split('\n')
+        if text.isascii():
+            # Blacklist patterns never match at the line edges, so the
+            # unstripped bytes line gives the same result as the stripped one
+            blacklist_search = self._BLACKLIST_BYTES_RE.search
+            search_lines = text.encode('ascii').split(b'\n')
+        else:
+            blacklist_search = self._BLACKLIST_RE.search
+            search_lines = raw_lines
+        for raw_line, search_line in zip(raw_lines, search_lines):
+            line = raw_line.strip()
+            if len(line) <= 3:
                 continue
-            filtered_lines.append(line)
+            if not blacklist_search(search_line):
+                filtered_lines.append(line)
+                filtered_positions.append(len(lines))
+            lines.append(line)
 
         # Extract title
-        title = self._extract_title(filtered_lines)
+        title, title_filtered_idx = self._find_title(filtered_lines)
 
-        # Extract authors
-        authors = self._extract_authors(lines, title)
+        # Extract authors from the lines following the title
+        authors = None
+        if title:
+            authors = self._extract_authors(lines, filtered_positions[title_filtered_idx])
 
         # Extract journal
         journal = self._extract_journal(lines)
@@ -353,65 +718,67 @@ class PDFProcessor:
         Returns:
             Title if found, None otherwise
         """
+        return self._find_title(filtered_lines)[0]
+
+    def _find_title(self, filtered_lines: list) -> Tuple[Optional[str], int]:
+        """
+        Find the title and its position in the filtered lines.
+
+        Args:
+            filtered_lines: Lines with blacklisted content removed
+
+        Returns:
+            Tuple of (title, index in filtered_lines), or (None, -1)
+        """
         title_candidates = []
 
         # Look for lines with typical title characteristics
-        for line in filtered_lines[:min(30, len(filtered_lines))]:
+        for idx, line in enumerate(filtered_lines[:30]):
             # Skip very short lines and lines starting with numbers
-            if len(line) < 10 or re.match(r'^\d', line):
+            if len(line) < 10 or self._LEADING_DIGIT_RE.match(line):
+                continue
+
+            if len(line) >= 200:  # Title shouldn't be too long
                 continue
 
             # Check for lines that might be titles (uppercase or title case)
-            if line.isupper() or sum(1 for c in line if c.isupper()) >= 2:
-                if len(line) < 200:  # Title shouldn't be too long
-                    title_candidates.append((line, filtered_lines.index(line)))
+            is_upper = line.isupper()
+            if is_upper or sum(map(str.isupper, line)) >= 2:
+                title_candidates.append((line, idx, is_upper))
 
-        # Sort candidates by position (earlier in document more likely to be title)
-        title_candidates.sort(key=lambda x: x[1])
+        # Candidates are collected in document order (earlier in document
+        # more likely to be title)
 
         if title_candidates:
             # Prefer all-caps titles, which are common in academic papers
-            all_caps_candidates = [t for t, idx in title_candidates if t.isupper()]
-            if all_caps_candidates:
-                return all_caps_candidates[0]
-            else:
-                return title_candidates[0][0]
+            for line, idx, upper in title_candidates:
+                if upper:
+                    return line, idx
+            line, idx, _ = title_candidates[0]
+            return line, idx
 
-        return None
+        return None, -1
 
-    def _extract_authors(self, lines: list, title: Optional[str]) -> Optional[str]:
+    def _extract_authors(self, lines: list, title_idx: int) -> Optional[str]:
         """
         Extract authors from lines.
 
         Args:
             lines: All extracted lines
-            title: Extracted title (used to find author position)
+            title_idx: Position of the title in lines (authors follow it)
 
         Returns:
             Authors if found, None otherwise
         """
-        if not title:
-            return None
-
-        # Find title position
-        title_idx = -1
-        for i, line in enumerate(lines):
-            if title in line:
-                title_idx = i
-                break
-
-        if title_idx < 0:
-            return None
-
         # Look at the next few lines for author information
-        for i in range(title_idx + 1, min(title_idx + 10, len(lines))):
-            # Author lines often contain names (capitalized words)
-            name_pattern = r'([A-Z][a-z]+ [A-Z][a-z]+)'
-            if re.search(name_pattern, lines[i]) and not lines[i].isupper():
+        for line in lines[title_idx + 1:title_idx + 10]:
+            # Author lines often contain names (capitalized words). A name
+            # match includes lowercase letters, so it also rules out all-caps
+            # lines.
+            if self._NAME_RE.search(line):
                 # Check it's not a blacklisted line
-                if not any(re.search(pattern, lines[i], re.IGNORECASE)
-                          for pattern in self.TITLE_BLACKLIST_PATTERNS):
-                    return lines[i]
+                if not self._BLACKLIST_RE.search(line):
+                    return line
 
         return None
 
@@ -426,11 +793,7 @@ class PDFProcessor:
             Journal name if found, None otherwise
         """
         for line in lines:
-            journal_match = re.search(
-                r'(Journal of|Proceedings of|Transactions of|Review of).*',
-                line,
-                re.IGNORECASE
-            )
+            journal_match = self._JOURNAL_RE.search(line)
             if journal_match:
                 return journal_match.group(0)
 
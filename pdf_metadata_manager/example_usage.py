@@ -6,49 +6,60 @@ This script demonstrates how to use the PDFProcessor to extract metadata from PD
 """
 
 import sys
-from core.pdf_processor import PDFProcessor, PDFNotFoundError, PDFProcessingError
+from pathlib import Path
+
+# Make the pdf_metadata_manager package importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf_metadata_manager.core.pdf_processor import PDFProcessor, PDFNotFoundError, PDFProcessingError
+
+
+def print_metadata(pdf_path, metadata):
+    """Display the metadata extracted from a single PDF."""
+    print(f"\n{'='*60}")
+    print(f"EXTRACTED METADATA: {pdf_path}")
+    print(f"{'='*60}")
+    print(f"Title:    {metadata.title or 'Not found'}")
+    print(f"Authors:  {metadata.authors or 'Not found'}")
+    print(f"Journal:  {metadata.journal or 'Not found'}")
+    print(f"Year:     {metadata.year or 'Not found'}")
+    print(f"DOI:      {metadata.doi or 'Not found'}")
+    print(f"Used OCR: {metadata.used_ocr}")
+    print(f"Text length: {len(metadata.extracted_text)} characters")
+    print(f"{'='*60}\n")
+
+    # Show first 500 characters of extracted text
+    if metadata.extracted_text:
+        print("First 500 characters of extracted text:")
+        print("-" * 60)
+        print(metadata.extracted_text[:500])
+        print("-" * 60)
 
 
 def main():
     """Main function to demonstrate PDF processing."""
     if len(sys.argv) < 2:
-        print("Usage: python example_usage.py <pdf_file>")
+        print("Usage: python example_usage.py <pdf_file> [<pdf_file> ...]")
         print("\nExample:")
-        print("  python example_usage.py ../set-pdf-metadata.py")
+        print("  python example_usage.py paper1.pdf paper2.pdf")
         sys.exit(1)
 
-    pdf_path = sys.argv[1]
+    pdf_paths = sys.argv[1:]
 
     # Create a PDF processor with OCR enabled and verbose output
     processor = PDFProcessor(use_ocr=True, ocr_pages=2, verbose=True)
 
     try:
-        # Extract metadata from the PDF
+        # Extract metadata from all PDFs in parallel
         print(f"\n{'='*60}")
-        print(f"Processing PDF: {pdf_path}")
+        print(f"Processing {len(pdf_paths)} PDF(s)")
         print(f"{'='*60}\n")
 
-        metadata = processor.extract_metadata(pdf_path)
+        results = processor.extract_metadata_batch(pdf_paths)
 
         # Display the results
-        print(f"\n{'='*60}")
-        print("EXTRACTED METADATA")
-        print(f"{'='*60}")
-        print(f"Title:    {metadata.title or 'Not found'}")
-        print(f"Authors:  {metadata.authors or 'Not found'}")
-        print(f"Journal:  {metadata.journal or 'Not found'}")
-        print(f"Year:     {metadata.year or 'Not found'}")
-        print(f"DOI:      {metadata.doi or 'Not found'}")
-        print(f"Used OCR: {metadata.used_ocr}")
-        print(f"Text length: {len(metadata.extracted_text)} characters")
-        print(f"{'='*60}\n")
-
-        # Show first 500 characters of extracted text
-        if metadata.extracted_text:
-            print("First 500 characters of extracted text:")
-            print("-" * 60)
-            print(metadata.extracted_text[:500])
-            print("-" * 60)
+        for pdf_path, metadata in zip(pdf_paths, results):
+            print_metadata(pdf_path, metadata)
 
     except PDFNotFoundError as e:
         print(f"Error: {e}")
@@ -6,48 +6,73 @@ Update PDF metadata from academic sources like Crossref, with interactive
 or batch processing modes.
 """
 
+from __future__ import annotations
+
 import argparse
 import os
 import sys
 import signal
-from pathlib import Path
-from typing import List, Optional, Tuple
-
-from pdf_metadata_manager.core import (
-    PDFProcessor,
-    PDFMetadata,
-    PDFProcessingError,
-    PDFNotFoundError,
-    CrossrefClient,
-    CrossrefMatch,
-    CrossrefConnectionError,
-    CrossrefAPIError,
-    MetadataUpdater,
-    MetadataUpdate,
-    PDFUpdateError,
-    FileOperationError,
-    parse_filename,
-    FilenameHints
+import time
+from collections import Counter
+from collections.abc import Sized
+from functools import cached_property
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 )
-from pdf_metadata_manager.ui import InteractiveUI, UserQuitError
+from itertools import chain, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
 from pdf_metadata_manager.utils import SessionLogger
 
+if TYPE_CHECKING:
+    from pdf_metadata_manager import core, ui
+
+
+def _load_core() -> None:
+    """
+    Import the core and UI modules.
+
+    They pull in pikepdf, pypdf and requests, so they are only imported once
+    a PDFMetadataManager is created; --help and invalid arguments don't wait
+    for them.
+    """
+    global core, ui
+    from pdf_metadata_manager import core, ui
+
 
 class PDFMetadataManager:
     """Main orchestrator for PDF metadata processing."""
 
+    # Maximum number of retries per file before giving up
+    MAX_RETRIES = 5
+
+    # Minimum filename hint confidence to search Crossref during extraction
+    SPECULATIVE_SEARCH_CONFIDENCE = 0.7
+
+    # Minimum seconds between progress updates when the total is unknown
+    PROGRESS_INTERVAL = 0.1
+
+    # Files queued per worker process in parallel batch mode
+    MAX_QUEUED_PER_WORKER = 2
+
     def __init__(
         self,
         email: str,
         use_ocr: bool = True,
         ocr_pages: int = 1,
+        ocr_dpi: int = 200,
+        use_cache: bool = True,
         keep_backup: bool = False,
         retries: int = 3,
         verbose: bool = False,
         quiet: bool = False,
         batch_mode: bool = False,
         rename: bool = True,
-        log_path: Optional[str] = None
+        log_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        ocr_workers: Optional[int] = None,
+        rate_limit_share: int = 1
     ):
         """
         Initialize PDF Metadata Manager.
@@ -56,6 +81,8 @@ class PDFMetadataManager:
             email: Email for Crossref API (polite pool)
             use_ocr: Enable OCR fallback for scanned documents
             ocr_pages: Number of pages to OCR (default: 1)
+            ocr_dpi: Resolution for rendering pages to OCR (default: 200)
+            use_cache: Cache extracted PDF metadata and Crossref responses
             keep_backup: Keep .bak copy of original files
             retries: Number of retry attempts for Crossref API
             verbose: Show detailed information
@@ -63,333 +90,535 @@ class PDFMetadataManager:
             batch_mode: Auto-accept high-confidence matches
             rename: Rename files to Zotero format
             log_path: Custom log file path
+            workers: Number of worker processes in batch mode
+                (default: number of CPUs)
+            ocr_workers: Number of processes OCR'ing the pages of one PDF
+                (default: number of CPUs)
+            rate_limit_share: Number of processes splitting Crossref's rate
+                limit (the pool size, for the worker processes)
         """
+        _load_core()
+
         self.batch_mode = batch_mode
         self.rename = rename
+        self.workers = workers or os.cpu_count() or 1
+        # Number of files whose DOIs are looked up together in batch mode,
+        # one bulk request per chunk
+        self.prefetch_chunk = core.CrossrefClient.BULK_DOI_CHUNK
+
+        # Settings for the components created on first use, and for
+        # recreating this manager in worker processes
+        self._worker_config = {
+            'email': email,
+            'use_ocr': use_ocr,
+            'ocr_pages': ocr_pages,
+            'ocr_dpi': ocr_dpi,
+            'use_cache': use_cache,
+            'keep_backup': keep_backup,
+            'retries': retries,
+            'rename': rename,
+            'verbose': verbose,
+            'quiet': quiet
+        }
 
-        # Initialize components
-        self.pdf_processor = PDFProcessor(
-            use_ocr=use_ocr,
-            ocr_pages=ocr_pages,
-            verbose=verbose
-        )
-        self.crossref_client = CrossrefClient(
-            email=email,
-            retries=retries
-        )
-        self.metadata_updater = MetadataUpdater(keep_backup=keep_backup)
-        self.ui = InteractiveUI(verbose=verbose, quiet=quiet)
+        self._ocr_workers = ocr_workers
+        self._rate_limit_share = rate_limit_share
+
+        # Initialize components (pdf_processor and crossref_client are
+        # created on first use, since the parent process in parallel batch
+        # mode may never need them)
+        self.metadata_updater = core.MetadataUpdater(keep_backup=keep_backup)
+        # Batch mode never prompts, so messages can be written once per file
+        self.ui = ui.InteractiveUI(verbose=verbose, quiet=quiet, buffered=batch_mode)
 
         # Settings for logging
         settings = {
             'use_ocr': use_ocr,
             'ocr_pages': ocr_pages,
+            'ocr_dpi': ocr_dpi,
+            'use_cache': use_cache,
             'keep_backup': keep_backup,
             'batch_mode': batch_mode,
             'rename': rename,
-            'retries': retries
+            'retries': retries,
+            'workers': self.workers
         }
         self.logger = SessionLogger(log_path=log_path, settings=settings)
 
         # Statistics
-        self.stats = {
-            'completed': 0,
-            'skipped': 0,
-            'failed': 0
-        }
+        self.stats = Counter(completed=0, skipped=0, failed=0)
+        self._last_progress_time = 0.0
+
+    @cached_property
+    def pdf_processor(self) -> core.PDFProcessor:
+        """PDF metadata extractor, created on first use."""
+        config = self._worker_config
+        return core.PDFProcessor(
+            use_ocr=config['use_ocr'],
+            ocr_pages=config['ocr_pages'],
+            verbose=config['verbose'],
+            ocr_dpi=config['ocr_dpi'],
+            use_cache=config['use_cache'],
+            ocr_workers=self._ocr_workers
+        )
+
+    @cached_property
+    def crossref_client(self) -> core.CrossrefClient:
+        """Crossref API client, created on first use."""
+        config = self._worker_config
+        return core.CrossrefClient(
+            email=config['email'],
+            retries=config['retries'],
+            use_cache=config['use_cache'],
+            rate_limit_share=self._rate_limit_share
+        )
+
+    @cached_property
+    def _search_executor(self) -> ThreadPoolExecutor:
+        """Thread running speculative Crossref searches, created on first use."""
+        return ThreadPoolExecutor(max_workers=1)
 
     def process_single_pdf(self, pdf_path: str) -> str:
         """
         Process a single PDF file.
 
+        Retries (requested by the user or after connection errors) only
+        repeat the Crossref lookup; the PDF is parsed once.
+
         Args:
             pdf_path: Path to the PDF file
 
         Returns:
             'completed', 'skipped', or 'failed'
         """
-        try:
-            # Convert to absolute path to avoid issues with relative paths
-            pdf_path = str(Path(pdf_path).resolve())
+        filename = Path(pdf_path).name
+        filename_hints = None
+        pdf_metadata = None
+        speculative_search = None
+        filename_matches = None
 
-            if not self.ui.quiet:
-                print(f"\n{'='*60}")
-                print(f"Processing: {Path(pdf_path).name}")
-                print(f"{'='*60}")
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                if pdf_metadata is None:
+                    # Convert to absolute path to avoid issues with relative paths
+                    path = Path(pdf_path).resolve()
+                    pdf_path = str(path)
+                    filename = path.name
 
-            # Step 1: Parse filename hints
-            filename_hints = parse_filename(Path(pdf_path).name)
+                    self.ui.section(f"Processing: {filename}")
 
-            if self.ui.verbose:
-                print(f"\nFilename hints: author={filename_hints.author}, "
-                      f"year={filename_hints.year}, confidence={filename_hints.confidence:.2f}")
+                    # Step 1: Parse filename hints
+                    filename_hints = core.parse_filename(filename)
 
-            # Step 2: Extract PDF metadata
-            if not self.ui.quiet:
-                print("Extracting PDF metadata...")
-
-            pdf_metadata = self.pdf_processor.extract_metadata(pdf_path)
+                    if self.ui.verbose:
+                        self.ui.info(f"\nFilename hints: author={filename_hints.author}, "
+                                     f"year={filename_hints.year}, confidence={filename_hints.confidence:.2f}")
+
+                    # Step 2: Extract PDF metadata, unless a DOI in the
+                    # filename already identifies the paper
+                    if filename_hints.doi:
+                        filename_matches = self._resolve_filename_doi(filename_hints.doi)
+                    if filename_matches:
+                        pdf_metadata = core.PDFMetadata(doi=filename_hints.doi)
+                    else:
+                        # Search Crossref with the filename hints meanwhile
+                        speculative_search = self._start_speculative_search(filename_hints)
+                        self.ui.info("Extracting PDF metadata...")
+
+                        pdf_metadata = self.pdf_processor.extract_metadata(pdf_path)
+
+                        if self.ui.verbose:
+                            self.ui.info(f"Extracted DOI: {pdf_metadata.doi or 'Not found'}\n"
+                                         f"Extracted title: {pdf_metadata.title or 'Not found'}\n"
+                                         f"Used OCR: {pdf_metadata.used_ocr}")
+                else:
+                    self.ui.info(f"\nRetrying: {filename}")
 
-            if self.ui.verbose:
-                print(f"Extracted DOI: {pdf_metadata.doi or 'Not found'}")
-                print(f"Extracted title: {pdf_metadata.title or 'Not found'}")
-                print(f"Used OCR: {pdf_metadata.used_ocr}")
+                result = self._lookup_and_update(
+                    pdf_path,
+                    filename_hints,
+                    pdf_metadata,
+                    speculative_search if attempt == 0 else None,
+                    filename_matches if attempt == 0 else None
+                )
+                if result != 'retry':
+                    return result
 
-            # Step 3: Search Crossref
-            if not self.ui.quiet:
-                print("Searching Crossref API...")
+            except ui.UserQuitError:
+                raise  # Propagate quit signal
 
-            # Build search query from extracted metadata and filename hints
-            search_title = pdf_metadata.title or filename_hints.title
-            search_author = pdf_metadata.authors or filename_hints.author
-            search_year = pdf_metadata.year or filename_hints.year
+            except core.PDFNotFoundError as e:
+                self.ui.info(f"❌ Error: {e}")
+                self.logger.log_failure(pdf_path, str(e))
+                return 'failed'
 
-            if pdf_metadata.doi:
-                # If we have a DOI, fetch metadata directly
-                try:
-                    metadata_dict = self.crossref_client.fetch_metadata(pdf_metadata.doi)
-                    # Convert to CrossrefMatch for consistency
-                    matches = [self._metadata_dict_to_match(metadata_dict, 1.0)]
-                except (CrossrefConnectionError, CrossrefAPIError) as e:
-                    if self.ui.verbose:
-                        print(f"DOI lookup failed: {e}")
-                    # Fall back to search
-                    matches = self.crossref_client.search(
-                        title=search_title,
-                        author=search_author,
-                        year=search_year,
-                        max_results=5
+            except (core.PDFProcessingError, core.PDFUpdateError, core.FileOperationError) as e:
+                # Handle errors interactively
+                if self.batch_mode:
+                    self.ui.info(f"❌ Error: {e}")
+                    self.logger.log_failure(pdf_path, str(e))
+                    return 'failed'
+                else:
+                    choice = self.ui.handle_error(
+                        filename,
+                        e,
+                        retryable=False
                     )
-            else:
-                matches = self.crossref_client.search(
-                    title=search_title,
-                    author=search_author,
-                    year=search_year,
-                    max_results=5
-                )
 
-            if not matches:
-                if not self.ui.quiet:
-                    print("⚠️  No matches found in Crossref")
-                self.logger.log_skip(pdf_path, "No Crossref matches found")
-                return 'skipped'
+                    if choice == 'quit':
+                        raise ui.UserQuitError()
 
-            # Step 4: Select match (batch or interactive)
-            selected_match = None
+                    self.logger.log_failure(pdf_path, str(e))
+                    return 'failed'
 
-            if self.batch_mode:
-                # Auto-accept if high confidence
-                if matches[0].score >= 0.80:
-                    selected_match = matches[0]
-                    if not self.ui.quiet:
-                        print(f"✓ Auto-selected (score: {matches[0].score:.2f})")
+            except (core.CrossrefConnectionError, core.CrossrefAPIError) as e:
+                # Connection errors can be retried
+                if self.batch_mode:
+                    self.ui.info(f"❌ Connection error: {e}")
+                    self.logger.log_failure(pdf_path, str(e))
+                    return 'failed'
                 else:
-                    if not self.ui.quiet:
-                        print(f"⚠️  Skipped - confidence too low ({matches[0].score:.2f} < 0.80)")
-                    self.logger.log_skip(
-                        pdf_path,
-                        f"Confidence below threshold: {matches[0].score:.2f}"
+                    choice = self.ui.handle_error(
+                        filename,
+                        e,
+                        retryable=True
                     )
-                    return 'skipped'
-            else:
-                # Interactive mode
-                selected_match = self.ui.display_matches(
-                    matches,
-                    Path(pdf_path).name,
-                    filename_hints
-                )
 
-                # Handle special return values from display_matches
-                if selected_match is None:
-                    self.logger.log_skip(pdf_path, "User skipped")
-                    return 'skipped'
-                elif selected_match == 'retry':
-                    # User requested retry - recursive call
-                    return self.process_single_pdf(pdf_path)
-                elif isinstance(selected_match, tuple) and selected_match[0] == 'manual':
-                    # User entered manual DOI
-                    manual_doi = selected_match[1]
-                    try:
-                        metadata_dict = self.crossref_client.fetch_metadata(manual_doi)
-                        selected_match = self._metadata_dict_to_match(metadata_dict, 1.0)
-                    except (CrossrefConnectionError, CrossrefAPIError) as e:
-                        if not self.ui.quiet:
-                            print(f"❌ Failed to fetch metadata for DOI: {e}")
-                        self.logger.log_failure(pdf_path, f"Invalid DOI: {manual_doi}")
+                    if choice == 'retry':
+                        continue
+                    elif choice == 'quit':
+                        raise ui.UserQuitError()
+                    else:
+                        self.logger.log_failure(pdf_path, str(e), attempts=attempt + 1)
                         return 'failed'
 
-            # Step 5: Prepare metadata update
-            metadata_update = self._match_to_metadata_update(selected_match)
+            except Exception as e:
+                self.ui.info(f"❌ Unexpected error: {e}")
+                if self.ui.verbose:
+                    import traceback
+                    self.ui.info(traceback.format_exc().rstrip())
+                self.logger.log_failure(pdf_path, f"Unexpected error: {e}")
+                return 'failed'
 
-            # Generate new filename
-            if self.rename:
-                new_filename = self.metadata_updater.generate_zotero_filename(
-                    metadata_update,
-                    pdf_path
-                )
-            else:
-                new_filename = Path(pdf_path).name
-
-            # Step 6: Confirm (if not batch mode)
-            if not self.batch_mode:
-                confirmed = self.ui.confirm_metadata(
-                    Path(pdf_path).name,
-                    metadata_update,
-                    new_filename
-                )
+        self.ui.info(f"❌ Giving up after {self.MAX_RETRIES} retries")
+        self.logger.log_failure(
+            pdf_path,
+            f"Gave up after {self.MAX_RETRIES} retries",
+            attempts=self.MAX_RETRIES + 1
+        )
+        return 'failed'
+
+    def _lookup_and_update(
+        self,
+        pdf_path: str,
+        filename_hints: core.FilenameHints,
+        pdf_metadata: core.PDFMetadata,
+        speculative_search: Optional[Tuple[tuple, Future]] = None,
+        matches: Optional[List[core.CrossrefMatch]] = None
+    ) -> str:
+        """
+        Find the Crossref match for a PDF and apply it.
 
-                if not confirmed:
-                    self.logger.log_skip(pdf_path, "User declined metadata")
-                    return 'skipped'
+        Args:
+            pdf_path: Absolute path to the PDF file
+            filename_hints: Hints parsed from the filename
+            pdf_metadata: Metadata extracted from the PDF
+            speculative_search: Search started by _start_speculative_search(),
+                used if it was made with the same query
+            matches: Matches found already (for a DOI in the filename), in
+                which case Crossref is not searched
 
-            # Step 7: Update PDF metadata
-            if not self.ui.quiet:
-                print("Updating PDF metadata...")
+        Returns:
+            'completed', 'skipped', 'failed', or 'retry' if the user asked
+            to search again
+
+        Raises:
+            CrossrefConnectionError: If Crossref cannot be reached
+            CrossrefAPIError: For non-retryable API errors
+            PDFUpdateError: If the PDF metadata cannot be written
+            FileOperationError: If the file cannot be renamed
+        """
+        filename = Path(pdf_path).name
+
+        # Step 3: Search Crossref
+        if matches is None:
+            matches = self._find_matches(filename_hints, pdf_metadata, speculative_search)
 
-            self.metadata_updater.update_metadata(pdf_path, metadata_update)
+        if not matches:
+            self.ui.info("⚠️  No matches found in Crossref")
+            self.logger.log_skip(pdf_path, "No Crossref matches found")
+            return 'skipped'
 
-            # Step 8: Rename file
-            new_path = pdf_path
-            if self.rename:
-                if not self.ui.quiet:
-                    print(f"Renaming to: {new_filename}")
+        # Step 4: Select match (batch or interactive)
+        selected_match = None
 
-                new_path = self.metadata_updater.rename_file(
+        if self.batch_mode:
+            # Auto-accept if high confidence
+            if matches[0].score >= 0.80:
+                selected_match = matches[0]
+                self.ui.info(f"✓ Auto-selected (score: {matches[0].score:.2f})")
+            else:
+                self.ui.info(f"⚠️  Skipped - confidence too low ({matches[0].score:.2f} < 0.80)")
+                self.logger.log_skip(
                     pdf_path,
-                    new_filename
+                    f"Confidence below threshold: {matches[0].score:.2f}"
                 )
+                return 'skipped'
+        else:
+            # Interactive mode
+            selected_match = self.ui.display_matches(
+                matches,
+                filename,
+                filename_hints
+            )
+
+            # Handle special return values from display_matches
+            if selected_match is None:
+                self.logger.log_skip(pdf_path, "User skipped")
+                return 'skipped'
+            elif selected_match is ui.RETRY:
+                return 'retry'
+            elif isinstance(selected_match, ui.ManualDOI):
+                manual_doi = selected_match.doi
+                try:
+                    selected_match = self._resolve_doi(manual_doi)
+                except (core.CrossrefConnectionError, core.CrossrefAPIError) as e:
+                    self.ui.info(f"❌ Failed to fetch metadata for DOI: {e}")
+                    self.logger.log_failure(pdf_path, f"Invalid DOI: {manual_doi}")
+                    return 'failed'
 
-            # Step 9: Log success
-            self.logger.log_success(
-                original_path=pdf_path,
-                new_path=new_path,
-                doi=selected_match.doi,
-                confidence=selected_match.score,
-                used_ocr=pdf_metadata.used_ocr
+        # Step 5: Prepare metadata update
+        metadata_update = self._match_to_metadata_update(selected_match)
+
+        # Generate new filename
+        if self.rename:
+            new_filename = self.metadata_updater.generate_zotero_filename(
+                metadata_update,
+                pdf_path
+            )
+        else:
+            new_filename = filename
+
+        # Step 6: Confirm (if not batch mode)
+        if not self.batch_mode:
+            confirmed = self.ui.confirm_metadata(
+                filename,
+                metadata_update,
+                new_filename
             )
 
-            if not self.ui.quiet:
-                print(f"✓ Successfully processed")
+            if not confirmed:
+                self.logger.log_skip(pdf_path, "User declined metadata")
+                return 'skipped'
 
-            return 'completed'
+        # Step 7: Update PDF metadata
+        self.ui.info("Updating PDF metadata...")
 
-        except UserQuitError:
-            raise  # Propagate quit signal
+        self.metadata_updater.update_metadata(pdf_path, metadata_update)
 
-        except PDFNotFoundError as e:
-            if not self.ui.quiet:
-                print(f"❌ Error: {e}")
-            self.logger.log_failure(pdf_path, str(e))
-            return 'failed'
-
-        except (PDFProcessingError, PDFUpdateError, FileOperationError) as e:
-            # Handle errors interactively
-            if self.batch_mode:
-                if not self.ui.quiet:
-                    print(f"❌ Error: {e}")
-                self.logger.log_failure(pdf_path, str(e))
-                return 'failed'
-            else:
-                choice = self.ui.handle_error(
-                    Path(pdf_path).name,
-                    e,
-                    retryable=False
-                )
+        # Step 8: Rename file
+        new_path = pdf_path
+        if self.rename:
+            self.ui.info(f"Renaming to: {new_filename}")
 
-                if choice == 'quit':
-                    raise UserQuitError()
+            new_path = self.metadata_updater.rename_file(
+                pdf_path,
+                new_filename
+            )
 
-                self.logger.log_failure(pdf_path, str(e))
-                return 'failed'
+        # Step 9: Log success
+        self.logger.log_success(
+            original_path=pdf_path,
+            new_path=new_path,
+            doi=selected_match.doi,
+            confidence=selected_match.score,
+            used_ocr=pdf_metadata.used_ocr
+        )
 
-        except (CrossrefConnectionError, CrossrefAPIError) as e:
-            # Connection errors can be retried
-            if self.batch_mode:
-                if not self.ui.quiet:
-                    print(f"❌ Connection error: {e}")
-                self.logger.log_failure(pdf_path, str(e))
-                return 'failed'
+        self.ui.info("✓ Successfully processed")
+
+        return 'completed'
+
+    def _find_matches(
+        self,
+        filename_hints: core.FilenameHints,
+        pdf_metadata: core.PDFMetadata,
+        speculative_search: Optional[Tuple[tuple, Future]] = None
+    ) -> List[core.CrossrefMatch]:
+        """
+        Look up a PDF on Crossref by its DOI, or search for it.
+
+        Args:
+            filename_hints: Hints parsed from the filename
+            pdf_metadata: Metadata extracted from the PDF
+            speculative_search: Search started by _start_speculative_search()
+
+        Returns:
+            List of CrossrefMatch objects sorted by score (highest first)
+
+        Raises:
+            CrossrefConnectionError: If Crossref cannot be reached
+            CrossrefAPIError: For non-retryable API errors
+        """
+        self.ui.info("Searching Crossref API...")
+
+        # Build search query from extracted metadata and filename hints
+        search_title = pdf_metadata.title or filename_hints.title
+        search_author = pdf_metadata.authors or filename_hints.author
+        search_year = pdf_metadata.year or filename_hints.year
+
+        if pdf_metadata.doi:
+            # If we have a DOI, fetch metadata directly
+            try:
+                matches = [self._resolve_doi(pdf_metadata.doi)]
+            except (core.CrossrefConnectionError, core.CrossrefAPIError) as e:
+                if self.ui.verbose:
+                    self.ui.info(f"DOI lookup failed: {e}")
+                # Fall back to search
             else:
-                choice = self.ui.handle_error(
-                    Path(pdf_path).name,
-                    e,
-                    retryable=True
-                )
+                self._drop_speculative_search(speculative_search)
+                return matches
 
-                if choice == 'retry':
-                    # Recursive retry
-                    return self.process_single_pdf(pdf_path)
-                elif choice == 'quit':
-                    raise UserQuitError()
-                else:
-                    self.logger.log_failure(pdf_path, str(e))
-                    return 'failed'
+        return self._search_crossref(
+            search_title, search_author, search_year, speculative_search
+        )
 
-        except Exception as e:
-            if not self.ui.quiet:
-                print(f"❌ Unexpected error: {e}")
-            if self.ui.verbose:
-                import traceback
-                traceback.print_exc()
-            self.logger.log_failure(pdf_path, f"Unexpected error: {e}")
-            return 'failed'
+    def _start_speculative_search(
+        self,
+        filename_hints: core.FilenameHints
+    ) -> Optional[Tuple[tuple, Future]]:
+        """
+        Start searching Crossref with the filename hints in the background.
 
-    def _metadata_dict_to_match(self, metadata: dict, score: float) -> CrossrefMatch:
-        """Convert Crossref metadata dict to CrossrefMatch.
+        Hides the search latency behind PDF extraction (and OCR) when the
+        filename is informative. Only done in interactive mode: in batch mode
+        files already overlap each other, and most have a DOI.
 
-        Handles both:
-        - Raw Crossref API responses (uppercase 'DOI', 'author' as list of dicts)
-        - Processed metadata from fetch_metadata() (lowercase 'doi', 'authors' as list of strings)
+        Args:
+            filename_hints: Hints parsed from the filename
+
+        Returns:
+            Tuple of ((title, author, year), search future), or None if no
+            search was started
+        """
+        if self.batch_mode or filename_hints.confidence < self.SPECULATIVE_SEARCH_CONFIDENCE:
+            return None
+
+        query = (filename_hints.title, filename_hints.author, filename_hints.year)
+        future = self._search_executor.submit(
+            self.crossref_client.search,
+            title=query[0],
+            author=query[1],
+            year=query[2],
+            max_results=5
+        )
+        return query, future
+
+    def _drop_speculative_search(
+        self,
+        speculative_search: Optional[Tuple[tuple, Future]]
+    ) -> None:
         """
-        authors = []
-
-        # Handle both raw API format and processed format
-        if 'authors' in metadata and isinstance(metadata['authors'], list):
-            # Processed format: already a list of formatted strings
-            authors = metadata['authors']
-        elif 'author' in metadata:
-            # Raw API format: list of author dictionaries
-            for author in metadata['author']:
-                if 'family' in author:
-                    given = author.get('given', '')
-                    authors.append(f"{author['family']}, {given}" if given else author['family'])
-
-        year = None
-        if 'year' in metadata:
-            # Processed format
-            year = metadata['year']
-        elif 'published-print' in metadata:
-            year = str(metadata['published-print']['date-parts'][0][0])
-        elif 'published-online' in metadata:
-            year = str(metadata['published-online']['date-parts'][0][0])
-
-        journal = None
-        if 'journal' in metadata:
-            # Processed format
-            journal = metadata['journal']
-        elif 'container-title' in metadata and metadata['container-title']:
-            journal = metadata['container-title'][0]
-
-        # Handle both 'doi' and 'DOI' keys
-        doi = metadata.get('doi') or metadata.get('DOI', '')
-
-        # Handle both title formats
-        title = metadata.get('title', '')
-        if isinstance(title, list):
-            title = title[0] if title else ''
-
-        return CrossrefMatch(
-            doi=doi,
+        Give up on a speculative search whose result won't be used.
+
+        The search is cancelled if it hasn't started yet; a running search
+        can't be stopped, so its result is just ignored.
+
+        Args:
+            speculative_search: Search started by _start_speculative_search()
+        """
+        if speculative_search is not None:
+            speculative_search[1].cancel()
+
+    def _search_crossref(
+        self,
+        title: Optional[str],
+        author: Optional[str],
+        year: Optional[str],
+        speculative_search: Optional[Tuple[tuple, Future]] = None
+    ) -> List[core.CrossrefMatch]:
+        """
+        Search Crossref, reusing the speculative search if it had this query.
+
+        Args:
+            title: Title to search for
+            author: Author name or hint
+            year: Publication year
+            speculative_search: Search started by _start_speculative_search()
+
+        Returns:
+            List of CrossrefMatch objects sorted by score (highest first)
+
+        Raises:
+            CrossrefConnectionError: If Crossref cannot be reached
+            CrossrefAPIError: For non-retryable API errors
+        """
+        if speculative_search is not None and speculative_search[0] == (title, author, year):
+            return speculative_search[1].result()
+        self._drop_speculative_search(speculative_search)
+        return self.crossref_client.search(
             title=title,
-            authors=authors,
+            author=author,
             year=year,
-            journal=journal,
+            max_results=5
+        )
+
+    def _resolve_filename_doi(self, doi: str) -> Optional[List[core.CrossrefMatch]]:
+        """
+        Look up a DOI found in the filename.
+
+        Args:
+            doi: DOI from the filename hints
+
+        Returns:
+            List with the match for the DOI, or None if the lookup failed
+            and the PDF should be extracted instead
+        """
+        self.ui.info(f"Looking up DOI from filename: {doi}")
+        try:
+            return [self._resolve_doi(doi)]
+        except (core.CrossrefConnectionError, core.CrossrefAPIError) as e:
+            if self.ui.verbose:
+                self.ui.info(f"DOI lookup failed: {e}")
+            return None
+
+    def _resolve_doi(self, doi: str) -> core.CrossrefMatch:
+        """
+        Look up a DOI on Crossref.
+
+        Args:
+            doi: DOI to look up
+
+        Returns:
+            CrossrefMatch for the DOI, with a score of 1.0
+
+        Raises:
+            CrossrefConnectionError: If Crossref cannot be reached
+            CrossrefAPIError: If the lookup fails or Crossref has no record
+        """
+        metadata = self.crossref_client.fetch_metadata(doi)
+        if not metadata:
+            raise core.CrossrefAPIError(f"No Crossref record for DOI: {doi}")
+        return self._processed_to_match(metadata, 1.0)
+
+    def _processed_to_match(self, metadata: dict, score: float) -> core.CrossrefMatch:
+        """Convert processed metadata from fetch_metadata() to CrossrefMatch.
+
+        Processed metadata has lowercase keys and 'authors' as a list of
+        formatted strings.
+        """
+        return core.CrossrefMatch(
+            doi=metadata.get('doi') or '',
+            title=metadata.get('title', ''),
+            authors=metadata.get('authors') or [],
+            year=metadata.get('year'),
+            journal=metadata.get('journal'),
             score=score
         )
 
-    def _match_to_metadata_update(self, match: CrossrefMatch) -> MetadataUpdate:
+    def _match_to_metadata_update(self, match: core.CrossrefMatch) -> core.MetadataUpdate:
         """Convert CrossrefMatch to MetadataUpdate."""
-        return MetadataUpdate(
+        return core.MetadataUpdate(
             title=match.title,
             authors='; '.join(match.authors) if match.authors else '',
             year=match.year,
@@ -397,39 +626,53 @@ class PDFMetadataManager:
             doi=match.doi
         )
 
-    def process_files(self, files: List[str]) -> None:
+    def process_files(self, files: Iterable[str]) -> None:
         """
         Process multiple PDF files.
 
         Args:
-            files: List of PDF file paths
+            files: PDF file paths; may be a lazy iterator, in which case the
+                total is only known once all files have been found
         """
-        total = len(files)
+        total = len(files) if isinstance(files, Sized) else None
+        parallel = self.batch_mode and self.workers > 1 and (total is None or total > 1)
+
+        # Bulk DOI lookups only pay off if the per-file lookups can reuse them.
+        # Worker processes extract the PDFs themselves, so in parallel mode
+        # only the DOIs in filenames are prefetched.
+        if self.batch_mode and self._worker_config['use_cache']:
+            files = self._prefetch_crossref(files, extract=not parallel)
 
         if not self.ui.quiet:
-            print(f"\nProcessing {total} PDF file{'s' if total != 1 else ''}...\n")
+            if total is None:
+                print("\nProcessing PDF files...\n")
+            else:
+                print(f"\nProcessing {total} PDF file{'s' if total != 1 else ''}...\n")
 
         try:
-            for i, pdf_path in enumerate(files, 1):
-                result = self.process_single_pdf(pdf_path)
-                self.stats[result] += 1
-
-                if not self.ui.quiet and total > 1:
-                    self.ui.show_progress(
-                        current=i,
-                        total=total,
-                        completed=self.stats['completed'],
-                        skipped=self.stats['skipped'],
-                        failed=self.stats['failed'],
-                        current_file=Path(pdf_path).name
-                    )
-
-        except (KeyboardInterrupt, UserQuitError):
+            if parallel:
+                self._process_files_parallel(files, total)
+            else:
+                for i, pdf_path in enumerate(files, 1):
+                    try:
+                        with self.ui.capture_stdout():
+                            result = self.process_single_pdf(pdf_path)
+                    finally:
+                        self.ui.flush()
+                    self.stats[result] += 1
+                    self._show_progress(i, total, pdf_path)
+
+        except (KeyboardInterrupt, ui.UserQuitError):
             if not self.ui.quiet:
                 print("\n\n⚠️  Processing interrupted by user")
 
         finally:
+            executor = self.__dict__.pop('_search_executor', None)
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
             self.logger.close()
+            if total is None:
+                total = sum(self.stats.values())
             if not self.ui.quiet:
                 self.ui.print_summary(
                     total=total,
@@ -439,35 +682,226 @@ class PDFMetadataManager:
                     log_path=self.logger.log_path
                 )
 
+    def _process_files_parallel(self, files: Iterable[str], total: Optional[int]) -> None:
+        """
+        Process PDF files in a pool of worker processes (batch mode only).
+
+        Each worker builds its own PDFMetadataManager and sends its output
+        and log entries back with the result, so this process stays the only
+        writer of the terminal and the session log. Files are taken from the
+        iterable as workers free up, keeping only a few per worker queued.
+
+        Args:
+            files: PDF file paths; may be a lazy iterator
+            total: Number of files, or None if not known in advance
+        """
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self._worker_config, self.workers)
+        )
+        files = iter(files)
+        futures = {}
+
+        def submit(count: int) -> None:
+            for pdf_path in islice(files, count):
+                futures[executor.submit(_process_pdf_in_worker, pdf_path)] = pdf_path
 
-def collect_pdf_files(input_path: str, recursive: bool = False) -> List[str]:
+        try:
+            submit(self.MAX_QUEUED_PER_WORKER * self.workers)
+            current = 0
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pdf_path = futures.pop(future)
+                    try:
+                        result, log_entries, output = future.result()
+                    except Exception as e:
+                        result = 'failed'
+                        log_entries = []
+                        output = ""
+                        self.logger.log_failure(pdf_path, f"Unexpected error: {e}")
+                    if output:
+                        sys.stdout.write(output)
+                        sys.stdout.flush()
+                    self.logger.add_results(log_entries)
+                    self.stats[result] += 1
+                    current += 1
+                    self._show_progress(current, total, pdf_path)
+                submit(len(done))
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    def _prefetch_crossref(self, files: Iterable[str], extract: bool = True) -> Iterator[str]:
+        """
+        Yield PDF files, looking up the DOIs of each chunk in bulk first.
+
+        Takes the DOI from the filename of prefetch_chunk files at a time
+        (extracting the PDF metadata of the others if extract is set) and
+        fetches the Crossref records for all their DOIs with a few bulk
+        requests. Both end up in the caches, so processing the files
+        afterwards needs no further DOI requests.
+
+        Args:
+            files: PDF file paths
+            extract: Extract the metadata of files without a DOI in the
+                filename to find their DOIs
+
+        Yields:
+            The same PDF file paths, in order
+        """
+        files = iter(files)
+        while True:
+            chunk = list(islice(files, self.prefetch_chunk))
+            if not chunk:
+                return
+
+            # Files named after their DOI don't need to be extracted
+            dois = []
+            to_extract = []
+            for pdf_path, hints in zip(chunk, core.parse_filenames(chunk)):
+                if hints.doi:
+                    dois.append(hints.doi)
+                elif extract:
+                    to_extract.append(pdf_path)
+
+            if to_extract:
+                results = self.pdf_processor.extract_metadata_batch(
+                    to_extract, max_workers=self.workers, return_exceptions=True
+                )
+                dois.extend(m.doi for m in results if isinstance(m, core.PDFMetadata) and m.doi)
+            if dois:
+                try:
+                    self.crossref_client.fetch_metadata_bulk(dois)
+                except (core.CrossrefConnectionError, core.CrossrefAPIError) as e:
+                    # Not fatal: the files fall back to single DOI lookups
+                    if self.ui.verbose:
+                        self.ui.info(f"  Bulk DOI lookup failed: {e}")
+
+            yield from chunk
+
+    def _show_progress(self, current: int, total: Optional[int], pdf_path: str) -> None:
+        """
+        Show progress after a file has been processed.
+
+        Updates are throttled so large batches don't flood the terminal:
+        about 100 per run for a known total, otherwise one per
+        PROGRESS_INTERVAL seconds.
+        """
+        if self.ui.quiet or total == 1:
+            return
+
+        if total is not None:
+            if current != total and current % max(1, total // 100):
+                return
+        else:
+            now = time.monotonic()
+            if now - self._last_progress_time < self.PROGRESS_INTERVAL:
+                return
+            self._last_progress_time = now
+
+        self.ui.show_progress(
+            current=current,
+            total=total,
+            completed=self.stats['completed'],
+            skipped=self.stats['skipped'],
+            failed=self.stats['failed'],
+            current_file=Path(pdf_path).name
+        )
+
+
+# Manager used by each worker process in parallel batch mode
+_worker_manager: Optional[PDFMetadataManager] = None
+
+
+def _init_worker(config: dict, pool_size: int) -> None:
+    """
+    Create the batch-mode manager for a worker process.
+
+    The workers already keep every CPU busy, so each one OCRs its pages
+    serially, and they split Crossref's rate limit between them.
+
+    Args:
+        config: The parent manager's _worker_config
+        pool_size: Number of worker processes
+    """
+    global _worker_manager
+    # Let the parent handle Ctrl+C and cancel the pool
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _worker_manager = PDFMetadataManager(
+        batch_mode=True,
+        workers=1,
+        ocr_workers=1,
+        rate_limit_share=pool_size,
+        **config
+    )
+
+
+def _process_pdf_in_worker(pdf_path: str) -> Tuple[str, list, str]:
     """
-    Collect PDF files from input path.
+    Process one PDF in a worker process.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Tuple of (result, log entries recorded while processing, output
+        to print)
+    """
+    # Drop any entries left behind by an earlier call that raised
+    _worker_manager.logger.take_results()
+    with _worker_manager.ui.capture_stdout():
+        result = _worker_manager.process_single_pdf(pdf_path)
+    return result, _worker_manager.logger.take_results(), _worker_manager.ui.take_output()
+
+
+def iter_pdf_files(input_path: str, recursive: bool = False) -> Iterator[str]:
+    """
+    Find PDF files at the input path.
+
+    Files are yielded as they are found, so processing can start before a
+    large directory tree has been fully scanned. Within each directory files
+    are sorted by name and come before the contents of its subdirectories.
 
     Args:
         input_path: File or directory path, or glob pattern
         recursive: Search directories recursively
 
-    Returns:
-        List of PDF file paths
+    Yields:
+        PDF file paths
     """
     path = Path(input_path)
-    files = []
 
     if path.is_file():
         if path.suffix.lower() == '.pdf':
-            files.append(str(path))
+            yield str(path)
     elif path.is_dir():
-        if recursive:
-            files.extend(str(p) for p in path.rglob('*.pdf'))
-        else:
-            files.extend(str(p) for p in path.glob('*.pdf'))
+        pending = [input_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue  # Unreadable directory
+
+            subdirs = []
+            for entry in entries:
+                if entry.name.lower().endswith('.pdf') and entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+
+            # Visit subdirectories depth-first in name order
+            pending.extend(reversed(subdirs))
     else:
-        # Try as glob pattern
+        # Try as glob pattern; recursive lets '**' match nested directories
         import glob
-        files.extend(glob.glob(input_path, recursive=recursive))
-
-    return sorted(files)
+        for match in sorted(glob.glob(input_path, recursive=recursive)):
+            if match.lower().endswith('.pdf') and os.path.isfile(match):
+                yield match
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -537,6 +971,27 @@ Environment Variables:
         help='Number of pages to OCR (default: 1)'
     )
 
+    parser.add_argument(
+        '--ocr-dpi',
+        type=int,
+        default=200,
+        metavar='N',
+        help='Resolution for rendering pages to OCR (default: 200)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not cache extracted PDF metadata or Crossref responses'
+    )
+
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        metavar='N',
+        help='Number of files to process in parallel in batch mode (default: number of CPUs)'
+    )
+
     parser.add_argument(
         '--retries',
         type=int,
@@ -592,9 +1047,15 @@ def validate_config(args: argparse.Namespace) -> Tuple[bool, Optional[str]]:
     if args.ocr_pages < 1:
         return False, "Error: --ocr-pages must be >= 1"
 
+    if args.ocr_dpi < 1:
+        return False, "Error: --ocr-dpi must be >= 1"
+
     if args.retries < 1:
         return False, "Error: --retries must be >= 1"
 
+    if args.workers is not None and args.workers < 1:
+        return False, "Error: --workers must be >= 1"
+
     return True, None
 
 
@@ -609,10 +1070,11 @@ def main():
         print(error_msg, file=sys.stderr)
         sys.exit(1)
 
-    # Collect files to process
-    files = collect_pdf_files(args.input, recursive=args.recursive)
+    # Find files to process (lazily, so large trees start processing early)
+    files = iter_pdf_files(args.input, recursive=args.recursive)
 
-    if not files:
+    first_file = next(files, None)
+    if first_file is None:
         print(f"Error: No PDF files found at: {args.input}", file=sys.stderr)
         sys.exit(1)
 
@@ -621,13 +1083,16 @@ def main():
         email=args.email,
         use_ocr=not args.no_ocr,
         ocr_pages=args.ocr_pages,
+        ocr_dpi=args.ocr_dpi,
+        use_cache=not args.no_cache,
         keep_backup=args.backup,
         retries=args.retries,
         verbose=args.verbose,
         quiet=args.quiet,
         batch_mode=args.batch,
         rename=not args.no_rename,
-        log_path=args.log
+        log_path=args.log,
+        workers=args.workers
     )
 
     # Set up signal handler for graceful shutdown
@@ -637,7 +1102,7 @@ def main():
     signal.signal(signal.SIGINT, signal_handler)
 
     # Process files
-    manager.process_files(files)
+    manager.process_files(chain([first_file], files))
 
 
 if __name__ == '__main__':
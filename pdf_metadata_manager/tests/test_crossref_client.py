@@ -10,10 +10,14 @@ Tests cover:
 - Metadata fetching
 """
 
+import io
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 import time
 import requests
+from urllib3.exceptions import ProtocolError
+from urllib3.response import HTTPResponse
 
 from pdf_metadata_manager.core.crossref_client import (
     CrossrefClient,
@@ -22,6 +26,29 @@ from pdf_metadata_manager.core.crossref_client import (
     CrossrefAPIError
 )
 
+# Where urllib3 sends a request, below the retrying adapter
+POOL_REQUEST = 'urllib3.connectionpool.HTTPConnectionPool._make_request'
+
+
+def session_response(body=None, status=200, text="", headers=None):
+    """Build a lightweight stand-in for the response of Session.request."""
+    return SimpleNamespace(
+        status_code=status,
+        text=text,
+        headers=headers or {},
+        json=lambda: body
+    )
+
+
+def http_response(status, body=b"", headers=None):
+    """Build a urllib3 response as returned by POOL_REQUEST."""
+    return HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        headers=headers or {},
+        preload_content=False
+    )
+
 
 class TestCrossrefMatch(unittest.TestCase):
     """Test CrossrefMatch dataclass."""
@@ -72,7 +99,8 @@ class TestCrossrefClient(unittest.TestCase):
             email="test@example.com",
             retries=3,
             timeout=30,
-            backoff_factor=0.1  # Shorter for tests
+            backoff_factor=0.1,  # Shorter for tests
+            use_cache=False
         )
 
     def test_initialization(self):
@@ -83,6 +111,13 @@ class TestCrossrefClient(unittest.TestCase):
         self.assertEqual(self.client.backoff_factor, 0.1)
         self.assertIn("test@example.com", self.client.headers['User-Agent'])
 
+    def test_session_sends_polite_user_agent(self):
+        """Test that requests go through one session carrying the User-Agent."""
+        session = requests.Session()
+        client = CrossrefClient(email="test@example.com", use_cache=False, session=session)
+        self.assertIs(client.session, session)
+        self.assertIn("mailto:test@example.com", session.headers['User-Agent'])
+
     def test_fuzzy_title_similarity_exact_match(self):
         """Test fuzzy title matching with exact match."""
         title1 = "Machine Learning Applications in Climate Science"
@@ -132,6 +167,13 @@ class TestCrossrefClient(unittest.TestCase):
         year = self.client._extract_year(item)
         self.assertEqual(year, "2019")
 
+        # Unknown dates ([[null]]) are skipped
+        item = {
+            'published-print': {'date-parts': [[None]]},
+            'issued': {'date-parts': [[2018]]}
+        }
+        self.assertEqual(self.client._extract_year(item), "2018")
+
     def test_extract_year_none(self):
         """Test year extraction returns None when no date available."""
         item = {}
@@ -219,13 +261,34 @@ class TestCrossrefClient(unittest.TestCase):
         # Both should give some year credit
         self.assertGreater(score_close, 0.0)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    def test_score_items_matches_single_item_scores(self):
+        """Test that batch scoring weighs title, year and author like single scoring."""
+        items = [
+            {
+                'title': ['Machine Learning Applications in Climate Science'],
+                'author': [{'given': 'John', 'family': 'Smith'}],
+                'published-print': {'date-parts': [[2020]]}
+            },
+            {
+                'title': ['Deep Learning for Weather Prediction'],
+                'published-print': {'date-parts': [[2019]]}
+            },
+            {'title': []},
+        ]
+        title = "Machine Learning in Climate Science"
+
+        scores = self.client._score_items(items, title=title, author="Smith", year="2020")
+
+        similarity = self.client._fuzzy_title_similarity
+        self.assertAlmostEqual(scores[0], min(0.5 * similarity(title, items[0]['title'][0]) + 0.4, 1.0))
+        self.assertAlmostEqual(scores[1], 0.5 * similarity(title, items[1]['title'][0]) + 0.1)
+        self.assertEqual(scores[2], 0.0)
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_search_success(self, mock_request):
         """Test successful search."""
         # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = session_response({
             'message': {
                 'items': [
                     {
@@ -252,7 +315,7 @@ class TestCrossrefClient(unittest.TestCase):
                     }
                 ]
             }
-        }
+        })
         mock_request.return_value = mock_response
 
         # Perform search
@@ -263,6 +326,9 @@ class TestCrossrefClient(unittest.TestCase):
             max_results=5
         )
 
+        # Only the fields the client uses are requested
+        self.assertIn('&select=DOI,title,author,', mock_request.call_args[0][1])
+
         # Verify results
         self.assertGreater(len(results), 0)
         self.assertIsInstance(results[0], CrossrefMatch)
@@ -270,22 +336,20 @@ class TestCrossrefClient(unittest.TestCase):
         for i in range(len(results) - 1):
             self.assertGreaterEqual(results[i].score, results[i + 1].score)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_search_no_results(self, mock_request):
         """Test search with no results."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = session_response({
             'message': {
                 'items': []
             }
-        }
+        })
         mock_request.return_value = mock_response
 
         results = self.client.search(title="Nonexistent Paper")
         self.assertEqual(len(results), 0)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_search_empty_query(self, mock_request):
         """Test search with empty query."""
         results = self.client.search()
@@ -293,15 +357,15 @@ class TestCrossrefClient(unittest.TestCase):
         # Should not make any API calls
         mock_request.assert_not_called()
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch(POOL_REQUEST)
     @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
     def test_retry_on_connection_error(self, mock_sleep, mock_request):
         """Test retry logic on connection errors."""
         # First two attempts fail, third succeeds
         mock_request.side_effect = [
-            requests.exceptions.ConnectionError("Connection failed"),
-            requests.exceptions.ConnectionError("Connection failed"),
-            Mock(status_code=200, json=lambda: {'message': {'items': []}})
+            ProtocolError("Connection failed"),
+            ProtocolError("Connection failed"),
+            http_response(200, b'{"message": {"items": []}}')
         ]
 
         # Should succeed after retries
@@ -309,15 +373,18 @@ class TestCrossrefClient(unittest.TestCase):
 
         # Verify retries happened
         self.assertEqual(mock_request.call_count, 3)
-        # Verify exponential backoff (includes rate limiting sleeps)
-        self.assertGreaterEqual(mock_sleep.call_count, 2)
+        # Verify jittered exponential backoff (the first retry is immediate)
+        mock_sleep.assert_called_once()
+        delay = mock_sleep.call_args[0][0]
+        self.assertGreaterEqual(delay, 0)
+        self.assertLessEqual(delay, 0.2)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch(POOL_REQUEST)
     @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
     def test_retry_exhausted(self, mock_sleep, mock_request):
         """Test exception raised when all retries exhausted."""
         # All attempts fail
-        mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        mock_request.side_effect = ProtocolError("Connection failed")
 
         # Should raise CrossrefConnectionError
         with self.assertRaises(CrossrefConnectionError):
@@ -326,13 +393,10 @@ class TestCrossrefClient(unittest.TestCase):
         # Should have tried the configured number of times
         self.assertEqual(mock_request.call_count, self.client.retries)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch(POOL_REQUEST)
     def test_no_retry_on_client_error(self, mock_request):
         """Test no retry on 4xx client errors."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_request.return_value = mock_response
+        mock_request.return_value = http_response(404, b"Not Found")
 
         # Should raise CrossrefAPIError without retries
         with self.assertRaises(CrossrefAPIError):
@@ -341,14 +405,14 @@ class TestCrossrefClient(unittest.TestCase):
         # Should only try once (no retries on client errors)
         self.assertEqual(mock_request.call_count, 1)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch(POOL_REQUEST)
     @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
     def test_retry_on_server_error(self, mock_sleep, mock_request):
         """Test retry on 5xx server errors."""
         # First attempt returns 500, second succeeds
         mock_request.side_effect = [
-            Mock(status_code=500, text="Server Error"),
-            Mock(status_code=200, json=lambda: {'message': {'items': []}})
+            http_response(500, b"Server Error"),
+            http_response(200, b'{"message": {"items": []}}')
         ]
 
         # Should succeed after retry
@@ -357,18 +421,124 @@ class TestCrossrefClient(unittest.TestCase):
         # Verify retry happened
         self.assertEqual(mock_request.call_count, 2)
 
-    @patch('pdf_metadata_manager.core.crossref_client.time.time')
+    @patch(POOL_REQUEST)
+    @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
+    def test_server_error_exhausted(self, mock_sleep, mock_request):
+        """Test that persistent 5xx errors raise CrossrefConnectionError."""
+        mock_request.side_effect = [http_response(503, b"Unavailable") for _ in range(3)]
+
+        with self.assertRaises(CrossrefConnectionError):
+            self.client.search(title="Test")
+
+        self.assertEqual(mock_request.call_count, self.client.retries)
+
+    @patch(POOL_REQUEST)
     @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    def test_retry_after_on_rate_limit(self, mock_sleep, mock_request):
+        """Test that HTTP 429 is retried after the Retry-After delay."""
+        mock_request.side_effect = [
+            http_response(429, b"Too Many Requests", headers={'Retry-After': '7'}),
+            http_response(200, b'{"message": {"items": []}}')
+        ]
+
+        results = self.client.search(title="Test")
+
+        self.assertEqual(results, [])
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_any_call(7.0)
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
+    def test_fetch_metadata_uses_cache(self, mock_request):
+        """Test that repeated DOI lookups are served from the disk cache."""
+        import tempfile
+        mock_request.return_value = session_response(
+            {'message': {'DOI': '10.1234/test', 'title': ['Cached Paper']}}
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CrossrefClient(email="test@example.com", cache_dir=tmpdir)
+            first = client.fetch_metadata('10.1234/TEST')
+
+            # A new client (e.g. a later run) reads the same cache directory
+            client = CrossrefClient(email="test@example.com", cache_dir=tmpdir)
+            second = client.fetch_metadata('10.1234/test')
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second['title'], 'Cached Paper')
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
+    def test_fetch_metadata_caches_not_found(self, mock_request):
+        """Test that a 404 is cached until negative_cache_ttl expires."""
+        import tempfile
+        mock_request.return_value = session_response(status=404, text="Resource not found.")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for _ in range(2):
+                client = CrossrefClient(email="test@example.com", cache_dir=tmpdir)
+                with self.assertRaises(CrossrefAPIError) as ctx:
+                    client.fetch_metadata('10.1234/missing')
+                self.assertEqual(ctx.exception.status_code, 404)
+            self.assertEqual(mock_request.call_count, 1)
+
+            # A day later the DOI is looked up again
+            later = time.time() + 2 * 24 * 3600
+            with patch('pdf_metadata_manager.core.crossref_client.time.time', return_value=later):
+                client = CrossrefClient(email="test@example.com", cache_dir=tmpdir)
+                with self.assertRaises(CrossrefAPIError):
+                    client.fetch_metadata('10.1234/missing')
+            self.assertEqual(mock_request.call_count, 2)
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
+    def test_fetch_metadata_bulk_prefills_cache(self, mock_request):
+        """Test that a bulk DOI lookup answers later single DOI lookups."""
+        import tempfile
+        mock_request.return_value = session_response({'message': {'items': [
+            {'DOI': '10.1234/one', 'title': ['First Paper']},
+            {'DOI': '10.1234/two', 'title': ['Second Paper']},
+        ]}})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CrossrefClient(email="test@example.com", cache_dir=tmpdir)
+            results = client.fetch_metadata_bulk(['10.1234/ONE', '10.1234/two'])
+            single = client.fetch_metadata('10.1234/two')
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertIn('filter=doi:10.1234/one,doi:10.1234/two', mock_request.call_args[0][1])
+        self.assertEqual(results['10.1234/one']['title'], 'First Paper')
+        self.assertEqual(single['title'], 'Second Paper')
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
+    def test_fetch_metadata_bulk_leaves_missing_dois_uncached(self, mock_request):
+        """Test that DOIs absent from a bulk response are still looked up singly."""
+        import tempfile
+        mock_request.side_effect = [
+            session_response({'message': {'items': [
+                {'DOI': '10.1234/one', 'title': ['First Paper']},
+            ]}}),
+            session_response({'message': {'DOI': '10.1234/canonical', 'title': ['Aliased Paper']}}),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = CrossrefClient(email="test@example.com", cache_dir=tmpdir)
+            results = client.fetch_metadata_bulk(['10.1234/one', '10.1234/alias'])
+            single = client.fetch_metadata('10.1234/alias')
+
+        self.assertNotIn('10.1234/alias', results)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertIn('/works/10.1234/alias', mock_request.call_args[0][1])
+        self.assertEqual(single['title'], 'Aliased Paper')
+
+    @patch('pdf_metadata_manager.core.crossref_client.time.monotonic')
+    @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_rate_limiting(self, mock_request, mock_sleep, mock_time):
         """Test rate limiting between requests."""
         # Mock time progression
         times = [0, 0.3, 0.6]  # Simulate requests coming faster than rate limit
         mock_time.side_effect = times + [1.0, 1.5, 2.0]
 
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'message': {'items': []}}
+        mock_response = session_response({'message': {'items': []}})
         mock_request.return_value = mock_response
 
         # Make two searches
@@ -378,14 +548,61 @@ class TestCrossrefClient(unittest.TestCase):
         # Should have enforced rate limiting
         # First request: no sleep
         # Second request: should sleep because < 0.5s elapsed
-        self.assertGreater(mock_sleep.call_count, 0)
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.2)
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
+    def test_rate_limit_follows_response_headers(self, mock_request):
+        """Test that the announced X-Rate-Limit headers retune the rate limit."""
+        mock_request.return_value = session_response(
+            {'message': {'items': []}},
+            headers={'X-Rate-Limit-Limit': '50', 'X-Rate-Limit-Interval': '1s'}
+        )
+        self.client.search(title="Test")
+        self.assertAlmostEqual(self.client.min_request_interval, 0.02)
+
+        # Malformed headers leave the limit alone
+        mock_request.return_value.headers = {'X-Rate-Limit-Limit': 'lots', 'X-Rate-Limit-Interval': '1s'}
+        self.client.search(title="Test again")
+        self.assertAlmostEqual(self.client.min_request_interval, 0.02)
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
+    def test_rate_limit_split_between_clients(self, mock_request):
+        """Test that rate_limit_share clients each get their part of the limit."""
+        client = CrossrefClient(email="test@example.com", use_cache=False, rate_limit_share=4)
+        self.assertAlmostEqual(client.min_request_interval, 2.0)
+
+        mock_request.return_value = session_response(
+            {'message': {'items': []}},
+            headers={'X-Rate-Limit-Limit': '50', 'X-Rate-Limit-Interval': '1s'}
+        )
+        with patch('pdf_metadata_manager.core.crossref_client.time.sleep'):
+            client.search(title="Test")
+        self.assertAlmostEqual(client.min_request_interval, 0.08)
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch('pdf_metadata_manager.core.crossref_client.time.sleep')
+    def test_search_many_preserves_order(self, mock_sleep):
+        """Test that concurrent searches return results in query order."""
+        def fake_search(title=None, author=None, year=None, max_results=5):
+            if title == "Broken":
+                raise CrossrefAPIError("API error 400")
+            return [CrossrefMatch(f"10.1234/{title}", title, [], year, None, 1.0)]
+
+        queries = [{'title': f"Paper {i}", 'year': "2020"} for i in range(10)]
+        queries.insert(3, {'title': "Broken"})
+        with patch.object(self.client, 'search', side_effect=fake_search):
+            results = self.client.search_many(queries, max_workers=4, return_exceptions=True)
+            with self.assertRaises(CrossrefAPIError):
+                self.client.search_many(queries, max_workers=4)
+
+        self.assertIsInstance(results[3], CrossrefAPIError)
+        del results[3]
+        self.assertEqual([r[0].title for r in results], [f"Paper {i}" for i in range(10)])
+
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_fetch_metadata_success(self, mock_request):
         """Test fetching metadata by DOI."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = session_response({
             'message': {
                 'DOI': '10.1234/test',
                 'title': ['Test Article'],
@@ -399,7 +616,7 @@ class TestCrossrefClient(unittest.TestCase):
                 'publisher': 'Nature Publishing Group',
                 'type': 'journal-article'
             }
-        }
+        })
         mock_request.return_value = mock_response
 
         metadata = self.client.fetch_metadata('10.1234/test')
@@ -410,18 +627,16 @@ class TestCrossrefClient(unittest.TestCase):
         self.assertEqual(metadata['year'], '2020')
         self.assertEqual(metadata['journal'], 'Nature')
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_fetch_metadata_clean_doi(self, mock_request):
         """Test fetching metadata cleans DOI from URL."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = session_response({
             'message': {
                 'DOI': '10.1234/test',
                 'title': ['Test Article'],
                 'author': []
             }
-        }
+        })
         mock_request.return_value = mock_response
 
         # Pass DOI as URL
@@ -430,12 +645,10 @@ class TestCrossrefClient(unittest.TestCase):
         # Should have extracted DOI from URL
         self.assertIn('10.1234/test', mock_request.call_args[0][1])
 
-    @patch('pdf_metadata_manager.core.crossref_client.requests.request')
+    @patch('pdf_metadata_manager.core.crossref_client.requests.Session.request')
     def test_fetch_metadata_not_found(self, mock_request):
         """Test fetching metadata for non-existent DOI."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
+        mock_response = session_response(status=404, text="Not Found")
         mock_request.return_value = mock_response
 
         with self.assertRaises(CrossrefAPIError):
@@ -6,7 +6,7 @@ and ensures proper confidence scoring.
 """
 
 import unittest
-from pdf_metadata_manager.core.filename_parser import parse_filename, FilenameHints
+from pdf_metadata_manager.core.filename_parser import parse_filename, parse_filenames, FilenameHints
 
 
 class TestFilenameParser(unittest.TestCase):
@@ -239,6 +239,33 @@ class TestFilenameParser(unittest.TestCase):
         self.assertIn("and", result.author.lower())
         self.assertEqual(result.year, "2020")
 
+    def test_doi_filename(self):
+        """Test filenames that are DOIs with the slash replaced"""
+        result = parse_filename("10.1038_s41586-020-2649-2.pdf")
+        self.assertEqual(result.doi, "10.1038/s41586-020-2649-2")
+        self.assertIsNone(result.year)
+
+        result = parse_filename("10.1016%2Fj.cell.2020.01.001.PDF")
+        self.assertEqual(result.doi, "10.1016/j.cell.2020.01.001")
+
+        result = parse_filename("10.1002%2F%28SICI%291097-4636%28199605%2931%3A1.pdf")
+        self.assertEqual(result.doi, "10.1002/(SICI)1097-4636(199605)31:1")
+
+        result = parse_filename("Smith - 2020 - Machine Learning.pdf")
+        self.assertIsNone(result.doi)
+
+    def test_parse_filenames_batch(self):
+        """Test parsing many paths at once, in order"""
+        names = [f"/library/Author{i} - {1900 + i % 100} - Title {i}.pdf" for i in range(1000)]
+        names[10] = "/library/10.1038_s41586-020-2649-2.pdf"
+        results = parse_filenames(names)
+
+        self.assertEqual(len(results), 1000)
+        self.assertEqual(results[0], parse_filename("Author0 - 1900 - Title 0.pdf"))
+        self.assertEqual(results[10].doi, "10.1038/s41586-020-2649-2")
+        confident = [hints for hints in results if hints.confidence > 0.7]
+        self.assertEqual(len(confident), 999)
+
     def test_dataclass_defaults(self):
         """Test FilenameHints dataclass defaults"""
         hints = FilenameHints()
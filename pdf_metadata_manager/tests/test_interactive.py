@@ -7,6 +7,8 @@ match display, confirmations, error handling, and progress display.
 import unittest
 from unittest.mock import patch, MagicMock, call
 from io import StringIO
+import os
+import re
 import sys
 
 # Import the module to test
@@ -14,35 +16,51 @@ try:
     from pdf_metadata_manager.ui.interactive import (
         InteractiveUI,
         UserQuitError,
+        RETRY,
+        ManualDOI,
         CrossrefMatch,
         FilenameHints,
         MetadataUpdate
     )
 except ImportError:
-    import sys
-    import os
     # Add parent directory to path for testing
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from ui.interactive import (
         InteractiveUI,
         UserQuitError,
+        RETRY,
+        ManualDOI,
         CrossrefMatch,
         FilenameHints,
         MetadataUpdate
     )
 
 
+# Expected print_summary output for 47 files (40 completed, 5 skipped, 2 failed)
+SUMMARY_RE = re.compile(
+    r"PROCESSING SUMMARY.*?"
+    r"Total files:      47.*?"
+    r"Completed:      40.*?"
+    r"Skipped:        5.*?"
+    r"Failed:         2.*?"
+    r"Success rate:     85\.1%.*?"
+    r"Log file:         /path/to/log\.json",
+    re.DOTALL
+)
+
+
 class TestInteractiveUI(unittest.TestCase):
     """Test cases for InteractiveUI class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.ui = InteractiveUI(verbose=False, quiet=False)
-        self.verbose_ui = InteractiveUI(verbose=True, quiet=False)
-        self.quiet_ui = InteractiveUI(verbose=False, quiet=True)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests (none of them are modified)."""
+        cls.ui = InteractiveUI(verbose=False, quiet=False)
+        cls.verbose_ui = InteractiveUI(verbose=True, quiet=False)
+        cls.quiet_ui = InteractiveUI(verbose=False, quiet=True)
 
         # Sample test data
-        self.sample_matches = [
+        cls.sample_matches = (
             CrossrefMatch(
                 doi="10.1038/s41558-020-12345",
                 title="Machine Learning Applications in Climate Science",
@@ -67,16 +85,27 @@ class TestInteractiveUI(unittest.TestCase):
                 journal="Example Journal",
                 score=0.54
             )
-        ]
+        )
 
-        self.sample_hints = FilenameHints(
+        cls.many_authors_match = CrossrefMatch(
+            doi="10.1234/test",
+            title="Test Paper",
+            authors=[f"Author {i}" for i in range(10)],
+            year="2020",
+            journal="Test Journal",
+            score=0.85
+        )
+
+        cls.sample_error = Exception("Test error")
+
+        cls.sample_hints = FilenameHints(
             author="Smith",
             year="2020",
             title=None,
             confidence=0.6
         )
 
-        self.sample_metadata = MetadataUpdate(
+        cls.sample_metadata = MetadataUpdate(
             title="Machine Learning Applications in Climate Science",
             authors="Smith, J.; Johnson, A.; Williams, B.",
             year="2020",
@@ -85,6 +114,16 @@ class TestInteractiveUI(unittest.TestCase):
             isbn=None
         )
 
+    def setUp(self):
+        """Reset the progress display state of the shared UIs."""
+        for ui in (self.ui, self.verbose_ui, self.quiet_ui):
+            ui._last_progress_lines = 0
+
+    def assertAllIn(self, fragments, output):
+        """Assert that output contains every fragment, reporting all missing ones."""
+        missing = [fragment for fragment in fragments if fragment not in output]
+        self.assertFalse(missing, f"Missing from output: {missing}")
+
     def test_init(self):
         """Test UI initialization."""
         ui = InteractiveUI()
@@ -115,29 +154,38 @@ class TestInteractiveUI(unittest.TestCase):
         self.assertIn("Year: 2020", output)
         self.assertIn("HIGH CONFIDENCE", output)
 
-    @patch('builtins.input', side_effect=['3'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_select_third(self, mock_stdout, mock_input):
-        """Test selecting the third match."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertEqual(result, self.sample_matches[2])
+    def test_display_matches_input_routing(self):
+        """Test what each answer (or end of input) at the prompt returns."""
+        cases = [
+            # (answers, expected result, expected output)
+            (['3'], self.sample_matches[2], None),
+            (['s'], None, None),
+            (['r'], RETRY, None),
+            (['m', '10.1234/manual'], ManualDOI('10.1234/manual'), None),
+            (['m', ''], None, "No DOI entered"),
+            (['99', '2'], self.sample_matches[1], "Please enter a number between 1 and 3"),
+            (['invalid', 's'], None, "Invalid choice"),
+            (EOFError(), None, "EOF detected"),
+            (KeyboardInterrupt(), None, "Interrupted"),
+            (['m', EOFError()], None, "EOF detected"),
+        ]
 
-    @patch('builtins.input', side_effect=['s'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_skip(self, mock_stdout, mock_input):
-        """Test skipping match selection."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertIsNone(result)
+        for answers, expected, expected_output in cases:
+            with self.subTest(answers=answers), \
+                    patch('builtins.input', side_effect=answers), \
+                    patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                result = self.ui.display_matches(
+                    self.sample_matches,
+                    "test.pdf",
+                    self.sample_hints
+                )
+
+                if expected is RETRY:
+                    self.assertIs(result, RETRY)
+                else:
+                    self.assertEqual(result, expected)
+                if expected_output:
+                    self.assertIn(expected_output, mock_stdout.getvalue())
 
     @patch('builtins.input', side_effect=['q'])
     @patch('sys.stdout', new_callable=StringIO)
@@ -150,100 +198,6 @@ class TestInteractiveUI(unittest.TestCase):
                 self.sample_hints
             )
 
-    @patch('builtins.input', side_effect=['r'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_retry(self, mock_stdout, mock_input):
-        """Test retry option."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertEqual(result, 'retry')
-
-    @patch('builtins.input', side_effect=['m', '10.1234/manual'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_manual_doi(self, mock_stdout, mock_input):
-        """Test manual DOI entry."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertEqual(result, ('manual', '10.1234/manual'))
-
-    @patch('builtins.input', side_effect=['m', ''])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_manual_doi_empty(self, mock_stdout, mock_input):
-        """Test manual DOI entry with empty input."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertIsNone(result)
-        output = mock_stdout.getvalue()
-        self.assertIn("No DOI entered", output)
-
-    @patch('builtins.input', side_effect=['99', '2'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_invalid_then_valid(self, mock_stdout, mock_input):
-        """Test invalid selection followed by valid one."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertEqual(result, self.sample_matches[1])
-        output = mock_stdout.getvalue()
-        self.assertIn("Please enter a number between 1 and 3", output)
-
-    @patch('builtins.input', side_effect=['invalid', 's'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_invalid_choice(self, mock_stdout, mock_input):
-        """Test invalid choice followed by skip."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertIsNone(result)
-        output = mock_stdout.getvalue()
-        self.assertIn("Invalid choice", output)
-
-    @patch('builtins.input', side_effect=EOFError())
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_eof(self, mock_stdout, mock_input):
-        """Test EOF handling (Ctrl+D)."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertIsNone(result)
-        output = mock_stdout.getvalue()
-        self.assertIn("EOF detected", output)
-
-    @patch('builtins.input', side_effect=KeyboardInterrupt())
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_display_matches_keyboard_interrupt(self, mock_stdout, mock_input):
-        """Test Ctrl+C handling."""
-        result = self.ui.display_matches(
-            self.sample_matches,
-            "test.pdf",
-            self.sample_hints
-        )
-
-        self.assertIsNone(result)
-        output = mock_stdout.getvalue()
-        self.assertIn("Interrupted", output)
-
     def test_display_matches_quiet_mode(self):
         """Test that quiet mode returns None immediately."""
         result = self.quiet_ui.display_matches(
@@ -272,17 +226,8 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_display_matches_many_authors(self, mock_stdout, mock_input):
         """Test display with many authors."""
-        match_with_many_authors = CrossrefMatch(
-            doi="10.1234/test",
-            title="Test Paper",
-            authors=[f"Author {i}" for i in range(10)],
-            year="2020",
-            journal="Test Journal",
-            score=0.85
-        )
-
         result = self.ui.display_matches(
-            [match_with_many_authors],
+            [self.many_authors_match],
             "test.pdf",
             self.sample_hints
         )
@@ -290,6 +235,14 @@ class TestInteractiveUI(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("(10 total)", output)
 
+    def test_format_authors(self):
+        """Test that long author lists are shortened to the first three."""
+        self.assertEqual(self.ui._format_authors(["A", "B", "C"]), "A; B; C")
+        self.assertEqual(
+            self.ui._format_authors([f"A{i}" for i in range(10)]),
+            "A0; A1; A2; ... (10 total)"
+        )
+
     @patch('builtins.input', side_effect=['a'])
     @patch('sys.stdout', new_callable=StringIO)
     def test_confirm_metadata_apply(self, mock_stdout, mock_input):
@@ -369,8 +322,7 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_handle_error_retry(self, mock_stdout, mock_input):
         """Test retry option for error handling."""
-        error = Exception("Test error")
-        result = self.ui.handle_error("test.pdf", error, retryable=True)
+        result = self.ui.handle_error("test.pdf", self.sample_error, retryable=True)
 
         self.assertEqual(result, 'retry')
         output = mock_stdout.getvalue()
@@ -381,8 +333,7 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_handle_error_skip(self, mock_stdout, mock_input):
         """Test skip option for error handling."""
-        error = Exception("Test error")
-        result = self.ui.handle_error("test.pdf", error, retryable=True)
+        result = self.ui.handle_error("test.pdf", self.sample_error, retryable=True)
 
         self.assertEqual(result, 'skip')
 
@@ -390,8 +341,7 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_handle_error_quit(self, mock_stdout, mock_input):
         """Test quit option for error handling."""
-        error = Exception("Test error")
-        result = self.ui.handle_error("test.pdf", error, retryable=True)
+        result = self.ui.handle_error("test.pdf", self.sample_error, retryable=True)
 
         self.assertEqual(result, 'quit')
 
@@ -399,8 +349,7 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_handle_error_not_retryable(self, mock_stdout, mock_input):
         """Test error handling when retry is not available."""
-        error = Exception("Test error")
-        result = self.ui.handle_error("test.pdf", error, retryable=False)
+        result = self.ui.handle_error("test.pdf", self.sample_error, retryable=False)
 
         # 'r' should be invalid, so it should ask again and accept 's'
         self.assertEqual(result, 'skip')
@@ -411,8 +360,7 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_handle_error_eof(self, mock_stdout, mock_input):
         """Test EOF during error handling."""
-        error = Exception("Test error")
-        result = self.ui.handle_error("test.pdf", error, retryable=True)
+        result = self.ui.handle_error("test.pdf", self.sample_error, retryable=True)
 
         self.assertEqual(result, 'skip')
 
@@ -420,8 +368,7 @@ class TestInteractiveUI(unittest.TestCase):
     @patch('sys.stdout', new_callable=StringIO)
     def test_handle_error_keyboard_interrupt(self, mock_stdout, mock_input):
         """Test Ctrl+C during error handling."""
-        error = Exception("Test error")
-        result = self.ui.handle_error("test.pdf", error, retryable=True)
+        result = self.ui.handle_error("test.pdf", self.sample_error, retryable=True)
 
         self.assertEqual(result, 'quit')
 
@@ -437,15 +384,16 @@ class TestInteractiveUI(unittest.TestCase):
             current_file="smith_2020.pdf"
         )
 
-        output = mock_stdout.getvalue()
-        self.assertIn("Processing 47 PDFs", output)
-        self.assertIn("23/47", output)
-        self.assertIn("48.9%", output)
-        self.assertIn("Completed: 20", output)
-        self.assertIn("Skipped: 2", output)
-        self.assertIn("Failed: 1", output)
-        self.assertIn("Remaining: 24", output)
-        self.assertIn("smith_2020.pdf", output)
+        self.assertAllIn((
+            "Processing 47 PDFs",
+            "23/47",
+            "48.9%",
+            "Completed: 20",
+            "Skipped: 2",
+            "Failed: 1",
+            "Remaining: 24",
+            "smith_2020.pdf",
+        ), mock_stdout.getvalue())
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_show_progress_long_filename(self, mock_stdout):
@@ -463,6 +411,23 @@ class TestInteractiveUI(unittest.TestCase):
         output = mock_stdout.getvalue()
         self.assertIn("...", output)
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_show_progress_unknown_total(self, mock_stdout):
+        """Test progress display while the total is still unknown."""
+        self.ui.show_progress(
+            current=5,
+            total=None,
+            completed=4,
+            skipped=1,
+            failed=0,
+            current_file="smith_2020.pdf"
+        )
+
+        output = mock_stdout.getvalue()
+        self.assertIn("5 processed", output)
+        self.assertIn("Completed: 4", output)
+        self.assertNotIn("Remaining", output)
+
     def test_show_progress_quiet_mode(self):
         """Test that quiet mode doesn't show progress."""
         with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
@@ -489,15 +454,8 @@ class TestInteractiveUI(unittest.TestCase):
             log_path="/path/to/log.json"
         )
 
-        output = mock_stdout.getvalue()
-        self.assertIn("PROCESSING SUMMARY", output)
-        self.assertIn("Total files:      47", output)
-        self.assertIn("Completed:      40", output)
-        self.assertIn("Skipped:        5", output)
-        self.assertIn("Failed:         2", output)
-        self.assertIn("Success rate:", output)
-        self.assertIn("85.1%", output)
-        self.assertIn("Log file:         /path/to/log.json", output)
+        # One pass that also checks the order of the lines
+        self.assertRegex(mock_stdout.getvalue(), SUMMARY_RE)
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_print_summary_no_completed(self, mock_stdout):
@@ -527,6 +485,22 @@ class TestInteractiveUI(unittest.TestCase):
             output = mock_stdout.getvalue()
             self.assertEqual(output, "")
 
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_info_buffered(self, mock_stdout):
+        """Test that a buffered UI holds messages until flushed."""
+        ui = InteractiveUI(buffered=True)
+        ui.section("Processing: paper.pdf")
+        with ui.capture_stdout():
+            print("From a core module")
+        ui.info("Done")
+        self.assertEqual(mock_stdout.getvalue(), "")
+
+        ui.flush()
+        output = mock_stdout.getvalue()
+        self.assertLess(output.index("paper.pdf"), output.index("From a core module"))
+        self.assertLess(output.index("From a core module"), output.index("Done"))
+        self.assertEqual(ui.take_output(), "")
+
     @patch('sys.stdout', new_callable=StringIO)
     def test_verbose_info(self, mock_stdout):
         """Test verbose info message."""
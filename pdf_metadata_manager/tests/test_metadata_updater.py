@@ -3,6 +3,7 @@ Unit tests for the metadata_updater module.
 """
 
 import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -17,8 +18,10 @@ from ..core.metadata_updater import (
     MetadataUpdater,
     MetadataUpdate,
     PDFUpdateError,
-    FileOperationError
+    FileOperationError,
+    PYPDF_AVAILABLE
 )
+from ..utils.timestamp_utils import get_timestamps
 
 
 class TestMetadataUpdate(unittest.TestCase):
@@ -60,123 +63,93 @@ class TestMetadataUpdate(unittest.TestCase):
 class TestZoteroFilenameGeneration(unittest.TestCase):
     """Test Zotero filename generation."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.updater = MetadataUpdater()
-
-    def test_single_author(self):
-        """Test filename generation with single author."""
-        metadata = MetadataUpdate(
-            title="Machine Learning Applications",
-            authors="Smith, John",
-            year="2020"
-        )
-
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        self.assertEqual(filename, "Smith - 2020 - Machine Learning Applications.pdf")
-
-    def test_two_authors(self):
-        """Test filename generation with two authors."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the updater shared by all tests."""
+        cls.updater = MetadataUpdater()
+
+    def test_generate_zotero_filename(self):
+        """Test filename generation across author counts and title cleanup."""
+        # (metadata fields, original filename, expected properties)
+        cases = [
+            # Single author
+            (dict(title="Machine Learning Applications", authors="Smith, John", year="2020"),
+             "original.pdf",
+             {"equal": "Smith - 2020 - Machine Learning Applications.pdf"}),
+            # Two authors
+            (dict(title="Deep Learning", authors="Smith, John; Jones, Alice", year="2021"),
+             "original.pdf",
+             {"equal": "Smith & Jones - 2021 - Deep Learning.pdf"}),
+            # Three or more authors
+            (dict(title="Neural Networks", authors="Smith, John; Jones, Alice; Brown, Bob",
+                  year="2019"),
+             "original.pdf",
+             {"equal": "Smith et al. - 2019 - Neural Networks.pdf"}),
+            # Long titles are truncated to 97 chars + "..."
+            (dict(title="A" * 150, authors="Smith, John", year="2020"),
+             "original.pdf",
+             {"contains": ("...",), "not_contains": ("A" * 98,)}),
+            # Special characters are removed
+            (dict(title='Test "Title" with: Special* Chars?', authors="O'Brien, John",
+                  year="2020"),
+             "original.pdf",
+             {"not_contains": ('"', ':', '*', '?')}),
+            # & is replaced with 'and'
+            (dict(title="Data & Analytics", authors="Smith, John", year="2020"),
+             "original.pdf",
+             {"contains": ("and",), "not_contains": ("&",)}),
+            # Missing year marks the filename incomplete
+            (dict(title="Test Title", authors="Unknown"),
+             "original.pdf",
+             {"startswith": "_"}),
+            # Missing title falls back to the original filename, marked incomplete
+            (dict(title="", authors="Smith, John", year="2020"),
+             "/path/to/original.pdf",
+             {"startswith": "_", "contains": ("original",)}),
+        ]
+
+        for fields, original, expected in cases:
+            with self.subTest(title=fields["title"][:40], authors=fields["authors"]):
+                filename = self.updater.generate_zotero_filename(
+                    MetadataUpdate(**fields), original
+                )
+
+                if "equal" in expected:
+                    self.assertEqual(filename, expected["equal"])
+                if "startswith" in expected:
+                    self.assertTrue(filename.startswith(expected["startswith"]), filename)
+                for fragment in expected.get("contains", ()):
+                    self.assertIn(fragment, filename)
+                for fragment in expected.get("not_contains", ()):
+                    self.assertNotIn(fragment, filename)
+
+    def test_unchanged_filename_returns_original(self):
+        """Test that an already-correct filename is returned unchanged."""
         metadata = MetadataUpdate(
             title="Deep Learning",
-            authors="Smith, John; Jones, Alice",
+            authors="John Smith",
             year="2021"
         )
 
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        self.assertEqual(filename, "Smith & Jones - 2021 - Deep Learning.pdf")
-
-    def test_three_or_more_authors(self):
-        """Test filename generation with three or more authors."""
-        metadata = MetadataUpdate(
-            title="Neural Networks",
-            authors="Smith, John; Jones, Alice; Brown, Bob",
-            year="2019"
-        )
-
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        self.assertEqual(filename, "Smith et al. - 2019 - Neural Networks.pdf")
-
-    def test_long_title_truncation(self):
-        """Test that long titles are truncated."""
-        long_title = "A" * 150  # Title longer than 100 chars
-        metadata = MetadataUpdate(
-            title=long_title,
-            authors="Smith, John",
-            year="2020"
-        )
-
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        # Should be truncated to 97 chars + "..."
-        self.assertIn("...", filename)
-        self.assertLess(len(filename), 150)
-
-    def test_special_characters_removed(self):
-        """Test that special characters are removed from filename."""
-        metadata = MetadataUpdate(
-            title='Test "Title" with: Special* Chars?',
-            authors="O'Brien, John",
-            year="2020"
-        )
-
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        # Should not contain special characters
-        self.assertNotIn('"', filename)
-        self.assertNotIn(':', filename)
-        self.assertNotIn('*', filename)
-        self.assertNotIn('?', filename)
-
-    def test_ampersand_replacement(self):
-        """Test that & is replaced with 'and'."""
-        metadata = MetadataUpdate(
-            title="Data & Analytics",
-            authors="Smith, John",
-            year="2020"
-        )
-
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        # & should be replaced with 'and'
-        self.assertIn("and", filename)
-        self.assertNotIn("&", filename.split(" - ")[2])  # Check title part
-
-    def test_incomplete_metadata_marked(self):
-        """Test that incomplete metadata gets underscore prefix."""
-        metadata = MetadataUpdate(
-            title="Test Title",
-            authors="Unknown"
-        )
-
-        filename = self.updater.generate_zotero_filename(metadata, "original.pdf")
-        # Should start with underscore due to missing year
-        self.assertTrue(filename.startswith("_"))
-
-    def test_missing_title_uses_original(self):
-        """Test fallback to original filename when title is missing."""
-        metadata = MetadataUpdate(
-            title="",
-            authors="Smith, John",
-            year="2020"
+        filename = self.updater.generate_zotero_filename(
+            metadata, "/path/to/Smith - 2021 - Deep Learning.pdf"
         )
-
-        filename = self.updater.generate_zotero_filename(metadata, "/path/to/original.pdf")
-        # Should use original filename and be marked incomplete
-        self.assertTrue(filename.startswith("_"))
-        self.assertIn("original", filename)
+        self.assertEqual(filename, "Smith - 2021 - Deep Learning.pdf")
 
 
 class TestFileRenaming(unittest.TestCase):
     """Test file renaming functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.updater = MetadataUpdater()
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the updater shared by all tests."""
+        cls.updater = MetadataUpdater()
 
-    def tearDown(self):
-        """Clean up test files."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    def setUp(self):
+        """Set up a temporary directory, removed after each test."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
 
     def test_rename_file_same_directory(self):
         """Test renaming file in the same directory."""
@@ -245,26 +218,30 @@ class TestFileRenaming(unittest.TestCase):
 class TestPDFMetadataUpdate(unittest.TestCase):
     """Test PDF metadata update functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.updater = MetadataUpdater()
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the updater and a blank template PDF shared by all tests."""
+        cls.updater = MetadataUpdater()
 
-    def tearDown(self):
-        """Clean up test files."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
-    def _create_test_pdf(self, filename: str) -> str:
-        """Create a simple test PDF file."""
-        pdf_path = os.path.join(self.temp_dir, filename)
+        template_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(template_dir.cleanup)
+        cls.template_pdf = os.path.join(template_dir.name, "blank.pdf")
 
         # Create a minimal PDF
         pdf = pikepdf.new()
         pdf.add_blank_page(page_size=(612, 792))  # Letter size
-        pdf.save(pdf_path)
+        pdf.save(cls.template_pdf)
+
+    def setUp(self):
+        """Set up a temporary directory, removed after each test."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
 
+    def _create_test_pdf(self, filename: str) -> str:
+        """Create a simple test PDF file (a copy of the blank template)."""
+        pdf_path = os.path.join(self.temp_dir, filename)
+        shutil.copyfile(self.template_pdf, pdf_path)
         return pdf_path
 
     def test_update_metadata_in_place(self):
@@ -284,10 +261,11 @@ class TestPDFMetadataUpdate(unittest.TestCase):
 
         # Verify metadata was updated
         with pikepdf.open(pdf_path) as pdf:
-            self.assertEqual(str(pdf.docinfo.get('/Title', '')), "Test Title")
-            self.assertEqual(str(pdf.docinfo.get('/Author', '')), "Smith, John; Jones, Alice")
-            self.assertIn("Test Journal", str(pdf.docinfo.get('/Subject', '')))
-            self.assertIn("DOI: 10.1234/test", str(pdf.docinfo.get('/Subject', '')))
+            docinfo = {key: str(value) for key, value in pdf.docinfo.items()}
+        self.assertEqual(docinfo.get('/Title'), "Test Title")
+        self.assertEqual(docinfo.get('/Author'), "Smith, John; Jones, Alice")
+        self.assertIn("Test Journal", docinfo.get('/Subject', ''))
+        self.assertIn("DOI: 10.1234/test", docinfo.get('/Subject', ''))
 
     def test_update_metadata_to_new_file(self):
         """Test updating PDF metadata to a new file."""
@@ -327,6 +305,51 @@ class TestPDFMetadataUpdate(unittest.TestCase):
         backup_path = f"{pdf_path}.bak"
         self.assertTrue(os.path.exists(backup_path))
 
+    def test_update_metadata_removes_url_xmp_properties(self):
+        """Test that URL-related XMP properties are stripped."""
+        pdf_path = self._create_test_pdf("test.pdf")
+        with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+            with pdf.open_metadata(set_pikepdf_as_editor=False) as xmp_meta:
+                xmp_meta['dc:source'] = "https://example.com/paper.pdf"
+                xmp_meta['pdf:Keywords'] = "keep me"
+            pdf.save(pdf_path)
+
+        metadata = MetadataUpdate(
+            title="Test Title",
+            authors="Smith, John"
+        )
+        self.updater.update_metadata(pdf_path, metadata)
+
+        with pikepdf.open(pdf_path) as pdf:
+            xmp_meta = pdf.open_metadata()
+            self.assertNotIn('dc:source', xmp_meta)
+            self.assertEqual(xmp_meta.get('pdf:Keywords'), "keep me")
+            self.assertEqual(xmp_meta.get('dc:title'), "Test Title")
+
+    @unittest.skipIf(not PYPDF_AVAILABLE, "pypdf not available")
+    def test_update_with_pypdf_keeps_pages(self):
+        """Test that the pypdf fallback copies every page and sets metadata."""
+        pdf_path = self._create_test_pdf("test.pdf")
+        with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+            pdf.add_blank_page(page_size=(612, 792))
+            pdf.save(pdf_path)
+        output_path = os.path.join(self.temp_dir, "updated.pdf")
+
+        metadata = MetadataUpdate(
+            title="Test Title",
+            authors="Smith, John",
+            doi="10.1234/test"
+        )
+        result = self.updater._update_with_pypdf(
+            pdf_path, metadata, output_path, get_timestamps(pdf_path)
+        )
+        self.assertTrue(result)
+
+        with pikepdf.open(output_path) as pdf:
+            self.assertEqual(len(pdf.pages), 2)
+            self.assertEqual(str(pdf.docinfo.get('/Title', '')), "Test Title")
+            self.assertEqual(str(pdf.docinfo.get('/Keywords', '')), "DOI: 10.1234/test")
+
     def test_update_nonexistent_pdf_raises_error(self):
         """Test that updating nonexistent PDF raises error."""
         nonexistent = os.path.join(self.temp_dir, "nonexistent.pdf")
@@ -0,0 +1,285 @@
+"""
+Unit tests for the PDFMetadataManager orchestrator.
+"""
+
+import functools
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from .. import pdf_metadata_manager as manager_module
+from ..core import CrossrefAPIError, FilenameHints, PDFMetadata, PDFReadError
+from ..pdf_metadata_manager import PDFMetadataManager, iter_pdf_files
+
+
+class _FakePDFProcessor:
+    """PDFProcessor stand-in: the DOI is taken from the file name."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def extract_metadata(self, pdf_path):
+        name = Path(pdf_path).stem
+        if name == "broken":
+            raise PDFReadError("not a PDF")
+        return PDFMetadata(doi=f"10.1234/{name}")
+
+
+class _FakeCrossrefClient:
+    """CrossrefClient stand-in that knows every DOI not ending in 'unknown'."""
+
+    BULK_DOI_CHUNK = 50
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def fetch_metadata(self, doi):
+        if doi.endswith("unknown"):
+            raise CrossrefAPIError(f"DOI not found: {doi}", status_code=404)
+        return {
+            'doi': doi,
+            'title': "Test Title",
+            'authors': ["John Smith"],
+            'year': "2020",
+            'journal': "Test Journal"
+        }
+
+    def search(self, **kwargs):
+        return []
+
+
+class _FakeMetadataUpdater:
+    """MetadataUpdater stand-in that leaves the files alone."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def update_metadata(self, pdf_path, metadata, output_path=None):
+        return True
+
+
+_process_pdf_in_worker = manager_module._process_pdf_in_worker
+
+
+def _crashing_worker(pdf_path):
+    """Worker task that fails outright for 'crash.pdf'."""
+    if Path(pdf_path).name == "crash.pdf":
+        raise RuntimeError("worker died")
+    return _process_pdf_in_worker(pdf_path)
+
+
+class _FakeCoreTestCase(unittest.TestCase):
+    """Base class that stubs out the core classes and provides a temp dir."""
+
+    def setUp(self):
+        """Set up a temporary directory and stub out the core classes."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+        for target, new in (
+            ('pdf_metadata_manager.core.PDFProcessor', _FakePDFProcessor),
+            ('pdf_metadata_manager.core.CrossrefClient', _FakeCrossrefClient),
+            ('pdf_metadata_manager.core.MetadataUpdater', _FakeMetadataUpdater),
+        ):
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _create_files(self, *names):
+        """Create empty files in the temporary directory."""
+        paths = [os.path.join(self.temp_dir, name) for name in names]
+        for path in paths:
+            open(path, 'wb').close()
+        return paths
+
+
+class TestFilenameDOI(_FakeCoreTestCase):
+    """Test processing files named after their DOI."""
+
+    def setUp(self):
+        """Set up a sequential batch-mode manager."""
+        super().setUp()
+        self.manager = PDFMetadataManager(
+            email="test@example.com",
+            use_cache=False,
+            batch_mode=True,
+            rename=False,
+            workers=1
+        )
+
+    def _process(self, pdf_path):
+        """Process one file, returning the result and whether it was extracted."""
+        processor = self.manager.pdf_processor
+        with patch.object(processor, 'extract_metadata',
+                          wraps=processor.extract_metadata) as mock_extract, \
+                patch('sys.stdout', new_callable=StringIO):
+            result = self.manager.process_single_pdf(pdf_path)
+        return result, mock_extract.called
+
+    def test_resolved_filename_doi_skips_extraction(self):
+        """Test that a DOI in the filename that Crossref knows is used as is."""
+        pdf_path, = self._create_files("10.1234_known.pdf")
+
+        result, extracted = self._process(pdf_path)
+
+        self.assertEqual(result, 'completed')
+        self.assertFalse(extracted)
+        self.assertEqual(self.manager.logger.results[0]['matched_doi'], "10.1234/known")
+
+    def test_unresolved_filename_doi_falls_back_to_extraction(self):
+        """Test that the PDF is extracted when the filename DOI lookup fails."""
+        pdf_path, = self._create_files("10.1234_unknown.pdf")
+
+        result, extracted = self._process(pdf_path)
+
+        self.assertEqual(result, 'skipped')
+        self.assertTrue(extracted)
+
+
+class TestSpeculativeSearch(_FakeCoreTestCase):
+    """Test the background Crossref search started from the filename hints."""
+
+    HINTS = FilenameHints(author="Smith", year="2020", title="Machine Learning", confidence=0.9)
+
+    def setUp(self):
+        """Set up an interactive manager whose search thread is kept busy."""
+        super().setUp()
+        self.manager = PDFMetadataManager(email="test@example.com", use_cache=False)
+
+        # Hold the search thread so a speculative search stays queued
+        release = threading.Event()
+        self.manager._search_executor.submit(release.wait)
+        self.addCleanup(self.manager._search_executor.shutdown)
+        self.addCleanup(release.set)
+        self.release = release
+
+        patcher = patch.object(
+            self.manager.crossref_client, 'search',
+            side_effect=lambda **kwargs: [kwargs['title']]
+        )
+        self.mock_search = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch('sys.stdout', new_callable=StringIO)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matching_query_reuses_search(self):
+        """Test that the speculative result is used when the query matches."""
+        speculative = self.manager._start_speculative_search(self.HINTS)
+        self.release.set()
+
+        matches = self.manager._search_crossref("Machine Learning", "Smith", "2020", speculative)
+
+        self.assertEqual(matches, ["Machine Learning"])
+        self.mock_search.assert_called_once()
+
+    def test_different_query_searches_again(self):
+        """Test that a new search runs, and the unused one is cancelled, for another query."""
+        speculative = self.manager._start_speculative_search(self.HINTS)
+
+        matches = self.manager._search_crossref("Other Title", "Smith", "2020", speculative)
+
+        self.assertEqual(matches, ["Other Title"])
+        self.assertTrue(speculative[1].cancelled())
+        self.mock_search.assert_called_once()
+
+    def test_doi_cancels_search(self):
+        """Test that the speculative search is cancelled once a DOI resolves."""
+        speculative = self.manager._start_speculative_search(self.HINTS)
+
+        matches = self.manager._find_matches(
+            self.HINTS, PDFMetadata(doi="10.1234/known"), speculative
+        )
+
+        self.assertEqual(matches[0].doi, "10.1234/known")
+        self.assertTrue(speculative[1].cancelled())
+        self.mock_search.assert_not_called()
+
+
+@unittest.skipUnless(
+    'fork' in multiprocessing.get_all_start_methods(),
+    "worker processes must inherit the patched core classes"
+)
+class TestParallelBatchProcessing(_FakeCoreTestCase):
+    """Test batch mode with a pool of worker processes."""
+
+    def setUp(self):
+        """Set up a directory of PDFs and run the worker pool with fork."""
+        super().setUp()
+        self._create_files("a.pdf", "b.pdf", "broken.pdf", "crash.pdf")
+
+        fork_pool = functools.partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context('fork')
+        )
+        for target, new in (
+            ('pdf_metadata_manager.pdf_metadata_manager.ProcessPoolExecutor', fork_pool),
+            ('pdf_metadata_manager.pdf_metadata_manager._process_pdf_in_worker',
+             _crashing_worker),
+        ):
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_process_files_in_workers(self):
+        """Test that results, log entries and output come back from the workers."""
+        manager = PDFMetadataManager(
+            email="test@example.com",
+            use_cache=False,
+            batch_mode=True,
+            rename=False,
+            log_path=os.path.join(self.temp_dir, "log.json"),
+            workers=2
+        )
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout:
+            manager.process_files(iter_pdf_files(self.temp_dir))
+        output = stdout.getvalue()
+
+        self.assertEqual(manager.stats['completed'], 2)
+        self.assertEqual(manager.stats['failed'], 2)
+        self.assertEqual(manager.stats['skipped'], 0)
+
+        results = {
+            Path(result['original_path']).name: result
+            for result in manager.logger.results
+        }
+        self.assertEqual(set(results), {"a.pdf", "b.pdf", "broken.pdf", "crash.pdf"})
+        self.assertEqual(results["a.pdf"]['status'], "success")
+        self.assertEqual(results["a.pdf"]['matched_doi'], "10.1234/a")
+        self.assertEqual(results["b.pdf"]['status'], "success")
+        self.assertEqual(results["broken.pdf"]['status'], "failed")
+        self.assertEqual(results["broken.pdf"]['error'], "not a PDF")
+        self.assertEqual(results["crash.pdf"]['status'], "failed")
+        self.assertIn("worker died", results["crash.pdf"]['error'])
+        self.assertTrue(os.path.exists(manager.logger.log_path))
+
+        # Each worker's output is printed by the parent
+        for name in ("a.pdf", "b.pdf", "broken.pdf"):
+            self.assertIn(f"Processing: {name}", output)
+        self.assertIn("✓ Successfully processed", output)
+        self.assertIn("❌ Error: not a PDF", output)
+
+    def test_init_worker_limits_ocr_and_rate(self):
+        """Test that workers OCR serially and split the Crossref rate limit."""
+        manager = PDFMetadataManager(email="test@example.com", batch_mode=True, workers=3)
+
+        self.addCleanup(setattr, manager_module, '_worker_manager', None)
+        with patch('pdf_metadata_manager.pdf_metadata_manager.signal.signal'):
+            manager_module._init_worker(manager._worker_config, manager.workers)
+        worker = manager_module._worker_manager
+
+        self.assertEqual(worker.pdf_processor.kwargs['ocr_workers'], 1)
+        self.assertEqual(worker.crossref_client.kwargs['rate_limit_share'], 3)
+        self.assertEqual(manager.crossref_client.kwargs['rate_limit_share'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,28 +5,27 @@ Tests the PDFProcessor class with various scenarios.
 """
 
 import os
-import sys
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from core.pdf_processor import (
+from ..core.pdf_processor import (
     PDFProcessor,
     PDFMetadata,
     PDFNotFoundError,
     PDFReadError,
-    OCRNotAvailableError
+    OCRNotAvailableError,
+    OCR_AVAILABLE,
+    _ocr_image
 )
 
 
 class TestPDFProcessor(unittest.TestCase):
     """Test cases for PDFProcessor class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = PDFProcessor(use_ocr=False, verbose=False)
+    @classmethod
+    def setUpClass(cls):
+        """Set up the processor shared by all tests."""
+        cls.processor = PDFProcessor(use_ocr=False, verbose=False)
 
     def test_initialization(self):
         """Test PDFProcessor initialization."""
@@ -66,11 +65,46 @@ class TestPDFProcessor(unittest.TestCase):
         doi = self.processor._extract_doi(text)
         self.assertIsNone(doi)
 
+    def test_extract_doi_scans_head_and_tail_only(self):
+        """Test that DOI search is limited to the start and end of long text."""
+        filler = "lorem ipsum " * 2000
+
+        # DOI in the footer is still found
+        text = filler + "DOI: 10.1234/footer.1"
+        self.assertEqual(self.processor._extract_doi(text), "10.1234/footer.1")
+
+        # DOI buried in the middle of a long text is ignored
+        text = filler + "DOI: 10.1234/middle.1 " + filler
+        self.assertIsNone(self.processor._extract_doi(text))
+
+        # DOI crossing the end of the head is not cut short
+        prefix = "x " * ((self.processor.DOI_SCAN_HEAD - 10) // 2)
+        text = prefix + "DOI: 10.1234/abcdefghijklmnop " + filler
+        self.assertLess(len(prefix) + 5, self.processor.DOI_SCAN_HEAD)
+        self.assertGreater(len(prefix) + 30, self.processor.DOI_SCAN_HEAD)
+        self.assertEqual(self.processor._extract_doi(text), "10.1234/abcdefghijklmnop")
+
     def test_pdf_not_found(self):
         """Test handling of non-existent PDF files."""
         with self.assertRaises(PDFNotFoundError):
             self.processor.extract_metadata("/nonexistent/file.pdf")
 
+    def test_non_pdf_file_rejected(self):
+        """Test that empty and non-PDF files fail before text extraction."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            empty_path = os.path.join(tmpdir, "empty.pdf")
+            open(empty_path, 'wb').close()
+            text_path = os.path.join(tmpdir, "notes.pdf")
+            with open(text_path, 'wb') as f:
+                f.write(b"just some text")
+
+            with patch.object(self.processor, '_extract_text') as mock_extract:
+                for path in (empty_path, text_path):
+                    with self.assertRaises(PDFReadError):
+                        self.processor.extract_metadata(path)
+            mock_extract.assert_not_called()
+
     def test_extract_title_from_lines(self):
         """Test title extraction from filtered lines."""
         # Test with all-caps title
@@ -88,6 +122,18 @@ class TestPDFProcessor(unittest.TestCase):
         title = self.processor._extract_title(lines)
         self.assertIsNone(title)
 
+    def test_authors_follow_title_line(self):
+        """Test that authors are taken from the lines after the title itself."""
+        text = "\n".join([
+            "Downloaded from MACHINE LEARNING FOR CLIMATE SCIENCE archive",
+            "Published Online Today",
+            "MACHINE LEARNING FOR CLIMATE SCIENCE",
+            "John Smith and Alice Jones",
+        ])
+        title, authors, _ = self.processor._extract_metadata_from_text(text)
+        self.assertEqual(title, "MACHINE LEARNING FOR CLIMATE SCIENCE")
+        self.assertEqual(authors, "John Smith and Alice Jones")
+
     def test_extract_journal(self):
         """Test journal name extraction."""
         lines = [
@@ -104,9 +150,9 @@ class TestPDFProcessor(unittest.TestCase):
         journal = self.processor._extract_journal(lines)
         self.assertIsNone(journal)
 
-    @patch('core.pdf_processor.PdfReader')
-    def test_extract_text_with_pypdf2(self, mock_reader):
-        """Test text extraction using PyPDF2."""
+    @patch('pdf_metadata_manager.core.pdf_processor.PdfReader')
+    def test_extract_text_with_pypdf(self, mock_reader):
+        """Test text extraction using pypdf."""
         # Mock PdfReader
         mock_page = Mock()
         mock_page.extract_text.return_value = "Sample extracted text from PDF"
@@ -116,19 +162,100 @@ class TestPDFProcessor(unittest.TestCase):
 
         mock_reader.return_value = mock_pdf
 
-        # Create a temporary test file
+        # No file is needed: pypdfium2 and pikepdf fail on the missing
+        # path and extraction falls back to the mocked pypdf
+        text = self.processor._extract_text("/nonexistent/paper.pdf")
+        self.assertEqual(text, "Sample extracted text from PDF")
+        mock_reader.assert_called_once_with("/nonexistent/paper.pdf", strict=False)
+
+    @unittest.skipUnless(OCR_AVAILABLE, "OCR libraries not installed")
+    def test_ocr_image_preprocessing(self):
+        """Test that page images are converted to grayscale before OCR."""
+        from PIL import Image
+        image = Image.new('RGB', (40, 30), 'white')
+
+        with patch('pytesseract.image_to_string', return_value="text") as mock_ocr:
+            self.assertEqual(_ocr_image(image), "text")
+
+        processed = mock_ocr.call_args[0][0]
+        self.assertEqual(processed.mode, 'L')
+        self.assertEqual(processed.size, (40, 30))
+
+    def test_incremental_ocr_stops_after_first_page(self):
+        """Test that further pages are only OCR'd when page 1 lacks a DOI or title."""
+        processor = PDFProcessor(use_ocr=True, ocr_pages=3, use_cache=False)
+        page_one = "\n--- Page 1 ---\nMACHINE LEARNING FOR CLIMATE SCIENCE\nDOI: 10.1234/test.5678\n"
+
+        with patch.object(processor, '_extract_text_with_ocr', return_value=page_one) as mock_ocr:
+            text = processor._extract_text_with_ocr_incremental("paper.pdf")
+        self.assertEqual(text, page_one)
+        mock_ocr.assert_called_once_with("paper.pdf", pages=1)
+
+        with patch.object(processor, '_extract_text_with_ocr', side_effect=["no metadata", " more"]) as mock_ocr:
+            text = processor._extract_text_with_ocr_incremental("paper.pdf")
+        self.assertEqual(text, "no metadata more")
+        mock_ocr.assert_called_with("paper.pdf", pages=2, first_page=2)
+
+    def test_extract_metadata_uses_cache(self):
+        """Test that identical PDFs are served from the metadata cache."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = os.path.join(tmpdir, "paper.pdf")
+            with open(pdf_path, 'wb') as f:
+                f.write(b"%PDF-1.4 test content")
+
+            processor = PDFProcessor(
+                use_ocr=False,
+                cache_dir=os.path.join(tmpdir, "cache")
+            )
+            text = "MACHINE LEARNING FOR CLIMATE SCIENCE\nDOI: 10.1234/test.5678\n" + "x" * 100
+
+            with patch.object(processor, '_extract_text', return_value=text) as mock_extract:
+                first = processor.extract_metadata(pdf_path)
+                second = processor.extract_metadata(pdf_path)
+
+            mock_extract.assert_called_once()
+            self.assertEqual(first, second)
+            self.assertEqual(second.doi, "10.1234/test.5678")
+
+    def test_cache_skips_failures_and_old_versions(self):
+        """Test that empty results aren't cached and a new CACHE_VERSION misses."""
         import tempfile
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp_path = tmp.name
-
-        try:
-            # Extract text (will use mocked PyPDF2)
-            text = self.processor._extract_text(tmp_path)
-            self.assertEqual(text, "Sample extracted text from PDF")
-        finally:
-            # Clean up
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pdf_path = os.path.join(tmpdir, "paper.pdf")
+            with open(pdf_path, 'wb') as f:
+                f.write(b"%PDF-1.4 test content")
+
+            processor = PDFProcessor(
+                use_ocr=True,
+                cache_dir=os.path.join(tmpdir, "cache")
+            )
+            text = "MACHINE LEARNING FOR CLIMATE SCIENCE\nDOI: 10.1234/test.5678\n" + "x" * 100
+
+            # OCR failing leaves no text, which must not be cached
+            with patch.object(processor, '_extract_text', return_value=""), \
+                    patch.object(processor, '_extract_text_with_ocr_incremental', return_value=""):
+                processor.extract_metadata(pdf_path)
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, "cache")))
+
+            with patch.object(processor, '_extract_text', return_value=text):
+                processor.extract_metadata(pdf_path)
+
+            with patch.object(PDFProcessor, 'CACHE_VERSION', PDFProcessor.CACHE_VERSION + 1), \
+                    patch.object(processor, '_extract_text', return_value=text) as mock_extract:
+                processor.extract_metadata(pdf_path)
+            mock_extract.assert_called_once()
+
+    def test_extract_metadata_batch_preserves_order(self):
+        """Test that batch extraction returns results in input order."""
+        results = {
+            "a.pdf": PDFMetadata(title="First"),
+            "b.pdf": PDFMetadata(title="Second"),
+        }
+        with patch.object(self.processor, 'extract_metadata', side_effect=results.get):
+            batch = self.processor.extract_metadata_batch(["a.pdf", "b.pdf"], max_workers=2)
+
+        self.assertEqual([m.title for m in batch], ["First", "Second"])
 
 
 class TestPDFMetadata(unittest.TestCase):
@@ -4,6 +4,7 @@ Tests for timestamp_utils module.
 Tests the cross-platform timestamp preservation utilities.
 """
 
+import ctypes
 import os
 import platform
 import tempfile
@@ -15,27 +16,44 @@ from pdf_metadata_manager.utils.timestamp_utils import (
     get_timestamps,
     set_timestamps,
     preserve_timestamps,
-    _set_creation_date_macos
+    preserve_timestamps_batch,
+    _set_creation_date_macos,
+    _setfile_path,
+    _attr_structs
 )
 
 
-class TestGetTimestamps(unittest.TestCase):
-    """Test get_timestamps function."""
+def _write_file(directory, name, content):
+    """Write content to a file in directory, truncating any previous one."""
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+
+class _TempDirTestCase(unittest.TestCase):
+    """Base class providing one temporary directory per test class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the class-wide temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_dir = temp_dir.name
 
-    def setUp(self):
-        """Create a temporary file for testing."""
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.write(b"test content")
-        self.temp_file.close()
 
-    def tearDown(self):
-        """Clean up temporary file."""
-        if os.path.exists(self.temp_file.name):
-            os.remove(self.temp_file.name)
+class TestGetTimestamps(_TempDirTestCase):
+    """Test get_timestamps function."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a temporary file shared by all tests (none modify it)."""
+        super().setUpClass()
+        cls.temp_path = _write_file(cls.temp_dir, "test.txt", b"test content")
 
     def test_get_timestamps_success(self):
         """Test getting timestamps from an existing file."""
-        timestamps = get_timestamps(self.temp_file.name)
+        timestamps = get_timestamps(self.temp_path)
 
         # Check that all required keys are present
         self.assertIn('mtime', timestamps)
@@ -52,7 +70,7 @@ class TestGetTimestamps(unittest.TestCase):
 
     def test_get_timestamps_includes_birthtime_on_macos(self):
         """Test that birthtime is included on macOS."""
-        timestamps = get_timestamps(self.temp_file.name)
+        timestamps = get_timestamps(self.temp_path)
 
         if platform.system() == 'Darwin':
             # On macOS, birthtime should be present
@@ -63,33 +81,34 @@ class TestGetTimestamps(unittest.TestCase):
             # On other platforms, birthtime should not be present
             self.assertNotIn('birthtime', timestamps)
 
+    def test_get_timestamps_from_file_descriptor(self):
+        """Test getting timestamps from an open file descriptor."""
+        with open(self.temp_path, 'rb') as f:
+            from_fd = get_timestamps(f.fileno())
+
+        self.assertEqual(from_fd, get_timestamps(self.temp_path))
+
     def test_get_timestamps_nonexistent_file(self):
         """Test getting timestamps from a nonexistent file."""
         with self.assertRaises(FileNotFoundError):
             get_timestamps("/nonexistent/file.txt")
 
 
-class TestSetTimestamps(unittest.TestCase):
+class TestSetTimestamps(_TempDirTestCase):
     """Test set_timestamps function."""
 
     def setUp(self):
-        """Create a temporary file for testing."""
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.write(b"test content")
-        self.temp_file.close()
-
-        # Wait a bit to ensure timestamps are different
-        time.sleep(0.1)
+        """Rewrite the temporary file for testing."""
+        self.temp_path = _write_file(self.temp_dir, "test.txt", b"test content")
 
-    def tearDown(self):
-        """Clean up temporary file."""
-        if os.path.exists(self.temp_file.name):
-            os.remove(self.temp_file.name)
+        # Start from known past timestamps rather than waiting for the clock
+        old = time.time() - 10
+        os.utime(self.temp_path, (old, old))
 
     def test_set_timestamps_success(self):
         """Test setting timestamps on a file."""
         # Get original timestamps
-        original = get_timestamps(self.temp_file.name)
+        original = get_timestamps(self.temp_path)
 
         # Create new timestamps (1 day earlier)
         new_timestamps = {
@@ -99,14 +118,23 @@ class TestSetTimestamps(unittest.TestCase):
         }
 
         # Set the new timestamps
-        result = set_timestamps(self.temp_file.name, new_timestamps)
+        result = set_timestamps(self.temp_path, new_timestamps)
         self.assertTrue(result)
 
         # Verify that mtime and atime were updated
-        updated = get_timestamps(self.temp_file.name)
+        updated = get_timestamps(self.temp_path)
         self.assertAlmostEqual(updated['mtime'], new_timestamps['mtime'], places=0)
         self.assertAlmostEqual(updated['atime'], new_timestamps['atime'], places=0)
 
+    def test_set_timestamps_unchanged_skips_utime(self):
+        """Test that utime is not called when timestamps already match."""
+        current = get_timestamps(self.temp_path)
+
+        with patch('pdf_metadata_manager.utils.timestamp_utils.os.utime') as mock_utime:
+            result = set_timestamps(self.temp_path, current)
+            self.assertTrue(result)
+            mock_utime.assert_not_called()
+
     def test_set_timestamps_nonexistent_file(self):
         """Test setting timestamps on a nonexistent file."""
         timestamps = {
@@ -118,6 +146,14 @@ class TestSetTimestamps(unittest.TestCase):
         result = set_timestamps("/nonexistent/file.txt", timestamps)
         self.assertFalse(result)
 
+    def test_set_timestamps_unreadable_path(self):
+        """Test that other stat errors are reported as failure, not raised."""
+        # A regular file used as a directory raises NotADirectoryError
+        path = os.path.join(self.temp_path, "child.pdf")
+
+        result = set_timestamps(path, get_timestamps(self.temp_path))
+        self.assertFalse(result)
+
     def test_set_timestamps_with_defaults(self):
         """Test setting timestamps with missing keys (should use defaults)."""
         # Only provide mtime, let function use defaults for atime
@@ -125,14 +161,13 @@ class TestSetTimestamps(unittest.TestCase):
             'mtime': time.time() - 3600  # 1 hour ago
         }
 
-        result = set_timestamps(self.temp_file.name, timestamps)
+        result = set_timestamps(self.temp_path, timestamps)
         self.assertTrue(result)
 
-    @patch('platform.system')
+    @patch('pdf_metadata_manager.utils.timestamp_utils._IS_DARWIN', True)
     @patch('pdf_metadata_manager.utils.timestamp_utils._set_creation_date_macos')
-    def test_set_timestamps_calls_macos_function(self, mock_macos_func, mock_platform):
+    def test_set_timestamps_calls_macos_function(self, mock_macos_func):
         """Test that macOS-specific function is called on macOS."""
-        mock_platform.return_value = 'Darwin'
         mock_macos_func.return_value = True
 
         timestamps = {
@@ -141,16 +176,15 @@ class TestSetTimestamps(unittest.TestCase):
             'birthtime': time.time() - 86400
         }
 
-        result = set_timestamps(self.temp_file.name, timestamps)
+        result = set_timestamps(self.temp_path, timestamps)
         self.assertTrue(result)
 
         # Verify macOS function was called
         mock_macos_func.assert_called_once()
 
-    @patch('platform.system')
-    def test_set_timestamps_skips_macos_function_on_linux(self, mock_platform):
+    @patch('pdf_metadata_manager.utils.timestamp_utils._IS_DARWIN', False)
+    def test_set_timestamps_skips_macos_function_on_linux(self):
         """Test that macOS-specific function is not called on Linux."""
-        mock_platform.return_value = 'Linux'
 
         timestamps = {
             'mtime': time.time(),
@@ -159,48 +193,40 @@ class TestSetTimestamps(unittest.TestCase):
         }
 
         with patch('pdf_metadata_manager.utils.timestamp_utils._set_creation_date_macos') as mock_macos:
-            result = set_timestamps(self.temp_file.name, timestamps)
+            result = set_timestamps(self.temp_path, timestamps)
             self.assertTrue(result)
 
             # Verify macOS function was NOT called on Linux
             mock_macos.assert_not_called()
 
 
-class TestPreserveTimestamps(unittest.TestCase):
+class TestPreserveTimestamps(_TempDirTestCase):
     """Test preserve_timestamps function."""
 
     def setUp(self):
-        """Create temporary files for testing."""
-        # Create source file
-        self.source_file = tempfile.NamedTemporaryFile(delete=False)
-        self.source_file.write(b"source content")
-        self.source_file.close()
-
-        # Wait a bit to ensure different timestamps
-        time.sleep(0.1)
-
-        # Create target file
-        self.target_file = tempfile.NamedTemporaryFile(delete=False)
-        self.target_file.write(b"target content")
-        self.target_file.close()
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        for f in [self.source_file.name, self.target_file.name]:
-            if os.path.exists(f):
-                os.remove(f)
+        """Rewrite the temporary files for testing."""
+        # Write source file
+        self.source_path = _write_file(self.temp_dir, "source.txt", b"source content")
+
+        # Write target file
+        self.target_path = _write_file(self.temp_dir, "target.txt", b"target content")
+
+        # Give the two files clearly different timestamps
+        now = time.time()
+        os.utime(self.source_path, (now - 7200, now - 3600))
+        os.utime(self.target_path, (now, now))
 
     def test_preserve_timestamps_success(self):
         """Test preserving timestamps from source to target."""
         # Get source timestamps
-        source_timestamps = get_timestamps(self.source_file.name)
+        source_timestamps = get_timestamps(self.source_path)
 
         # Preserve timestamps
-        result = preserve_timestamps(self.target_file.name, self.source_file.name)
+        result = preserve_timestamps(self.target_path, self.source_path)
         self.assertTrue(result)
 
         # Verify timestamps were copied
-        target_timestamps = get_timestamps(self.target_file.name)
+        target_timestamps = get_timestamps(self.target_path)
         self.assertAlmostEqual(
             target_timestamps['mtime'],
             source_timestamps['mtime'],
@@ -212,14 +238,38 @@ class TestPreserveTimestamps(unittest.TestCase):
             places=0
         )
 
+    def test_preserve_timestamps_keeps_nanoseconds(self):
+        """Test that timestamps are copied without float rounding."""
+        mtime_ns = 1_600_000_000_123_456_789
+        os.utime(self.source_path, ns=(mtime_ns + 1, mtime_ns))
+        source_stat = os.stat(self.source_path)
+
+        self.assertTrue(preserve_timestamps(self.target_path, self.source_path))
+
+        target_stat = os.stat(self.target_path)
+        self.assertEqual(target_stat.st_mtime_ns, source_stat.st_mtime_ns)
+        self.assertEqual(target_stat.st_atime_ns, source_stat.st_atime_ns)
+
+    def test_preserve_timestamps_stats_each_file_once(self):
+        """Test that preserving timestamps stats source and target once each."""
+        with patch('pdf_metadata_manager.utils.timestamp_utils.os.stat',
+                   wraps=os.stat) as mock_stat:
+            result = preserve_timestamps(self.target_path, self.source_path)
+
+        self.assertTrue(result)
+        self.assertEqual(
+            [c.args[0] for c in mock_stat.call_args_list],
+            [self.source_path, self.target_path]
+        )
+
     def test_preserve_timestamps_nonexistent_source(self):
         """Test preserving timestamps when source doesn't exist."""
-        result = preserve_timestamps(self.target_file.name, "/nonexistent/source.txt")
+        result = preserve_timestamps(self.target_path, "/nonexistent/source.txt")
         self.assertFalse(result)
 
     def test_preserve_timestamps_nonexistent_target(self):
         """Test preserving timestamps when target doesn't exist."""
-        result = preserve_timestamps("/nonexistent/target.txt", self.source_file.name)
+        result = preserve_timestamps("/nonexistent/target.txt", self.source_path)
         self.assertFalse(result)
 
     def test_preserve_timestamps_both_nonexistent(self):
@@ -228,136 +278,178 @@ class TestPreserveTimestamps(unittest.TestCase):
         self.assertFalse(result)
 
 
-class TestSetCreationDateMacOS(unittest.TestCase):
+class TestPreserveTimestampsBatch(_TempDirTestCase):
+    """Test preserve_timestamps_batch function."""
+
+    def test_preserve_timestamps_batch(self):
+        """Test preserving timestamps for several pairs, in order."""
+        now = time.time()
+        pairs = []
+        for i in range(8):
+            source = _write_file(self.temp_dir, f"source{i}.txt", b"source")
+            target = _write_file(self.temp_dir, f"target{i}.txt", b"target")
+            os.utime(source, (now - 3600 * (i + 1), now - 3600 * (i + 1)))
+            pairs.append((target, source))
+        pairs.append(("/nonexistent/target.txt", pairs[0][1]))
+
+        results = preserve_timestamps_batch(pairs, max_workers=4)
+
+        self.assertEqual(results, [True] * 8 + [False])
+        for target, source in pairs[:8]:
+            self.assertAlmostEqual(
+                get_timestamps(target)['mtime'],
+                get_timestamps(source)['mtime'],
+                places=0
+            )
+
+
+class TestSetCreationDateMacOS(_TempDirTestCase):
     """Test _set_creation_date_macos function."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create a temporary file shared by all tests (SetFile is mocked)."""
+        super().setUpClass()
+        cls.temp_path = _write_file(cls.temp_dir, "test.txt", b"test content")
+
     def setUp(self):
-        """Create a temporary file for testing."""
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.write(b"test content")
-        self.temp_file.close()
+        """Forget any cached SetFile lookup, before and after each test."""
+        _setfile_path.cache_clear()
+        self.addCleanup(_setfile_path.cache_clear)
+
+        # Exercise the SetFile fallback unless a test says otherwise
+        patcher = patch(
+            'pdf_metadata_manager.utils.timestamp_utils._set_creation_date_setattrlist',
+            return_value=False
+        )
+        self.mock_setattrlist = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('subprocess.run')
+    def test_setattrlist_avoids_setfile(self, mock_run):
+        """Test that SetFile is not run when setattrlist succeeds."""
+        self.mock_setattrlist.return_value = True
+
+        creation_time = time.time() - 86400  # 1 day ago
+        result = _set_creation_date_macos(self.temp_path, creation_time)
+
+        self.assertTrue(result)
+        self.mock_setattrlist.assert_called_once_with(self.temp_path, creation_time)
+        mock_run.assert_not_called()
 
-    def tearDown(self):
-        """Clean up temporary file."""
-        if os.path.exists(self.temp_file.name):
-            os.remove(self.temp_file.name)
+    def test_attrlist_layout(self):
+        """Test that struct attrlist matches the <sys/attr.h> layout."""
+        attr_list, timespec = _attr_structs()
+        self.assertEqual(ctypes.sizeof(attr_list), 24)
+        self.assertEqual(ctypes.sizeof(timespec), 2 * ctypes.sizeof(ctypes.c_long))
 
     @patch('subprocess.run')
-    def test_setfile_available(self, mock_run):
+    @patch('shutil.which', return_value='/usr/bin/SetFile')
+    def test_setfile_available(self, mock_which, mock_run):
         """Test when SetFile command is available."""
-        # Mock successful 'which SetFile' check
-        mock_which = MagicMock()
-        mock_which.returncode = 0
-
         # Mock successful SetFile command
-        mock_setfile = MagicMock()
-        mock_setfile.returncode = 0
-
-        # Return different mocks for different calls
-        mock_run.side_effect = [mock_which, mock_setfile]
+        mock_run.return_value = MagicMock(returncode=0)
 
         creation_time = time.time() - 86400  # 1 day ago
-        result = _set_creation_date_macos(self.temp_file.name, creation_time)
+        result = _set_creation_date_macos(self.temp_path, creation_time)
 
         self.assertTrue(result)
-        self.assertEqual(mock_run.call_count, 2)
+        mock_which.assert_called_once_with("SetFile")
+        mock_run.assert_called_once()
 
     @patch('subprocess.run')
-    def test_setfile_not_available(self, mock_run):
+    @patch('shutil.which', return_value=None)
+    def test_setfile_not_available(self, mock_which, mock_run):
         """Test when SetFile command is not available."""
-        # Mock failed 'which SetFile' check
-        mock_which = MagicMock()
-        mock_which.returncode = 1
-        mock_run.return_value = mock_which
-
         creation_time = time.time()
-        result = _set_creation_date_macos(self.temp_file.name, creation_time)
+        result = _set_creation_date_macos(self.temp_path, creation_time)
 
         # Should return False but not raise an exception
         self.assertFalse(result)
-        mock_run.assert_called_once()
+        mock_run.assert_not_called()
 
     @patch('subprocess.run')
-    def test_setfile_command_fails(self, mock_run):
-        """Test when SetFile command fails."""
-        # Mock successful 'which' but failed SetFile
-        mock_which = MagicMock()
-        mock_which.returncode = 0
+    @patch('shutil.which', return_value='/usr/bin/SetFile')
+    def test_setfile_lookup_cached(self, mock_which, mock_run):
+        """Test that SetFile is only looked up once across calls."""
+        mock_run.return_value = MagicMock(returncode=0)
+
+        for _ in range(3):
+            self.assertTrue(_set_creation_date_macos(self.temp_path, time.time()))
 
-        # Second call should raise an exception
+        mock_which.assert_called_once_with("SetFile")
+        self.assertEqual(mock_run.call_count, 3)
+
+    @patch('subprocess.run')
+    @patch('shutil.which', return_value='/usr/bin/SetFile')
+    def test_setfile_command_fails(self, mock_which, mock_run):
+        """Test when SetFile command fails."""
+        # SetFile is found but the command raises an exception
         import subprocess
-        mock_run.side_effect = [
-            mock_which,
-            subprocess.CalledProcessError(1, 'SetFile', stderr="SetFile failed")
-        ]
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, 'SetFile', stderr="SetFile failed"
+        )
 
         creation_time = time.time()
-        result = _set_creation_date_macos(self.temp_file.name, creation_time)
+        result = _set_creation_date_macos(self.temp_path, creation_time)
 
         # Should return False and handle the exception gracefully
         self.assertFalse(result)
 
     @patch('subprocess.run')
-    def test_setfile_date_format(self, mock_run):
+    @patch('shutil.which', return_value='/usr/bin/SetFile')
+    def test_setfile_date_format(self, mock_which, mock_run):
         """Test that date is formatted correctly for SetFile."""
-        mock_which = MagicMock()
-        mock_which.returncode = 0
-
-        mock_setfile = MagicMock()
-        mock_setfile.returncode = 0
-
-        mock_run.side_effect = [mock_which, mock_setfile]
+        mock_run.return_value = MagicMock(returncode=0)
 
         # Use a specific timestamp
         creation_time = 1609459200.0  # 2021-01-01 00:00:00 UTC
-        result = _set_creation_date_macos(self.temp_file.name, creation_time)
+        result = _set_creation_date_macos(self.temp_path, creation_time)
 
         self.assertTrue(result)
 
         # Check that SetFile was called with correct format
         # The format should be MM/DD/YYYY HH:MM:SS
-        setfile_call = mock_run.call_args_list[1]
-        self.assertEqual(setfile_call[0][0][0], "SetFile")
-        self.assertEqual(setfile_call[0][0][1], "-d")
+        setfile_args = mock_run.call_args[0][0]
+        self.assertEqual(setfile_args[0], "/usr/bin/SetFile")
+        self.assertEqual(setfile_args[1], "-d")
         # Date string should match the format (exact value depends on timezone)
-        self.assertRegex(setfile_call[0][0][2], r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}')
+        self.assertRegex(setfile_args[2], r'\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}')
 
 
-class TestTimestampPreservationIntegration(unittest.TestCase):
+class TestTimestampPreservationIntegration(_TempDirTestCase):
     """Integration tests for timestamp preservation workflow."""
 
     def setUp(self):
-        """Create temporary files for testing."""
-        self.source_file = tempfile.NamedTemporaryFile(delete=False)
-        self.source_file.write(b"source content")
-        self.source_file.close()
-
-        self.target_file = tempfile.NamedTemporaryFile(delete=False)
-        self.target_file.write(b"target content")
-        self.target_file.close()
+        """Rewrite the temporary files for testing."""
+        self.source_path = _write_file(self.temp_dir, "source.txt", b"source content")
+        self.target_path = _write_file(self.temp_dir, "target.txt", b"target content")
 
-    def tearDown(self):
-        """Clean up temporary files."""
-        for f in [self.source_file.name, self.target_file.name]:
-            if os.path.exists(f):
-                os.remove(f)
+        # Backdate the source so later writes to the target change its mtime
+        old = time.time() - 3600
+        os.utime(self.source_path, (old, old))
 
     def test_full_workflow(self):
         """Test complete workflow: get -> modify -> set -> verify."""
         # Step 1: Get original timestamps
-        original = get_timestamps(self.source_file.name)
+        original = get_timestamps(self.source_path)
 
         # Step 2: Modify timestamps (simulate a file operation)
-        time.sleep(0.1)
-        with open(self.target_file.name, 'a') as f:
+        with open(self.target_path, 'a') as f:
             f.write(" modified")
+        # Move the target's times forward explicitly, whatever the
+        # filesystem's mtime granularity
+        os.utime(self.target_path, (original['atime'] + 10, original['mtime'] + 10))
+        self.assertNotAlmostEqual(
+            get_timestamps(self.target_path)['mtime'], original['mtime'], places=0
+        )
 
         # Step 3: Restore timestamps
-        success = preserve_timestamps(self.target_file.name, self.source_file.name)
+        success = preserve_timestamps(self.target_path, self.source_path)
         self.assertTrue(success)
 
         # Step 4: Verify timestamps were preserved
-        restored = get_timestamps(self.target_file.name)
+        restored = get_timestamps(self.target_path)
         self.assertAlmostEqual(
             restored['mtime'],
             original['mtime'],
@@ -367,22 +459,22 @@ class TestTimestampPreservationIntegration(unittest.TestCase):
     def test_backup_and_restore_workflow(self):
         """Test backup file creation with timestamp preservation."""
         # Create a backup
-        backup_path = self.source_file.name + ".bak"
+        backup_path = self.source_path + ".bak"
 
         try:
             # Copy file to backup
             import shutil
-            shutil.copy2(self.source_file.name, backup_path)
+            shutil.copy2(self.source_path, backup_path)
 
             # Verify backup exists
             self.assertTrue(os.path.exists(backup_path))
 
             # Preserve timestamps
-            result = preserve_timestamps(backup_path, self.source_file.name)
+            result = preserve_timestamps(backup_path, self.source_path)
             self.assertTrue(result)
 
             # Verify timestamps match
-            source_ts = get_timestamps(self.source_file.name)
+            source_ts = get_timestamps(self.source_path)
             backup_ts = get_timestamps(backup_path)
 
             self.assertAlmostEqual(source_ts['mtime'], backup_ts['mtime'], places=0)
@@ -392,53 +484,36 @@ class TestTimestampPreservationIntegration(unittest.TestCase):
                 os.remove(backup_path)
 
 
-class TestEdgeCases(unittest.TestCase):
+class TestEdgeCases(_TempDirTestCase):
     """Test edge cases and error handling."""
 
+    def setUp(self):
+        """Rewrite the temporary file for testing."""
+        self.temp_path = _write_file(self.temp_dir, "test.txt", b"test")
+
     def test_empty_timestamps_dict(self):
         """Test set_timestamps with empty dictionary."""
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file.write(b"test")
-        temp_file.close()
-
-        try:
-            # Should use defaults
-            result = set_timestamps(temp_file.name, {})
-            self.assertTrue(result)
-        finally:
-            os.remove(temp_file.name)
+        # Should use defaults
+        result = set_timestamps(self.temp_path, {})
+        self.assertTrue(result)
 
     def test_very_old_timestamp(self):
         """Test with very old timestamp (Unix epoch)."""
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file.write(b"test")
-        temp_file.close()
-
-        try:
-            timestamps = {
-                'mtime': 0,  # Unix epoch
-                'atime': 0
-            }
-            result = set_timestamps(temp_file.name, timestamps)
-            self.assertTrue(result)
-        finally:
-            os.remove(temp_file.name)
+        timestamps = {
+            'mtime': 0,  # Unix epoch
+            'atime': 0
+        }
+        result = set_timestamps(self.temp_path, timestamps)
+        self.assertTrue(result)
 
     def test_future_timestamp(self):
         """Test with future timestamp."""
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file.write(b"test")
-        temp_file.close()
-
-        try:
-            timestamps = {
-                'mtime': time.time() + 86400,  # Tomorrow
-                'atime': time.time() + 86400
-            }
-            result = set_timestamps(temp_file.name, timestamps)
-            self.assertTrue(result)
-        finally:
-            os.remove(temp_file.name)
+        timestamps = {
+            'mtime': time.time() + 86400,  # Tomorrow
+            'atime': time.time() + 86400
+        }
+        result = set_timestamps(self.temp_path, timestamps)
+        self.assertTrue(result)
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
 """User interface modules."""
 
-from .interactive import InteractiveUI, UserQuitError
+from .interactive import InteractiveUI, UserQuitError, RETRY, ManualDOI
 
-__all__ = ['InteractiveUI', 'UserQuitError']
+__all__ = ['InteractiveUI', 'UserQuitError', 'RETRY', 'ManualDOI']
@@ -4,8 +4,10 @@ This module provides user-friendly interactive prompts for match selection,
 error handling, and confirmations during PDF metadata processing.
 """
 
+import io
 import sys
-from typing import List, Optional
+from contextlib import nullcontext, redirect_stdout
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 # Import from core module - will be available when integrated
 try:
@@ -14,9 +16,9 @@ try:
     from ..core.metadata_updater import MetadataUpdate
 except ImportError:
     # For standalone testing
-    from dataclasses import dataclass
+    from dataclasses import dataclass, field
 
-    @dataclass
+    @dataclass(frozen=True)
     class CrossrefMatch:
         doi: str
         title: str
@@ -24,22 +26,24 @@ except ImportError:
         year: Optional[str]
         journal: Optional[str]
         score: float
+        confidence_level: str = field(init=False, repr=False, compare=False)
 
-        @property
-        def confidence_level(self) -> str:
+        def __post_init__(self):
             if self.score >= 0.80:
-                return "HIGH"
+                level = "HIGH"
             elif self.score >= 0.65:
-                return "MEDIUM"
+                level = "MEDIUM"
             else:
-                return "LOW"
+                level = "LOW"
+            object.__setattr__(self, 'confidence_level', level)
 
-    @dataclass
+    @dataclass(frozen=True)
     class FilenameHints:
         author: Optional[str] = None
         year: Optional[str] = None
         title: Optional[str] = None
         confidence: float = 0.0
+        doi: Optional[str] = None
 
     @dataclass
     class MetadataUpdate:
@@ -56,27 +60,50 @@ class UserQuitError(Exception):
     pass
 
 
+# Returned by display_matches() when the user asks to search again
+RETRY = object()
+
+# Returned by a _prompt_choice() fallback to ask the question again
+_INVALID = object()
+
+
+class ManualDOI(NamedTuple):
+    """Returned by display_matches() when the user enters a DOI."""
+    doi: str
+
+
 class InteractiveUI:
     """Interactive user interface for PDF processing."""
 
-    def __init__(self, verbose: bool = False, quiet: bool = False):
+    # Confidence indicator for each confidence level
+    _CONFIDENCE_STARS = {"HIGH": "★★★", "MEDIUM": "★★", "LOW": "★"}
+
+    # Progress bar pieces, sliced to length on each repaint
+    _BAR_WIDTH = 30
+    _BAR_FULL = "=" * _BAR_WIDTH
+    _BAR_EMPTY = " " * _BAR_WIDTH
+
+    def __init__(self, verbose: bool = False, quiet: bool = False, buffered: bool = False):
         """
         Initialize UI.
 
         Args:
             verbose: Show detailed information
             quiet: Minimal output (errors and summary only)
+            buffered: Collect info() and section() messages until flush()
+                or take_output() is called, instead of printing them
         """
         self.verbose = verbose
         self.quiet = quiet
         self._last_progress_lines = 0
+        self._buffer = io.StringIO() if buffered else None
 
     def display_matches(
         self,
         matches: List[CrossrefMatch],
         filename: str,
         filename_hints: FilenameHints
-    ) -> Optional[CrossrefMatch]:
+    ) -> Union[CrossrefMatch, ManualDOI, object, None]:
         """
         Display matches and get user selection.
 
@@ -86,7 +113,8 @@ class InteractiveUI:
             filename_hints: Parsed filename information
 
         Returns:
-            Selected CrossrefMatch, or None if skipped/quit
+            Selected CrossrefMatch, ManualDOI if the user entered a DOI,
+            RETRY if the user asked to search again, or None if skipped
 
         Raises:
             UserQuitError: If user chooses to quit
@@ -94,92 +122,75 @@ class InteractiveUI:
         if self.quiet:
             return None
 
-        # Display header
-        print(f"\nFound {len(matches)} potential match{'es' if len(matches) != 1 else ''} for: {filename}")
-        print()
+        # Build the whole listing and write it in one go
+        lines = [
+            f"\nFound {len(matches)} potential match{'es' if len(matches) != 1 else ''} for: {filename}",
+            ""
+        ]
 
         # Display filename hints if available
-        hint_parts = []
-        if filename_hints.author:
-            hint_parts.append(f"Author: {filename_hints.author}")
-        if filename_hints.year:
-            hint_parts.append(f"Year: {filename_hints.year}")
-        if filename_hints.title:
-            hint_parts.append(f"Title: {filename_hints.title}")
+        hint_parts = [
+            f"{label}: {value}"
+            for label, value in (
+                ("Author", filename_hints.author),
+                ("Year", filename_hints.year),
+                ("Title", filename_hints.title),
+            )
+            if value
+        ]
 
         if hint_parts:
-            print("Current filename info: " + ", ".join(hint_parts))
-            print()
+            lines.append("Current filename info: " + ", ".join(hint_parts))
+            lines.append("")
 
         # Display matches
         for i, match in enumerate(matches, 1):
-            # Confidence indicator
-            if match.confidence_level == "HIGH":
-                stars = "★★★"
-            elif match.confidence_level == "MEDIUM":
-                stars = "★★"
-            else:
-                stars = "★"
-
-            print(f"{i}. {stars} {match.confidence_level} CONFIDENCE ({match.score:.2f})")
-            print(f"   Title: {match.title}")
+            level = match.confidence_level
+            stars = self._CONFIDENCE_STARS[level]
+            lines.append(f"{i}. {stars} {level} CONFIDENCE ({match.score:.2f})")
+            lines.append(f"   Title: {match.title}")
 
-            # Format authors
             if match.authors:
-                if len(match.authors) <= 3:
-                    authors_str = "; ".join(match.authors)
-                else:
-                    authors_str = "; ".join(match.authors[:3]) + f"; ... ({len(match.authors)} total)"
-                print(f"   Authors: {authors_str}")
+                lines.append(f"   Authors: {self._format_authors(match.authors)}")
 
             if match.year:
-                print(f"   Year: {match.year}")
+                lines.append(f"   Year: {match.year}")
             if match.journal:
-                print(f"   Journal: {match.journal}")
-            print(f"   DOI: {match.doi}")
-            print()
+                lines.append(f"   Journal: {match.journal}")
+            lines.append(f"   DOI: {match.doi}")
+            lines.append("")
 
-        # Get user choice
-        while True:
-            try:
-                prompt = f"Choose: [1-{len(matches)}] Select match | [s]kip | [r]etry | [m]anual DOI | [q]uit\n> "
-                choice = input(prompt).strip().lower()
+        sys.stdout.write("\n".join(lines) + "\n")
 
-                if choice == 'q':
-                    raise UserQuitError("User chose to quit")
-                elif choice == 's':
-                    return None
-                elif choice == 'r':
-                    # Return a special marker for retry
-                    return 'retry'  # type: ignore
-                elif choice == 'm':
-                    # Get manual DOI
-                    doi = input("Enter DOI: ").strip()
-                    if doi:
-                        # Return a marker for manual DOI entry
-                        return ('manual', doi)  # type: ignore
-                    else:
-                        print("No DOI entered, skipping...")
-                        return None
-                else:
-                    # Try to parse as number
-                    try:
-                        idx = int(choice)
-                        if 1 <= idx <= len(matches):
-                            return matches[idx - 1]
-                        else:
-                            print(f"Please enter a number between 1 and {len(matches)}")
-                    except ValueError:
-                        print(f"Invalid choice: {choice}")
+        def manual_doi():
+            doi = input("Enter DOI: ").strip()
+            if doi:
+                return ManualDOI(doi)
+            print("No DOI entered, skipping...")
+            return None
 
-            except EOFError:
-                # Handle Ctrl+D
-                print("\nEOF detected, skipping...")
-                return None
-            except KeyboardInterrupt:
-                # Handle Ctrl+C
-                print("\nInterrupted, skipping...")
-                return None
+        def select_number(choice):
+            try:
+                idx = int(choice)
+            except ValueError:
+                print(f"Invalid choice: {choice}")
+                return _INVALID
+            if 1 <= idx <= len(matches):
+                return matches[idx - 1]
+            print(f"Please enter a number between 1 and {len(matches)}")
+            return _INVALID
+
+        # Get user choice
+        return self._prompt_choice(
+            f"Choose: [1-{len(matches)}] Select match | [s]kip | [r]etry | [m]anual DOI | [q]uit\n> ",
+            {
+                'q': self._raise_quit,
+                's': lambda: None,
+                'r': lambda: RETRY,
+                'm': manual_doi,
+            },
+            other=select_number
+        )
 
     def confirm_metadata(
         self,
@@ -204,50 +215,43 @@ class InteractiveUI:
         if self.quiet:
             return True
 
-        print("\n📝 Review metadata update:")
-        print()
-        print(f"File: {filename}")
-        print()
-        print("Metadata to write:")
-        print("┌" + "─" * 70 + "┐")
-
-        # Format metadata nicely
-        self._print_boxed_line(f"Title:   {metadata.title}")
-        self._print_boxed_line(f"Authors: {metadata.authors}")
+        lines = [
+            "\n📝 Review metadata update:",
+            "",
+            f"File: {filename}",
+            "",
+            "Metadata to write:",
+            "┌" + "─" * 70 + "┐",
+            # Format metadata nicely
+            self._boxed_line(f"Title:   {metadata.title}"),
+            self._boxed_line(f"Authors: {metadata.authors}")
+        ]
         if metadata.year:
-            self._print_boxed_line(f"Year:    {metadata.year}")
+            lines.append(self._boxed_line(f"Year:    {metadata.year}"))
         if metadata.journal:
-            self._print_boxed_line(f"Journal: {metadata.journal}")
+            lines.append(self._boxed_line(f"Journal: {metadata.journal}"))
         if metadata.doi:
-            self._print_boxed_line(f"DOI:     {metadata.doi}")
+            lines.append(self._boxed_line(f"DOI:     {metadata.doi}"))
         if metadata.isbn:
-            self._print_boxed_line(f"ISBN:    {metadata.isbn}")
+            lines.append(self._boxed_line(f"ISBN:    {metadata.isbn}"))
 
-        print("└" + "─" * 70 + "┘")
-        print()
-        print(f"New filename: {new_filename}")
-        print()
+        lines += [
+            "└" + "─" * 70 + "┘",
+            "",
+            f"New filename: {new_filename}",
+            ""
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
         # Get confirmation
-        while True:
-            try:
-                choice = input("[a]pply | [s]kip | [q]uit\n> ").strip().lower()
-
-                if choice == 'q':
-                    raise UserQuitError("User chose to quit")
-                elif choice == 's':
-                    return False
-                elif choice == 'a':
-                    return True
-                else:
-                    print(f"Invalid choice: {choice}")
-
-            except EOFError:
-                print("\nEOF detected, skipping...")
-                return False
-            except KeyboardInterrupt:
-                print("\nInterrupted, skipping...")
-                return False
+        return self._prompt_choice(
+            "[a]pply | [s]kip | [q]uit\n> ",
+            {
+                'q': self._raise_quit,
+                's': lambda: False,
+                'a': lambda: True,
+            }
+        )
 
     def handle_error(
         self,
@@ -266,41 +270,72 @@ class InteractiveUI:
         Returns:
             User choice: 'retry', 'skip', or 'quit'
         """
-        print(f"\n❌ Error processing: {filename}")
-        print(f"Error: {str(error)}")
-        print()
+        sys.stdout.write(f"\n❌ Error processing: {filename}\nError: {error}\n\n")
 
+        handlers = {'s': lambda: 'skip', 'q': lambda: 'quit'}
         if retryable:
             prompt = "[r]etry | [s]kip | [q]uit\n> "
-            valid_choices = ['r', 's', 'q']
+            handlers['r'] = lambda: 'retry'
         else:
             prompt = "[s]kip | [q]uit\n> "
-            valid_choices = ['s', 'q']
 
+        return self._prompt_choice(prompt, handlers, interrupt_choice='q')
+
+    def _prompt_choice(
+        self,
+        prompt: str,
+        handlers: Dict[str, Callable[[], Any]],
+        interrupt_choice: str = 's',
+        other: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """
+        Ask for a choice until the user gives a valid one.
+
+        Ctrl+D counts as 's' (skip), and Ctrl+C as interrupt_choice.
+
+        Args:
+            prompt: Prompt to show
+            handlers: Map from each accepted answer to a function returning
+                the result for it ('s' must be included)
+            interrupt_choice: Answer that Ctrl+C stands for ('s' or 'q')
+            other: Function called with any other answer, returning the
+                result or _INVALID to ask again (default: reject it)
+
+        Returns:
+            The result of the handler for the chosen answer
+        """
         while True:
             try:
                 choice = input(prompt).strip().lower()
 
-                if choice == 'q':
-                    return 'quit'
-                elif choice == 's':
-                    return 'skip'
-                elif choice == 'r' and retryable:
-                    return 'retry'
-                else:
+                if choice in handlers:
+                    return handlers[choice]()
+                if other is None:
                     print(f"Invalid choice: {choice}")
+                else:
+                    result = other(choice)
+                    if result is not _INVALID:
+                        return result
 
             except EOFError:
+                # Handle Ctrl+D
                 print("\nEOF detected, skipping...")
-                return 'skip'
+                return handlers['s']()
             except KeyboardInterrupt:
-                print("\nInterrupted, quitting...")
-                return 'quit'
+                # Handle Ctrl+C
+                action = "quitting" if interrupt_choice == 'q' else "skipping"
+                print(f"\nInterrupted, {action}...")
+                return handlers[interrupt_choice]()
+
+    @staticmethod
+    def _raise_quit():
+        """Handle the quit answer in prompts where quitting ends the run."""
+        raise UserQuitError("User chose to quit")
 
     def show_progress(
         self,
         current: int,
-        total: int,
+        total: Optional[int],
         completed: int,
         skipped: int,
         failed: int,
@@ -311,7 +346,7 @@ class InteractiveUI:
 
         Args:
             current: Current file number (1-indexed)
-            total: Total files to process
+            total: Total files to process, or None while still unknown
             completed: Number of successfully completed files
             skipped: Number of skipped files
             failed: Number of failed files
@@ -320,35 +355,48 @@ class InteractiveUI:
         if self.quiet:
             return
 
-        # Clear previous progress lines
-        if self._last_progress_lines > 0:
-            # Move cursor up and clear lines
-            for _ in range(self._last_progress_lines):
-                sys.stdout.write('\033[F\033[K')
-
-        # Calculate progress
-        percentage = (current / total) * 100 if total > 0 else 0
-
-        # Create progress bar
-        bar_width = 30
-        filled = int(bar_width * current / total) if total > 0 else 0
-        bar = "=" * filled + ">" + " " * (bar_width - filled - 1)
-
-        print(f"\nProcessing {total} PDFs...")
-        print(f"[{bar}] {current}/{total} ({percentage:.1f}%)")
-        print()
-        print(f"✓ Completed: {completed}")
-        print(f"⚠ Skipped: {skipped}")
-        print(f"❌ Failed: {failed}")
-        print(f"⏳ Remaining: {total - current}")
-        print()
+        # Clear previous progress lines by moving the cursor up and clearing
+        # each one, then repaint everything with a single write
+        out = ['\033[F\033[K' * self._last_progress_lines]
+
+        if total is None:
+            # Files are still being found, so there is no bar to draw
+            out.append(f"\nProcessing PDFs...\n{current} processed\n")
+        else:
+            # Calculate progress
+            percentage = (current / total) * 100 if total > 0 else 0
+
+            # Create progress bar
+            bar_width = self._BAR_WIDTH
+            filled = int(bar_width * current / total) if total > 0 else 0
+            bar = (
+                self._BAR_FULL[:filled] + ">"
+                + self._BAR_EMPTY[:max(bar_width - filled - 1, 0)]
+            )
+
+            out.append(
+                f"\nProcessing {total} PDFs...\n"
+                f"[{bar}] {current}/{total} ({percentage:.1f}%)\n"
+            )
 
         # Truncate filename if too long
         if len(current_file) > 60:
             current_file = current_file[:57] + "..."
-        print(f"Current: {current_file}")
 
-        self._last_progress_lines = 9
+        out.append(
+            "\n"
+            f"✓ Completed: {completed}\n"
+            f"⚠ Skipped: {skipped}\n"
+            f"❌ Failed: {failed}\n"
+        )
+        if total is not None:
+            out.append(f"⏳ Remaining: {total - current}\n")
+        out.append(f"\nCurrent: {current_file}\n")
+
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+
+        self._last_progress_lines = 9 if total is not None else 8
 
     def print_summary(
         self,
@@ -368,43 +416,89 @@ class InteractiveUI:
             failed: Number failed
             log_path: Path to log file
         """
-        print("\n" + "=" * 70)
-        print("PROCESSING SUMMARY")
-        print("=" * 70)
-        print()
-        print(f"Total files:      {total}")
-        print(f"✓ Completed:      {completed}")
-        print(f"⚠ Skipped:        {skipped}")
-        print(f"❌ Failed:         {failed}")
-        print()
+        lines = [
+            "\n" + "=" * 70,
+            "PROCESSING SUMMARY",
+            "=" * 70,
+            "",
+            f"Total files:      {total}",
+            f"✓ Completed:      {completed}",
+            f"⚠ Skipped:        {skipped}",
+            f"❌ Failed:         {failed}",
+            ""
+        ]
 
         if completed > 0:
             success_rate = (completed / total) * 100
-            print(f"Success rate:     {success_rate:.1f}%")
-            print()
+            lines += [f"Success rate:     {success_rate:.1f}%", ""]
 
         if log_path:
-            print(f"Log file:         {log_path}")
-            print()
+            lines += [f"Log file:         {log_path}", ""]
+
+        lines.append("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
 
-        print("=" * 70)
+    def _format_authors(self, authors: List[str]) -> str:
+        """Join author names, listing only the first 3 of a longer list."""
+        if len(authors) <= 3:
+            return "; ".join(authors)
+        return "; ".join(authors[:3]) + f"; ... ({len(authors)} total)"
 
-    def _print_boxed_line(self, text: str):
-        """Helper to print a line inside a box."""
+    def _boxed_line(self, text: str) -> str:
+        """Helper to format a line inside a box."""
         # Truncate if too long
         max_width = 68
         if len(text) > max_width:
             text = text[:max_width - 3] + "..."
 
         # Pad to width
-        padded = text + " " * (max_width - len(text))
-        print(f"│ {padded} │")
+        return f"│ {text:<{max_width}} │"
 
     def info(self, message: str):
         """Print informational message."""
-        if not self.quiet:
+        if self.quiet:
+            return
+        if self._buffer is not None:
+            self._buffer.write(message + "\n")
+        else:
             print(message)
 
+    def section(self, title: str):
+        """Print a section header, e.g. for each file processed."""
+        self.info(f"\n{'=' * 60}\n{title}\n{'=' * 60}")
+
+    def flush(self):
+        """Print the buffered messages, if any."""
+        output = self.take_output()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+
+    def take_output(self) -> str:
+        """
+        Return the buffered messages and clear the buffer.
+
+        Returns:
+            The buffered text (empty if the UI is not buffered)
+        """
+        if self._buffer is None:
+            return ""
+        output = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return output
+
+    def capture_stdout(self):
+        """
+        Context manager that also buffers anything else printed meanwhile.
+
+        Only has an effect on a buffered UI. Used by worker processes so that
+        messages printed by the core modules stay in order with the UI's own.
+        """
+        if self._buffer is None:
+            return nullcontext()
+        return redirect_stdout(self._buffer)
+
     def verbose_info(self, message: str):
         """Print verbose informational message."""
         if self.verbose and not self.quiet:
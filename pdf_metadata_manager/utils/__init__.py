@@ -3,6 +3,7 @@
 from pdf_metadata_manager.utils.logger import SessionLogger
 from pdf_metadata_manager.utils.timestamp_utils import (
     preserve_timestamps,
+    preserve_timestamps_batch,
     get_timestamps,
     set_timestamps
 )
@@ -10,6 +11,7 @@ from pdf_metadata_manager.utils.timestamp_utils import (
 __all__ = [
     'SessionLogger',
     'preserve_timestamps',
+    'preserve_timestamps_batch',
     'get_timestamps',
     'set_timestamps'
 ]
@@ -1,10 +1,17 @@
 """JSON logging system for PDF processing sessions."""
 
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class SessionLogger:
     """Log PDF processing session to JSON file."""
@@ -20,6 +27,8 @@ class SessionLogger:
         self.start_time = datetime.now()
         self.settings = settings or {}
         self.results: List[Dict[str, Any]] = []
+        # Running counts by status, kept in step with self.results
+        self._stats = {"success": 0, "skipped": 0, "failed": 0}
 
         # Auto-generate log filename if not provided
         if log_path is None:
@@ -60,9 +69,10 @@ class SessionLogger:
             "metadata_updated": True,
             "renamed": original_path != new_path,
             "used_ocr": used_ocr,
-            "timestamp": datetime.now().isoformat()
+            # Raw time; formatted as ISO 8601 when the log is written
+            "timestamp": time.time()
         }
-        self.results.append(result)
+        self._add(result)
 
     def log_skip(
         self,
@@ -80,9 +90,10 @@ class SessionLogger:
             "original_path": original_path,
             "status": "skipped",
             "reason": reason,
-            "timestamp": datetime.now().isoformat()
+            # Raw time; formatted as ISO 8601 when the log is written
+            "timestamp": time.time()
         }
-        self.results.append(result)
+        self._add(result)
 
     def log_failure(
         self,
@@ -103,9 +114,39 @@ class SessionLogger:
             "status": "failed",
             "error": error,
             "attempts": attempts,
-            "timestamp": datetime.now().isoformat()
+            # Raw time; formatted as ISO 8601 when the log is written
+            "timestamp": time.time()
         }
+        self._add(result)
+
+    def add_results(self, results: List[Dict[str, Any]]):
+        """
+        Add results logged elsewhere, e.g. by a worker process's logger.
+
+        Args:
+            results: Entries as returned by take_results()
+        """
+        for result in results:
+            self._add(result)
+
+    def take_results(self) -> List[Dict[str, Any]]:
+        """
+        Return the results logged so far and start a fresh list.
+
+        Returns:
+            The logged result entries
+        """
+        results = self.results
+        self.results = []
+        self._stats = dict.fromkeys(self._stats, 0)
+        return results
+
+    def _add(self, result: Dict[str, Any]):
+        """Record one result entry and count it."""
         self.results.append(result)
+        status = result.get("status")
+        if status in self._stats:
+            self._stats[status] += 1
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -114,19 +155,19 @@ class SessionLogger:
         Returns:
             Dictionary with counts by status
         """
-        stats = {"success": 0, "skipped": 0, "failed": 0}
-        for result in self.results:
-            status = result.get("status")
-            if status in stats:
-                stats[status] += 1
-        return stats
+        return self._stats.copy()
 
-    def close(self):
-        """Finalize and write log file."""
+    def _build_payload(self) -> Dict[str, Any]:
+        """
+        Build the log file contents, with the session ending now.
+
+        Returns:
+            Dictionary with session metadata and the logged results
+        """
         end_time = datetime.now()
         stats = self.get_stats()
 
-        log_data = {
+        return {
             "session": {
                 "start_time": self.start_time.isoformat(),
                 "end_time": end_time.isoformat(),
@@ -137,12 +178,23 @@ class SessionLogger:
                 "failed": stats["failed"],
                 "settings": self.settings
             },
-            "results": self.results
+            "results": [
+                {**result, "timestamp": datetime.fromtimestamp(result["timestamp"]).isoformat()}
+                for result in self.results
+            ]
         }
 
-        # Write JSON file with nice formatting
-        with open(self.log_path, 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
+    def close(self):
+        """Finalize and write log file."""
+        log_data = self._build_payload()
+
+        # Encode the whole log first and write it in one go, with nice formatting
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(log_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(log_data, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(self.log_path, 'wb') as f:
+            f.write(data)
 
     def __enter__(self):
         """Context manager entry."""
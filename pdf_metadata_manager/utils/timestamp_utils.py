@@ -5,19 +5,34 @@ This module provides utilities for preserving file timestamps across different
 platforms (macOS, Linux, Windows).
 """
 
+import math
 import os
 import platform
+import shutil
 import subprocess
 import time
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+# The platform can't change while we run, so detect macOS once
+_IS_DARWIN = platform.system() == 'Darwin'
 
-def get_timestamps(file_path: str) -> Dict[str, float]:
+# Date format expected by SetFile -d: MM/DD/YYYY HH:MM:SS
+_SETFILE_DATE_FORMAT = "%m/%d/%Y %H:%M:%S"
+
+# setattrlist(2) constants from <sys/attr.h>
+_ATTR_BIT_MAP_COUNT = 5
+_ATTR_CMN_CRTIME = 0x00000200
+
+
+def get_timestamps(file_path: Union[str, int]) -> Dict[str, float]:
     """
     Get all timestamps for a file.
 
     Args:
-        file_path: Path to the file
+        file_path: Path to the file, or a file descriptor of an open file
+            (which saves resolving the path again)
 
     Returns:
         Dict with 'mtime', 'atime', 'ctime' keys containing timestamp values
@@ -25,10 +40,24 @@ def get_timestamps(file_path: str) -> Dict[str, float]:
     Raises:
         FileNotFoundError: If the file doesn't exist
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    try:
+        stat_info = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    return _timestamps_from_stat(stat_info)
+
+
+def _timestamps_from_stat(stat_info: os.stat_result) -> Dict[str, float]:
+    """
+    Build a timestamps dict from an existing stat result.
 
-    stat_info = os.stat(file_path)
+    Args:
+        stat_info: Result of os.stat() for the file
+
+    Returns:
+        Dict with 'mtime', 'atime', 'ctime' (and on macOS 'birthtime') keys
+    """
     timestamps = {
         'mtime': stat_info.st_mtime,
         'atime': stat_info.st_atime,
@@ -36,7 +65,7 @@ def get_timestamps(file_path: str) -> Dict[str, float]:
     }
 
     # On macOS, try to get birthtime if available
-    if platform.system() == 'Darwin' and hasattr(stat_info, 'st_birthtime'):
+    if _IS_DARWIN and hasattr(stat_info, 'st_birthtime'):
         timestamps['birthtime'] = stat_info.st_birthtime
 
     return timestamps
@@ -53,18 +82,51 @@ def set_timestamps(file_path: str, timestamps: Dict[str, float]) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    if not os.path.exists(file_path):
+    try:
+        stat_info = os.stat(file_path)
+    except FileNotFoundError:
         print(f"Warning: File not found: {file_path}")
         return False
+    except OSError as e:
+        print(f"Warning: Could not set all timestamps: {e}")
+        return False
+
+    return _apply_timestamps(file_path, stat_info, timestamps)
 
+
+def _apply_timestamps(
+    file_path: str,
+    stat_info: os.stat_result,
+    timestamps: Dict[str, float],
+    times_ns: Optional[Tuple[int, int]] = None
+) -> bool:
+    """
+    Set timestamps on a file whose current stat result is already known.
+
+    Args:
+        file_path: File to update
+        stat_info: Current os.stat() result for file_path
+        timestamps: Dict with 'mtime', 'atime', and optionally 'ctime'/'birthtime' keys
+        times_ns: Exact (atime, mtime) in nanoseconds, used instead of the
+            float 'atime' and 'mtime' values when given
+
+    Returns:
+        True if successful, False otherwise
+    """
     try:
-        # Set modification and access time (works on all platforms)
-        atime = timestamps.get('atime', time.time())
-        mtime = timestamps.get('mtime', time.time())
-        os.utime(file_path, (atime, mtime))
+        # Set modification and access time (works on all platforms),
+        # skipping the utime call if the file already has these times
+        if times_ns is not None:
+            if (stat_info.st_atime_ns, stat_info.st_mtime_ns) != times_ns:
+                os.utime(file_path, ns=times_ns)
+        else:
+            atime = timestamps.get('atime', time.time())
+            mtime = timestamps.get('mtime', time.time())
+            if (stat_info.st_atime, stat_info.st_mtime) != (atime, mtime):
+                os.utime(file_path, (atime, mtime))
 
         # For macOS, try to preserve creation time using SetFile
-        if platform.system() == 'Darwin':
+        if _IS_DARWIN:
             # Try birthtime first, fallback to ctime
             creation_time = timestamps.get('birthtime') or timestamps.get('ctime')
             if creation_time:
@@ -96,32 +158,169 @@ def preserve_timestamps(target_path: str, source_path: str) -> bool:
         True
     """
     try:
-        if not os.path.exists(source_path):
+        # Stat each file exactly once and reuse the results
+        try:
+            source_stat = os.stat(source_path)
+        except FileNotFoundError:
             print(f"Warning: Source file not found: {source_path}")
             return False
 
-        if not os.path.exists(target_path):
+        try:
+            target_stat = os.stat(target_path)
+        except FileNotFoundError:
             print(f"Warning: Target file not found: {target_path}")
             return False
 
-        # Get timestamps from source
-        timestamps = get_timestamps(source_path)
-
-        # Apply timestamps to target
-        return set_timestamps(target_path, timestamps)
+        # Apply the source's timestamps to the target, to the nanosecond
+        return _apply_timestamps(
+            target_path,
+            target_stat,
+            _timestamps_from_stat(source_stat),
+            times_ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns)
+        )
 
     except Exception as e:
         print(f"Warning: Could not preserve timestamps: {e}")
         return False
 
 
+def preserve_timestamps_batch(
+    pairs: Iterable[Tuple[str, str]],
+    max_workers: Optional[int] = None
+) -> List[bool]:
+    """
+    Preserve timestamps for several (target, source) pairs in parallel.
+
+    stat and utime block on the filesystem rather than the CPU, so a thread
+    pool hides most of their latency on network-mounted directories.
+
+    Args:
+        pairs: (target_path, source_path) tuples, as for preserve_timestamps
+        max_workers: Number of threads (default: ThreadPoolExecutor's default)
+
+    Returns:
+        List of preserve_timestamps results, in the same order as pairs
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda pair: preserve_timestamps(*pair), pairs))
+
+
+@lru_cache(maxsize=1)
+def _attr_structs():
+    """
+    Define the ctypes structures used with setattrlist(2).
+
+    ctypes is imported here rather than at module level, since only macOS
+    needs it and this module is imported at package startup.
+
+    Returns:
+        Tuple of the (struct attrlist, struct timespec) ctypes types
+    """
+    import ctypes
+
+    class AttrList(ctypes.Structure):
+        """struct attrlist from <sys/attr.h>."""
+        _fields_ = [
+            ("bitmapcount", ctypes.c_ushort),
+            ("reserved", ctypes.c_uint16),
+            ("commonattr", ctypes.c_uint32),
+            ("volattr", ctypes.c_uint32),
+            ("dirattr", ctypes.c_uint32),
+            ("fileattr", ctypes.c_uint32),
+            ("forkattr", ctypes.c_uint32),
+        ]
+
+    class Timespec(ctypes.Structure):
+        """struct timespec from <time.h>."""
+        _fields_ = [
+            ("tv_sec", ctypes.c_long),
+            ("tv_nsec", ctypes.c_long),
+        ]
+
+    return AttrList, Timespec
+
+
+@lru_cache(maxsize=1)
+def _setattrlist():
+    """
+    Load setattrlist(2) from the C library, only once per process.
+
+    Returns:
+        The setattrlist function, or None if not on macOS or unavailable
+    """
+    if not _IS_DARWIN:
+        return None
+
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        setattrlist = libc.setattrlist
+    except (OSError, AttributeError):
+        return None
+
+    attr_list, timespec = _attr_structs()
+    setattrlist.argtypes = [
+        ctypes.c_char_p,
+        ctypes.POINTER(attr_list),
+        ctypes.POINTER(timespec),
+        ctypes.c_size_t,
+        ctypes.c_ulong,
+    ]
+    setattrlist.restype = ctypes.c_int
+    return setattrlist
+
+
+def _set_creation_date_setattrlist(file_path: str, creation_time: float) -> bool:
+    """
+    Set file creation date on macOS with setattrlist(2), without a subprocess.
+
+    Args:
+        file_path: Path to the file
+        creation_time: Unix timestamp for creation time
+
+    Returns:
+        True if successful, False if setattrlist is unavailable or failed
+    """
+    setattrlist = _setattrlist()
+    if setattrlist is None:
+        return False
+
+    import ctypes
+    attr_list, timespec_type = _attr_structs()
+
+    attrs = attr_list(bitmapcount=_ATTR_BIT_MAP_COUNT, commonattr=_ATTR_CMN_CRTIME)
+    seconds = math.floor(creation_time)
+    timespec = timespec_type(seconds, int((creation_time - seconds) * 1e9))
+    result = setattrlist(
+        os.fsencode(file_path),
+        ctypes.byref(attrs),
+        ctypes.byref(timespec),
+        ctypes.sizeof(timespec),
+        0
+    )
+    return result == 0
+
+
+@lru_cache(maxsize=1)
+def _setfile_path() -> Optional[str]:
+    """
+    Locate the SetFile command, looking it up only once per process.
+
+    Returns:
+        Full path to SetFile, or None if it is not installed
+    """
+    return shutil.which("SetFile")
+
+
 def _set_creation_date_macos(file_path: str, creation_time: float) -> bool:
     """
-    Set file creation date on macOS using SetFile command.
+    Set file creation date on macOS.
 
-    This is a macOS-specific function that uses the SetFile command from
-    Apple's Command Line Tools. If SetFile is not available, it will fail
-    gracefully with a warning.
+    This is a macOS-specific function. It calls setattrlist(2) directly, and
+    falls back to the SetFile command from Apple's Command Line Tools if
+    that fails. If SetFile is not available either, it will fail gracefully
+    with a warning.
 
     Args:
         file_path: Path to the file
@@ -130,26 +329,29 @@ def _set_creation_date_macos(file_path: str, creation_time: float) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    try:
+        # Try setattrlist first, which avoids starting a process
+        if _set_creation_date_setattrlist(file_path, creation_time):
+            return True
+    except Exception:
+        pass  # Fall back to SetFile
+
     try:
         # Check if SetFile is available
-        result = subprocess.run(
-            ["which", "SetFile"],
-            capture_output=True,
-            text=True
-        )
+        setfile = _setfile_path()
 
-        if result.returncode != 0:
+        if setfile is None:
             # SetFile not available, warn but don't fail
             print("  Note: SetFile not available. Creation time not preserved.")
             print("  Install Xcode Command Line Tools for full timestamp preservation.")
             return False
 
-        # Convert Unix timestamp to format required by SetFile: MM/DD/YYYY HH:MM:SS
-        date_str = time.strftime("%m/%d/%Y %H:%M:%S", time.localtime(creation_time))
+        # Convert Unix timestamp to the format required by SetFile
+        date_str = time.strftime(_SETFILE_DATE_FORMAT, time.localtime(creation_time))
 
         # Run SetFile command
         result = subprocess.run(
-            ["SetFile", "-d", date_str, file_path],
+            [setfile, "-d", date_str, file_path],
             capture_output=True,
             text=True,
             check=True